@@ -1,12 +1,41 @@
+from django.conf import settings
 from django.contrib.admin import AdminSite as BaseAdminSite
 from django.contrib.auth.forms import AuthenticationForm
-from django.http import HttpRequest
+from django.http import HttpRequest, HttpResponse
+from django.template.response import TemplateResponse
+from django.urls import URLPattern, URLResolver, path
+
+from .utils.cache import cache_stats
+from .utils.instrumentation import HISTOGRAM_BOUNDS_MS, route_stats
 
 
 class AdminSite(BaseAdminSite):
     site_header = "Autojob administration"
     site_title = "Autojob admin"
 
+    def get_urls(self) -> list[URLPattern | URLResolver]:
+        return [
+            path(
+                "instrumentation/",
+                self.admin_view(self.instrumentation_view),
+                name="instrumentation",
+            ),
+            *super().get_urls(),
+        ]
+
+    def instrumentation_view(self, request: HttpRequest) -> HttpResponse:
+        if request.method == "POST":
+            route_stats.clear()
+            cache_stats.clear()
+        context = self.each_context(request) | {
+            "title": "Request instrumentation",
+            "sample_rate": settings.INSTRUMENTATION_SAMPLE_RATE,
+            "bounds": HISTOGRAM_BOUNDS_MS,
+            "routes": route_stats.summary(),
+            "caches": cache_stats.summary(),
+        }
+        return TemplateResponse(request, "admin/instrumentation.html", context)
+
 
 class PersonalAdminSite(BaseAdminSite):
     site_header = "Autojob"
@@ -1,13 +1,26 @@
+from collections.abc import Callable, Iterable
 from typing import Any
 
+from django.db.models import QuerySet
+from rest_framework.reverse import reverse
 from rest_framework.serializers import (
     BooleanField,
     CharField,
+    DateTimeField,
+    Field,
+    FloatField,
     HyperlinkedModelSerializer,
     HyperlinkedRelatedField,
     IntegerField,
+    JSONField,
+    ListField,
+    ModelSerializer,
+    Serializer,
+    URLField,
+    ValidationError,
 )
 
+from ..main.changes import InvalidPosition, Position, decode_position
 from ..main.models import Application, Company, Posting, User
 
 
@@ -96,3 +109,198 @@ class ApplicationSerializer(HyperlinkedModelSerializer):
     def create(self, validated_data: dict[str, Any]) -> Application:
         validated_data["user"] = self.context["request"].user
         return super().create(validated_data)  # type: ignore
+
+
+class CompanyMatchSerializer(HyperlinkedModelSerializer):
+    score = FloatField(read_only=True)
+
+    class Meta:
+        model = Company
+        fields = ["pk", "link", "name", "score"]
+
+
+class PostingMatchSerializer(HyperlinkedModelSerializer):
+    company_name = CharField(source="company.name", read_only=True)
+    score = FloatField(read_only=True)
+
+    class Meta:
+        model = Posting
+        fields = ["pk", "link", "company", "company_name", "title", "score"]
+
+
+class SearchQuerySerializer(Serializer):
+    q = CharField(required=False, allow_blank=True, default="")
+    limit = IntegerField(required=False, min_value=1, max_value=50, default=10)
+
+
+class SearchSerializer(Serializer):
+    companies = CompanyMatchSerializer(many=True, read_only=True)
+    postings = PostingMatchSerializer(many=True, read_only=True)
+
+
+class ChangesQuerySerializer(Serializer):
+    since = CharField(
+        required=False,
+        help_text="Cursor from the previous response, or a timestamp",
+    )
+    limit = IntegerField(
+        required=False, min_value=1, max_value=1000, default=100
+    )
+
+    def validate_since(self, value: str) -> Position:
+        try:
+            return decode_position(value)
+        except InvalidPosition:
+            raise ValidationError("Invalid cursor or timestamp")
+
+
+class ChangeSerializer(Serializer):
+    model = CharField()
+    pk = IntegerField()
+    modified = DateTimeField()
+    deleted = BooleanField()
+    data = JSONField(allow_null=True)  # type: ignore
+
+
+class ChangesSerializer(Serializer):
+    changes = ChangeSerializer(many=True)
+    cursor = CharField(allow_null=True)
+    more = BooleanField()
+
+
+class NotificationsQuerySerializer(Serializer):
+    after = IntegerField(
+        required=False,
+        min_value=0,
+        help_text="last_id from the previous response",
+    )
+    timeout = FloatField(required=False, min_value=0, max_value=30, default=25)
+
+
+class EventSerializer(Serializer):
+    id = IntegerField()
+    name = CharField()
+    data = JSONField()  # type: ignore
+
+
+class NotificationsSerializer(Serializer):
+    events = EventSerializer(many=True)
+    last_id = IntegerField()
+
+
+class PostingBulkItemSerializer(ModelSerializer):
+    company = CharField(required=False, help_text="Company name or URL")
+    job_board_urls = ListField(
+        child=URLField(max_length=2048), required=False, allow_null=True
+    )
+
+    class Meta:
+        model = Posting
+        fields = [
+            "company",
+            "url",
+            "job_board_urls",
+            "title",
+            "closed",
+            "closed_note",
+            "in_wa",
+            "location",
+            "wa_jurisdiction",
+            "notes",
+        ]
+        extra_kwargs = {
+            "url": {"validators": []},
+            "in_wa": {"required": False},
+        }
+
+
+class ApplicationBulkItemSerializer(ModelSerializer):
+    posting = IntegerField(required=False)
+    posting_url = URLField(max_length=2048, required=False)
+
+    class Meta:
+        model = Application
+        fields = [
+            "posting",
+            "posting_url",
+            "bona_fide",
+            "applied",
+            "reported",
+            "notes",
+        ]
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        if ("posting" in attrs) == ("posting_url" in attrs):
+            raise ValidationError("Give one of posting or posting_url")
+        return attrs
+
+
+class BulkResultSerializer(Serializer):
+    status = CharField()
+    pk = IntegerField(allow_null=True)
+    errors = JSONField(allow_null=True)  # type: ignore
+
+
+class BulkResultsSerializer(Serializer):
+    results = BulkResultSerializer(many=True)
+
+
+# Values already in JSON form are passed through untouched
+PLAIN_FIELDS = (BooleanField, CharField, FloatField, IntegerField)
+LINK_PLACEHOLDER = "__pk__"
+
+
+def link_formatter(field: HyperlinkedRelatedField, request: Any) -> Any:
+    prefix, suffix = reverse(
+        field.view_name,  # type: ignore
+        kwargs={field.lookup_url_kwarg: LINK_PLACEHOLDER},
+        request=request,
+    ).split(LINK_PLACEHOLDER)
+    return lambda pk: f"{prefix}{pk}{suffix}"
+
+
+# Renders the same output as a model serializer's list from .values()
+# rows, one query with the joins its sources need and no model instances.
+# Links are formatted from one reverse() per field instead of one per row.
+class ValuesSerializer:
+    def __init__(self, serializer: Serializer, fields: list[str] | None):
+        available = serializer.fields
+        if fields is None:
+            fields = list(available)
+        elif unknown := [f for f in fields if f not in available]:
+            raise ValidationError(
+                {"fields": [f"Unknown field: {f}" for f in unknown]}
+            )
+        request = serializer.context.get("request")
+        self.columns: list[tuple[str, str, Callable[[Any], Any] | None]] = []
+        for name in fields:
+            field: Field = available[name]
+            lookup = "pk" if field.source == "*" else str(field.source)
+            convert = None
+            if isinstance(field, HyperlinkedRelatedField):
+                convert = link_formatter(field, request)
+            elif not isinstance(field, PLAIN_FIELDS):
+                convert = field.to_representation
+            self.columns.append((name, lookup.replace(".", "__"), convert))
+
+    def fetch(self, queryset: QuerySet) -> list[dict[str, Any]]:
+        lookups = {lookup for _, lookup, _ in self.columns}
+        # Keep annotations such as keyset pagination keys
+        lookups.update(queryset.query.annotations)
+        return list(queryset.values(*lookups))
+
+    def to_representation(
+        self, rows: Iterable[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        data = []
+        for row in rows:
+            item = {}
+            for name, lookup, convert in self.columns:
+                value = row[lookup]
+                item[name] = (
+                    value
+                    if convert is None or value is None
+                    else convert(value)
+                )
+            data.append(item)
+        return data
@@ -35,6 +35,13 @@ urlpatterns = [
         ),
         name="api-me",
     ),
+    path("search", views.SearchView.as_view(), name="api-search"),
+    path("changes", views.ChangesView.as_view(), name="api-changes"),
+    path(
+        "notifications",
+        views.NotificationsView.as_view(),
+        name="api-notifications",
+    ),
     path("schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
         "swagger/",
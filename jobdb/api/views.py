@@ -1,14 +1,17 @@
+from functools import cached_property
 from typing import Any
 
 from django.db.models import QuerySet
-from django.http.response import Http404
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend  # type: ignore
 from drf_link_header_pagination import (  # type: ignore
     LinkHeaderLimitOffsetPagination,
 )
 from drf_problems.exceptions import exception_handler  # type: ignore
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.generics import GenericAPIView
 from rest_framework.mixins import (
     ListModelMixin,
@@ -16,15 +19,31 @@ from rest_framework.mixins import (
     UpdateModelMixin,
 )
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import Serializer
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.views import APIView as BaseAPIView
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
-from ..main.models import Application, Posting, User
+from ..main.bulk import ItemResult, upsert_applications, upsert_postings
+from ..main.changes import Change, encode_position, read_changes
+from ..main.conditional import get_validators, not_modified, set_validators
+from ..main.fuzzy import match_companies, match_titles, with_scores
+from ..main.models import Application, Company, Posting, User
+from ..main.notifications import user_channel
+from ..main.pagination import (
+    CountMode,
+    InvalidCursor,
+    Keyset,
+    count_rows,
+)
 from ..main.query import (
-    companies_with_counts,
     company_posting_queue_set,
     posting_queue_set,
 )
+from ..utils.broker import get_broker
+from ..utils.cache import DATA_SCOPES, user_scopes
 from . import serializers
 from .auth import APIKeyAuthentication
 from .filters import ApplicationFilter, CompanyFilter, PostingFilter
@@ -33,6 +52,105 @@ from .filters import ApplicationFilter, CompanyFilter, PostingFilter
 class APIPagination(LinkHeaderLimitOffsetPagination):
     default_limit = 10
     max_limit = 1000
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    count_header = "X-Total-Count"
+    invalid_cursor_message = "Invalid cursor"
+    template = "rest_framework/pagination/previous_and_next.html"
+    limit: int
+    count: int | None
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> Any:
+        self.request = request
+        self.keyset = Keyset(queryset)
+        self.cursor = request.query_params.get(self.cursor_query_param)
+        self.limit = self.get_limit(request)
+        self.count = None
+        fetch = getattr(view, "fetch_page", list)
+        if request.query_params.get(self.count_query_param) in ("1", "true"):
+            self.count = count_rows(
+                queryset, getattr(view, "count_mode", "exact")
+            )
+        if self.cursor is not None:
+            try:
+                self.records, self.has_next, self.has_previous = (
+                    self.keyset.page(self.cursor, self.limit, fetch)
+                )
+            except InvalidCursor:
+                raise NotFound(self.invalid_cursor_message)
+            return self.records
+        self.offset = self.get_offset(request)
+        bottom, top = self.offset, self.offset + self.limit + 1
+        records = fetch(self.keyset.queryset[bottom:top])
+        self.has_next = len(records) > self.limit
+        self.has_previous = self.offset > 0
+        self.records = records[: self.limit]
+        return self.records
+
+    def get_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = super().get_headers()
+        if self.count is not None:
+            headers[self.count_header] = str(self.count)
+        return headers
+
+    def get_html_context(self) -> dict[str, Any]:
+        return {
+            "previous_url": self.get_previous_link(),
+            "next_url": self.get_next_link(),
+        }
+
+    def get_schema_operation_parameters(self, view: Any) -> list[Any]:
+        parameters: list[Any] = super().get_schema_operation_parameters(view)
+        return parameters + [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    f"Return the total number of results in the"
+                    f" {self.count_header} header."
+                ),
+                "schema": {"type": "boolean"},
+            },
+        ]
+
+    def get_cursor_link(self, record: Any, reverse: bool = False) -> str:
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        url = remove_query_param(url, self.offset_query_param)
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            self.keyset.cursor(record, reverse=reverse),
+        )
+
+    def get_next_link(self) -> str | None:
+        if not self.records or not self.has_next:
+            return None
+        return self.get_cursor_link(self.records[-1])
+
+    def get_previous_link(self) -> str | None:
+        if not self.records or not self.has_previous:
+            return None
+        return self.get_cursor_link(self.records[0], reverse=True)
+
+    def get_first_link(self) -> str:
+        url = super().get_first_link()
+        return remove_query_param(url, self.cursor_query_param)
+
+    def get_last_link(self) -> Any:
+        if self.cursor is not None or self.count is None:
+            return None
+        return super().get_last_link()
 
 
 class APIView(GenericAPIView, BaseAPIView):
@@ -40,12 +158,103 @@ class APIView(GenericAPIView, BaseAPIView):
     authentication_classes = [SessionAuthentication, APIKeyAuthentication]
 
 
-class APIViewSet(APIView, GenericViewSet):
+class ExceptionHandlerMixin:
+    def get_exception_handler(self) -> Any:
+        return exception_handler
+
+
+class APIViewSet(ExceptionHandlerMixin, APIView, GenericViewSet):
     filter_backends = [DjangoFilterBackend]
     pagination_class = APIPagination
 
-    def get_exception_handler(self) -> Any:
-        return exception_handler
+
+class ValuesListMixin:
+    fields_query_param = "fields"
+    user_cache = False
+    last_modified_fields: list[str] | None = None
+
+    def get_cache_scopes(self) -> list[str]:
+        if self.user_cache:
+            return user_scopes(self.request.user.pk)  # type: ignore
+        return DATA_SCOPES
+
+    @cached_property
+    def values_serializer(self) -> serializers.ValuesSerializer:
+        fields = self.request.query_params.get(  # type: ignore
+            self.fields_query_param
+        )
+        return serializers.ValuesSerializer(
+            self.get_serializer(),  # type: ignore
+            fields.split(",") if fields else None,
+        )
+
+    def fetch_page(self, queryset: QuerySet) -> list[dict[str, Any]]:
+        return self.values_serializer.fetch(queryset)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "fields",
+                str,
+                description="Comma-separated list of fields to return.",
+            )
+        ]
+    )
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        values = self.values_serializer
+        queryset = self.filter_queryset(self.get_queryset())  # type: ignore
+        validators = get_validators(
+            request,
+            self.get_cache_scopes(),
+            queryset,
+            self.last_modified_fields,
+        )
+        if unchanged := not_modified(request, validators):
+            return unchanged  # type: ignore
+        page = self.paginate_queryset(queryset)  # type: ignore
+        response: Response = self.get_paginated_response(  # type: ignore
+            values.to_representation(page)
+        )
+        set_validators(response, validators)
+        return response
+
+
+class BulkUpsertMixin:
+    bulk_item_serializer_class: type[Serializer]
+    bulk_max_items = 1000
+
+    def bulk_upsert(self, items: list[dict[str, Any]]) -> list[ItemResult]:
+        raise NotImplementedError
+
+    def get_serializer_class(self) -> Any:
+        if getattr(self, "action", None) == "bulk":
+            return self.bulk_item_serializer_class
+        return super().get_serializer_class()  # type: ignore
+
+    @extend_schema(responses=serializers.BulkResultsSerializer)
+    @action(detail=False, methods=["post"])
+    def bulk(self, request: Request) -> Response:
+        if not isinstance(request.data, list):
+            raise ValidationError("Expected a list of items")
+        if len(request.data) > self.bulk_max_items:
+            raise ValidationError(
+                f"At most {self.bulk_max_items} items per request"
+            )
+        results: list[ItemResult | None] = []
+        valid = []
+        for item in request.data:
+            serializer = self.bulk_item_serializer_class(data=item)
+            if serializer.is_valid():
+                results.append(None)
+                valid.append(serializer.validated_data)
+            else:
+                results.append(ItemResult("error", errors=serializer.errors))
+        upserted = iter(self.bulk_upsert(valid))
+        return Response(
+            serializers.BulkResultsSerializer(
+                {"results": [r or next(upserted) for r in results]}
+            ).data
+        )
 
 
 class MeView(APIViewSet, RetrieveModelMixin, UpdateModelMixin):
@@ -58,11 +267,11 @@ class MeView(APIViewSet, RetrieveModelMixin, UpdateModelMixin):
 
 
 class BaseCompanyViewSet(APIViewSet):
-    queryset = companies_with_counts().order_by("name")
+    queryset = Company.objects.order_by("name")
     serializer_class = serializers.CompanySerializer
 
 
-class CompanyViewSet(BaseCompanyViewSet, ModelViewSet):
+class CompanyViewSet(ValuesListMixin, BaseCompanyViewSet, ModelViewSet):
     filterset_class = CompanyFilter
 
 
@@ -71,12 +280,21 @@ class CompanyByNameViewSet(BaseCompanyViewSet, RetrieveModelMixin):
 
 
 class BasePostingViewSet(APIViewSet):
-    queryset = Posting.objects.all().order_by("company__name", "title", "url")
+    queryset = Posting.objects.select_related("company").order_by(
+        "company__name", "title", "url"
+    )
     serializer_class = serializers.PostingSerializer
 
 
-class PostingViewSet(BasePostingViewSet, ModelViewSet):
+class PostingViewSet(
+    ValuesListMixin, BulkUpsertMixin, BasePostingViewSet, ModelViewSet
+):
     filterset_class = PostingFilter
+    bulk_item_serializer_class = serializers.PostingBulkItemSerializer
+    last_modified_fields = ["modified", "company__modified"]
+
+    def bulk_upsert(self, items: list[dict[str, Any]]) -> list[ItemResult]:
+        return upsert_postings(items)
 
 
 class PostingByURLViewSet(BasePostingViewSet, RetrieveModelMixin):
@@ -84,16 +302,21 @@ class PostingByURLViewSet(BasePostingViewSet, RetrieveModelMixin):
     lookup_value_regex = ".*"
 
     def get_object(self) -> Posting:
-        try:
-            return super().get_object()  # type: ignore
-        except Http404:
-            qs = self.get_queryset().by_url(self.kwargs["url"])  # type: ignore
-            return get_object_or_404(qs)  # type: ignore
+        queryset = self.filter_queryset(self.get_queryset())
+        posting = get_object_or_404(
+            queryset.by_url(self.kwargs["url"])  # type: ignore
+        )
+        self.check_object_permissions(self.request, posting)
+        return posting  # type: ignore
 
 
-class FullPostingQueueViewSet(BasePostingViewSet, ListModelMixin):
+class FullPostingQueueViewSet(
+    ValuesListMixin, BasePostingViewSet, ListModelMixin
+):
     filterset_class = PostingFilter
     serializer_class = serializers.PostingSerializer
+    count_mode: CountMode = "cached"
+    user_cache = True
 
     def get_queryset(self) -> QuerySet:
         assert isinstance(self.request.user, User)
@@ -107,7 +330,7 @@ class PostingQueueViewSet(FullPostingQueueViewSet):
 
 
 class BaseApplicationViewSet(APIViewSet):
-    queryset = Application.objects.all().order_by(
+    queryset = Application.objects.select_related("posting__company").order_by(
         "posting__company__name", "posting__title", "posting__url"
     )
     serializer_class = serializers.ApplicationSerializer
@@ -116,10 +339,129 @@ class BaseApplicationViewSet(APIViewSet):
         return super().get_queryset().filter(user=self.request.user)
 
 
-class ApplicationViewSet(BaseApplicationViewSet, ModelViewSet):
+class ApplicationViewSet(
+    ValuesListMixin, BulkUpsertMixin, BaseApplicationViewSet, ModelViewSet
+):
     filterset_class = ApplicationFilter
+    bulk_item_serializer_class = serializers.ApplicationBulkItemSerializer
+    user_cache = True
+    last_modified_fields = [
+        "modified",
+        "posting__modified",
+        "posting__company__modified",
+    ]
+
+    def bulk_upsert(self, items: list[dict[str, Any]]) -> list[ItemResult]:
+        assert isinstance(self.request.user, User)
+        return upsert_applications(self.request.user, items)
 
 
 class ApplicationByURLViewSet(BaseApplicationViewSet, RetrieveModelMixin):
     lookup_field = "posting__url"
     lookup_value_regex = ".*"
+
+
+class SearchView(ExceptionHandlerMixin, APIView):
+    serializer_class = serializers.SearchSerializer
+
+    @extend_schema(parameters=[serializers.SearchQuerySerializer])
+    def get(self, request: Request) -> Response:
+        params = serializers.SearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query, limit = (
+            params.validated_data["q"],
+            params.validated_data["limit"],
+        )
+        companies = with_scores(
+            Company.objects.only("name"), "pk", match_companies(query, limit)
+        )
+        postings = with_scores(
+            Posting.objects.select_related("company").only(
+                "company__name", "title"
+            ),
+            "title",
+            match_titles(query, limit),
+        )
+        results = {
+            "companies": companies.order_by("-score", "name"),
+            "postings": postings.order_by("-score", "company__name", "pk")[
+                :limit
+            ],
+        }
+        return Response(self.get_serializer(results).data)
+
+
+# Long-poll for the user's queue notifications. Each waiting request holds
+# a worker thread, so the wait is capped.
+class NotificationsView(ExceptionHandlerMixin, APIView):
+    serializer_class = serializers.NotificationsSerializer
+
+    @extend_schema(parameters=[serializers.NotificationsQuerySerializer])
+    def get(self, request: Request) -> Response:
+        assert isinstance(request.user, User)
+        params = serializers.NotificationsQuerySerializer(
+            data=request.query_params
+        )
+        params.is_valid(raise_exception=True)
+        events, last_id = get_broker().listen(
+            [user_channel(request.user.pk)],
+            params.validated_data.get("after"),
+            params.validated_data["timeout"],
+        )
+        return Response(
+            self.get_serializer({"events": events, "last_id": last_id}).data
+        )
+
+
+class ChangesView(ExceptionHandlerMixin, APIView):
+    serializer_class = serializers.ChangesSerializer
+    data_serializer_classes: dict[str, type[Serializer]] = {
+        "company": serializers.CompanySerializer,
+        "posting": serializers.PostingSerializer,
+        "application": serializers.ApplicationSerializer,
+    }
+
+    # Rows deleted since their change was read are reported as deleted
+    def get_change_data(
+        self, changes: list[Change]
+    ) -> dict[tuple[str, int], dict[str, Any]]:
+        data = {}
+        for name, serializer_class in self.data_serializer_classes.items():
+            pks = [c.pk for c in changes if c.model == name and not c.deleted]
+            if not pks:
+                continue
+            values = serializers.ValuesSerializer(
+                serializer_class(context=self.get_serializer_context()), None
+            )
+            model = serializer_class.Meta.model  # type: ignore
+            queryset = model.objects.filter(pk__in=pks)
+            for item in values.to_representation(values.fetch(queryset)):
+                data[name, item["pk"]] = item
+        return data
+
+    @extend_schema(parameters=[serializers.ChangesQuerySerializer])
+    def get(self, request: Request) -> Response:
+        assert isinstance(request.user, User)
+        params = serializers.ChangesQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        since = params.validated_data.get("since")
+        changes, more = read_changes(
+            request.user, since, params.validated_data["limit"]
+        )
+        data = self.get_change_data(changes)
+        position = changes[-1].position if changes else since
+        results = {
+            "changes": [
+                {
+                    "model": change.model,
+                    "pk": change.pk,
+                    "modified": change.position.time,
+                    "deleted": (change.model, change.pk) not in data,
+                    "data": data.get((change.model, change.pk)),
+                }
+                for change in changes
+            ],
+            "cursor": position and encode_position(position),
+            "more": more,
+        }
+        return Response(self.get_serializer(results).data)
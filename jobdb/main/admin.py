@@ -33,6 +33,7 @@ from .resources import (
     UserApplicationResource,
     UserResource,
 )
+from .signals import send_data_changed
 
 register_portal = partial(register, site=personal_admin_site)
 
@@ -179,21 +180,30 @@ class CompanyAdmin(ImportExportMixin, ExportActionMixin, ModelAdmin):
     def mark_priority_high(
         self, request: HttpRequest, queryset: QuerySet
     ) -> Any:
-        queryset.update(priority=Priority.HIGH)
+        queryset.update(priority=Priority.HIGH, modified=timezone.now())
+        send_data_changed(
+            Company, companies=queryset.values_list("pk", flat=True)
+        )
 
     @action(description="Mark selected companies as normal priority")
     @require_confirmation
     def mark_priority_normal(
         self, request: HttpRequest, queryset: QuerySet
     ) -> Any:
-        queryset.update(priority=Priority.NORMAL)
+        queryset.update(priority=Priority.NORMAL, modified=timezone.now())
+        send_data_changed(
+            Company, companies=queryset.values_list("pk", flat=True)
+        )
 
     @action(description="Mark selected companies as low priority")
     @require_confirmation
     def mark_priority_low(
         self, request: HttpRequest, queryset: QuerySet
     ) -> Any:
-        queryset.update(priority=Priority.LOW)
+        queryset.update(priority=Priority.LOW, modified=timezone.now())
+        send_data_changed(
+            Company, companies=queryset.values_list("pk", flat=True)
+        )
 
 
 class PostingClosedFilter(SimpleListFilter):
@@ -247,7 +257,10 @@ class PostingAdmin(ImportExportMixin, ExportActionMixin, ModelAdmin):
     @action(description="Mark selected postings as closed")
     @require_confirmation(queryset_filter=lambda qs: qs.filter(closed=None))
     def mark_closed(self, request: HttpRequest, queryset: QuerySet) -> Any:
-        queryset.update(closed=timezone.now())
+        companies = set(queryset.values_list("company", flat=True))
+        now = timezone.now()
+        queryset.update(closed=now, modified=now)
+        send_data_changed(Posting, companies=companies)
 
     @action(description="Create application entries for selected postings")
     @require_confirmation
@@ -316,7 +329,14 @@ class ApplicationAdminBase(ImportExportMixin, ExportActionMixin, ModelAdmin):
     @action(description="Mark selected applications as reported")
     @require_confirmation(queryset_filter=lambda qs: qs.filter(reported=None))
     def mark_reported(self, request: HttpRequest, queryset: QuerySet) -> Any:
-        queryset.update(reported=timezone.now())
+        rows = set(queryset.values_list("posting__company", "user"))
+        now = timezone.now()
+        queryset.update(reported=now, modified=now)
+        send_data_changed(
+            Application,
+            companies={company for company, _ in rows},
+            users={user for _, user in rows},
+        )
 
 
 @register_portal(Application)
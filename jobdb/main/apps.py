@@ -5,3 +5,6 @@ class AppConfig(BaseAppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "jobdb.main"
     label = "main"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import math
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+from .models import Application, Company, Posting, User
+
+URLCONFS = ["jobdb.main.urls", "jobdb.api.urls"]
+
+
+@dataclass
+class Samples:
+    user: User
+    company: Company
+    posting: Posting
+    application: Application
+
+    @classmethod
+    def for_user(cls, user: User) -> Samples:
+        application = (
+            Application.objects.filter(user=user)
+            .select_related("posting__company")
+            .order_by("pk")
+            .first()
+        )
+        if application is None:
+            raise ValueError(f"User {user} has no applications")
+        return cls(
+            user=user,
+            company=application.posting.company,
+            posting=application.posting,
+            application=application,
+        )
+
+
+ROUTE_KWARGS: dict[str, Callable[[Samples], dict[str, Any]]] = {
+    "company-detail": lambda s: {"pk": s.company.pk},
+    "company-by-name-detail": lambda s: {"name": s.company.name},
+    "posting-detail": lambda s: {"pk": s.posting.pk},
+    "posting-by-url-detail": lambda s: {"url": s.posting.url},
+    "application-detail": lambda s: {"pk": s.application.pk},
+    "application-by-url-detail": lambda s: {
+        "posting__url": s.application.posting.url
+    },
+}
+
+# Write-only and long-lived routes
+SKIP_ROUTES = {
+    "error-documentation",
+    "posting-bulk",
+    "application-bulk",
+    "api-notifications",
+    "notifications",
+}
+
+
+@dataclass
+class RouteResult:
+    path: str
+    status: int
+    queries: int
+    p50_ms: float
+    p95_ms: float
+    warm_queries: int
+    warm_p50_ms: float
+    warm_p95_ms: float
+    peak_kib: float
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def route_names() -> Iterator[str]:
+    def _walk(patterns: list[Any]) -> Iterator[str]:
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                yield from _walk(pattern.url_patterns)
+            elif isinstance(pattern, URLPattern) and pattern.name:
+                yield pattern.name
+
+    for urlconf in URLCONFS:
+        yield from dict.fromkeys(_walk(get_resolver(urlconf).url_patterns))
+
+
+def route_paths(samples: Samples) -> dict[str, str]:
+    paths = {}
+    for name in route_names():
+        if name in SKIP_ROUTES:
+            continue
+        kwargs = ROUTE_KWARGS[name](samples) if name in ROUTE_KWARGS else {}
+        paths[name] = reverse(name, kwargs=kwargs)
+    return paths
+
+
+def timed(
+    client: Client, path: str, repeat: int, cold: bool
+) -> tuple[int, list[float], int]:
+    timings = []
+    status = 0
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(repeat):
+            if cold:
+                # Drop the memoize and cached_query entries filled by the
+                # previous request so they are rebuilt inside the timing
+                cache.clear()
+            start = time.perf_counter()
+            status = client.get(path).status_code
+            timings.append((time.perf_counter() - start) * 1000)
+    return len(queries) // repeat, timings, status
+
+
+def measure(client: Client, path: str, repeat: int = 5) -> RouteResult:
+    # Warm up per-process state such as URL resolvers and templates
+    client.get(path)
+    cold_queries, cold_timings, status = timed(client, path, repeat, True)
+    warm_queries, warm_timings, _ = timed(client, path, repeat, False)
+    cache.clear()
+    tracemalloc.start()
+    try:
+        client.get(path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return RouteResult(
+        path=path,
+        status=status,
+        queries=cold_queries,
+        p50_ms=round(percentile(cold_timings, 0.5), 3),
+        p95_ms=round(percentile(cold_timings, 0.95), 3),
+        warm_queries=warm_queries,
+        warm_p50_ms=round(percentile(warm_timings, 0.5), 3),
+        warm_p95_ms=round(percentile(warm_timings, 0.95), 3),
+        peak_kib=round(peak / 1024, 1),
+    )
+
+
+def run(
+    user: User,
+    repeat: int = 5,
+    routes: list[str] | None = None,
+    log: Callable[[str], None] | None = None,
+) -> dict[str, dict[str, Any]]:
+    client = Client()
+    client.force_login(user)
+    results = {}
+    for name, path in route_paths(Samples.for_user(user)).items():
+        if routes and name not in routes:
+            continue
+        result = measure(client, path, repeat=repeat)
+        if log:
+            log(
+                f"{name}: cold {result.queries} queries,"
+                f" p50 {result.p50_ms} ms, p95 {result.p95_ms} ms;"
+                f" warm {result.warm_queries} queries,"
+                f" p50 {result.warm_p50_ms} ms, p95 {result.warm_p95_ms} ms;"
+                f" peak {result.peak_kib} KiB"
+            )
+        results[name] = asdict(result)
+    return results
+
+
+def compare(
+    baseline: dict[str, dict[str, Any]],
+    current: dict[str, dict[str, Any]],
+    threshold: float = 1.5,
+) -> list[str]:
+    regressions = []
+    for name, result in current.items():
+        if (before := baseline.get(name)) is None:
+            continue
+        # Baselines recorded before warm numbers were split out lack them
+        for key in ("queries", "warm_queries"):
+            if key in before and result[key] > before[key]:
+                regressions.append(
+                    f"{name}: {key} {before[key]} -> {result[key]}"
+                )
+        for key in (
+            "p50_ms",
+            "p95_ms",
+            "warm_p50_ms",
+            "warm_p95_ms",
+            "peak_kib",
+        ):
+            if before.get(key) and result[key] > before[key] * threshold:
+                regressions.append(
+                    f"{name}: {key} {before[key]} -> {result[key]}"
+                    f" ({result[key] / before[key]:.1f}x)"
+                )
+    return regressions
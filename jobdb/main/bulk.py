@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from .models import Application, Company, Posting, PostingURL, User
+from .signals import send_data_changed
+
+POSTING_FIELDS = [
+    "url",
+    "job_board_urls",
+    "title",
+    "closed",
+    "closed_note",
+    "in_wa",
+    "location",
+    "wa_jurisdiction",
+    "notes",
+]
+POSTING_CREATE_FIELDS = ["company", "url", "title", "in_wa", "location"]
+APPLICATION_FIELDS = ["bona_fide", "applied", "reported", "notes"]
+
+BATCH_SIZE = 500
+
+
+@dataclass
+class ItemResult:
+    status: str
+    pk: int | None = None
+    errors: dict[str, list[str]] | None = None
+
+
+def error(**errors: str) -> ItemResult:
+    return ItemResult(
+        "error", errors={field: [message] for field, message in errors.items()}
+    )
+
+
+def resolve_companies(refs: Iterable[str]) -> dict[str, int]:
+    refs = set(refs)
+    found: dict[str, int] = {}
+    for pk, name, url, careers_url in (
+        Company.objects.alias(lower_name=Lower("name"))
+        .filter(
+            Q(lower_name__in={ref.lower() for ref in refs})
+            | Q(url__in=refs)
+            | Q(careers_url__in=refs)
+        )
+        .values_list("pk", "name", "url", "careers_url")
+    ):
+        found |= {name.lower(): pk, url: pk, careers_url: pk}
+    return {
+        ref: pk
+        for ref in refs
+        if (pk := found.get(ref) or found.get(ref.lower())) is not None
+    }
+
+
+def apply_changes(instance: Any, values: dict[str, Any]) -> set[str]:
+    changed = {
+        field
+        for field, value in values.items()
+        if getattr(instance, field) != value
+    }
+    for field in changed:
+        setattr(instance, field, values[field])
+    return changed
+
+
+def save_changes(
+    model: Any,
+    created: list[Any],
+    updated: list[tuple[Any, set[str]]],
+) -> list[Any]:
+    model.objects.bulk_create(created, batch_size=BATCH_SIZE)
+    fields = set().union(*(changed for _, changed in updated))
+    if updated:
+        if hasattr(model, "modified"):
+            now = timezone.now()
+            for instance, _ in updated:
+                instance.modified = now
+            fields.add("modified")
+        model.objects.bulk_update(
+            [instance for instance, _ in updated],
+            fields,
+            batch_size=BATCH_SIZE,
+        )
+    return created + [instance for instance, _ in updated]
+
+
+# Postings are matched to existing ones by any of their URLs and updated
+# in place, or created. Items whose URLs repeat an earlier item or match
+# several postings are rejected.
+def upsert_postings(items: list[dict[str, Any]]) -> list[ItemResult]:
+    companies = resolve_companies(
+        item["company"] for item in items if "company" in item
+    )
+    item_urls = [
+        list(dict.fromkeys([item["url"], *(item.get("job_board_urls") or [])]))
+        for item in items
+    ]
+    matches = Posting.objects.by_urls(  # type: ignore
+        url for urls in item_urls for url in urls
+    )
+    results: list[ItemResult] = []
+    created: list[tuple[int, Posting]] = []
+    updated: list[tuple[Posting, set[str]]] = []
+    seen: dict[str, int] = {}
+    claimed: dict[int, int] = {}
+    affected_companies = set()
+    moved = False
+    for i, (item, urls) in enumerate(zip(items, item_urls)):
+        postings = {matches[url] for url in urls if url in matches}
+        values = {f: item[f] for f in POSTING_FIELDS if f in item}
+        if "job_board_urls" in values:
+            values["job_board_urls"] = values["job_board_urls"] or None
+        if "company" in item:
+            if item["company"] not in companies:
+                results.append(error(company="Unknown company"))
+                continue
+            values["company_id"] = companies[item["company"]]
+        duplicate = next((seen[url] for url in urls if url in seen), None)
+        if duplicate is not None:
+            results.append(error(url=f"Duplicates item {duplicate}"))
+            continue
+        if len(postings) > 1:
+            results.append(error(url="URLs match more than one posting"))
+            continue
+        posting = postings.pop() if postings else None
+        if posting and posting.pk in claimed:
+            results.append(error(url=f"Duplicates item {claimed[posting.pk]}"))
+            continue
+        if not posting and (
+            missing := [f for f in POSTING_CREATE_FIELDS if f not in item]
+        ):
+            results.append(
+                error(**{f: "This field is required." for f in missing})
+            )
+            continue
+        seen |= dict.fromkeys(urls, i)
+        if posting:
+            claimed[posting.pk] = i
+            affected_companies.add(posting.company_id)
+            # Matching a job board URL does not replace the main URL
+            if values["url"] in posting.all_urls:
+                del values["url"]
+            if changed := apply_changes(posting, values):
+                moved = moved or "company_id" in changed
+                updated.append((posting, changed))
+                results.append(ItemResult("updated", posting.pk))
+            else:
+                results.append(ItemResult("unchanged", posting.pk))
+        else:
+            posting = Posting(**values)
+            created.append((i, posting))
+            results.append(ItemResult("created"))
+        affected_companies.add(posting.company_id)
+    with transaction.atomic():
+        saved = save_changes(Posting, [p for _, p in created], updated)
+        PostingURL.objects.sync(saved)  # type: ignore
+        if saved:
+            send_data_changed(
+                Posting, companies=affected_companies, moved=moved
+            )
+    for i, posting in created:
+        results[i].pk = posting.pk
+    return results
+
+
+# Applications are matched to the user's existing application for the
+# same posting, given by primary key or by any of its URLs
+def upsert_applications(
+    user: User, items: list[dict[str, Any]]
+) -> list[ItemResult]:
+    by_url = Posting.objects.by_urls(  # type: ignore
+        item["posting_url"] for item in items if "posting_url" in item
+    )
+    by_pk = Posting.objects.in_bulk(
+        [item["posting"] for item in items if "posting" in item]
+    )
+    postings = [
+        (
+            by_pk.get(item["posting"])
+            if "posting" in item
+            else by_url.get(item["posting_url"])
+        )
+        for item in items
+    ]
+    existing = {
+        application.posting_id: application  # type: ignore
+        for application in Application.objects.filter(
+            user=user, posting__in={p.pk for p in postings if p}
+        )
+    }
+    results: list[ItemResult] = []
+    created: list[tuple[int, Application]] = []
+    updated: list[tuple[Application, set[str]]] = []
+    seen: dict[int, int] = {}
+    affected_companies = set()
+    for i, (item, posting) in enumerate(zip(items, postings)):
+        if posting is None:
+            results.append(error(posting="Unknown posting"))
+            continue
+        if (duplicate := seen.get(posting.pk)) is not None:
+            results.append(error(posting=f"Duplicates item {duplicate}"))
+            continue
+        seen[posting.pk] = i
+        affected_companies.add(posting.company_id)
+        values = {f: item[f] for f in APPLICATION_FIELDS if f in item}
+        if application := existing.get(posting.pk):
+            if changed := apply_changes(application, values):
+                updated.append((application, changed))
+                results.append(ItemResult("updated", application.pk))
+            else:
+                results.append(ItemResult("unchanged", application.pk))
+        else:
+            application = Application(user=user, posting=posting, **values)
+            created.append((i, application))
+            results.append(ItemResult("created"))
+    with transaction.atomic():
+        saved = save_changes(Application, [a for _, a in created], updated)
+        if saved:
+            send_data_changed(
+                Application, companies=affected_companies, users=[user.pk]
+            )
+    for i, application in created:
+        results[i].pk = application.pk
+    return results
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import base64
+import heapq
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import NamedTuple
+
+from django.db.models import Model, Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Application, Company, Posting, Tombstone, User
+
+# Changes are read in (time, source, key) order across the models and the
+# tombstone log, and cursors hold the position of the last change read.
+# Rows saved in the last few seconds are held back so a transaction that
+# commits late does not land behind a cursor that has moved on.
+CHANGE_MODELS: list[type[Model]] = [Company, Posting, Application]
+TOMBSTONES = len(CHANGE_MODELS)
+CHANGES_LAG = timedelta(seconds=5)
+
+
+class InvalidPosition(Exception):
+    pass
+
+
+class Position(NamedTuple):
+    time: datetime
+    source: int
+    key: int
+
+
+@dataclass
+class Change:
+    position: Position
+    model: str
+    pk: int
+    deleted: bool = False
+
+
+def encode_position(position: Position) -> str:
+    data = [position.time.isoformat(), position.source, position.key]
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+# A timestamp is placed before every change made at that time
+def decode_position(value: str) -> Position:
+    try:
+        if (time := parse_datetime(value)) is not None:
+            if timezone.is_naive(time):
+                time = time.replace(tzinfo=dt_timezone.utc)
+            return Position(time, -1, 0)
+        data = json.loads(base64.urlsafe_b64decode(value.encode()))
+        return Position(
+            datetime.fromisoformat(data[0]), int(data[1]), int(data[2])
+        )
+    except (ValueError, TypeError, KeyError, IndexError) as e:
+        raise InvalidPosition(value) from e
+
+
+def change_sources(user: User) -> list[tuple[QuerySet, str]]:
+    return [
+        (Company.objects.all(), "modified"),
+        (Posting.objects.all(), "modified"),
+        (Application.objects.filter(user=user), "modified"),
+        (
+            Tombstone.objects.filter(Q(user=None) | Q(user=user)),
+            "deleted",
+        ),
+    ]
+
+
+def after(position: Position | None, source: int, field: str) -> Q:
+    if position is None:
+        return Q()
+    condition = Q(**{f"{field}__gt": position.time})
+    if source > position.source:
+        condition |= Q(**{field: position.time})
+    elif source == position.source:
+        condition |= Q(**{field: position.time, "pk__gt": position.key})
+    return condition
+
+
+def read_source(
+    source: int,
+    queryset: QuerySet,
+    field: str,
+    since: Position | None,
+    until: datetime,
+    limit: int,
+) -> list[Change]:
+    queryset = queryset.filter(
+        after(since, source, field), **{f"{field}__lte": until}
+    ).order_by(field, "pk")[:limit]
+    if source == TOMBSTONES:
+        return [
+            Change(Position(time, source, pk), model, object_pk, True)
+            for time, pk, model, object_pk in queryset.values_list(
+                field, "pk", "model", "object_pk"
+            )
+        ]
+    model = str(CHANGE_MODELS[source]._meta.model_name)
+    return [
+        Change(Position(time, source, pk), model, pk)
+        for time, pk in queryset.values_list(field, "pk")
+    ]
+
+
+def read_changes(
+    user: User, since: Position | None = None, limit: int = 100
+) -> tuple[list[Change], bool]:
+    until = timezone.now() - CHANGES_LAG
+    merged = list(
+        heapq.merge(
+            *[
+                read_source(i, queryset, field, since, until, limit + 1)
+                for i, (queryset, field) in enumerate(change_sources(user))
+            ],
+            key=lambda change: change.position,
+        )
+    )
+    return merged[:limit], len(merged) > limit
+
+
+def record_deletion(instance: Model) -> None:
+    Tombstone.objects.create(
+        model=instance._meta.model_name,
+        object_pk=instance.pk,
+        user_id=getattr(instance, "user_id", None),
+    )
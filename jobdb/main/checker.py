@@ -0,0 +1,436 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field, replace
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Posting, PostingCheck
+from .signals import send_data_changed
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
+        " AppleWebKit/537.36 (KHTML, like Gecko)"
+        " Chrome/126.0.0.0 Safari/537.36"
+    )
+}
+
+CLOSED_NOTE = "Closed automatically by check_posting_urls command"
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    skip: bool = False
+    rate: float = 2.0
+    burst: int = 2
+    max_in_flight: int = 2
+
+
+DEFAULT_HOST_POLICY = HostPolicy()
+
+# Matched against the posting URL host and each of its parent domains
+HOST_POLICIES: dict[str, HostPolicy] = {
+    # LinkedIn URLs can redirect to the login page
+    "linkedin.com": HostPolicy(skip=True),
+    # Redirects even if still open
+    "timescale.com": HostPolicy(skip=True),
+    # Applicant tracking systems shared by many companies
+    "jobs.ashbyhq.com": HostPolicy(rate=1.0, max_in_flight=1),
+    "jobs.lever.co": HostPolicy(rate=1.0, max_in_flight=1),
+    "greenhouse.io": HostPolicy(rate=1.0, max_in_flight=1),
+}
+
+
+def host_policy(
+    host: str, policies: dict[str, HostPolicy] | None = None
+) -> HostPolicy:
+    policies = HOST_POLICIES if policies is None else policies
+    parts = host.lower().split(".")
+    for i in range(len(parts) - 1):
+        if (policy := policies.get(".".join(parts[i:]))) is not None:
+            return policy
+    return policies.get("", DEFAULT_HOST_POLICY)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    with suppress(ValueError):
+        return max(0.0, float(value))
+    with suppress(TypeError, ValueError):
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - timezone.now()).total_seconds())
+    return None
+
+
+@dataclass
+class CacheEntry:
+    status: int
+    location: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    checked: float = 0.0
+
+
+class ResponseCache:
+    def __init__(self, path: str | Path, ttl: float = 86400):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.entries: dict[str, CacheEntry] = {}
+        self.lock = threading.Lock()
+        with suppress(FileNotFoundError, ValueError, TypeError):
+            data = json.loads(self.path.read_text())
+            self.entries = {
+                url: CacheEntry(**entry) for url, entry in data.items()
+            }
+
+    def get(self, url: str) -> CacheEntry | None:
+        with self.lock:
+            return self.entries.get(url)
+
+    def fresh(self, url: str) -> CacheEntry | None:
+        entry = self.get(url)
+        if entry and time.time() - entry.checked < self.ttl:
+            return entry
+        return None
+
+    def put(self, url: str, entry: CacheEntry) -> None:
+        with self.lock:
+            self.entries[url] = entry
+
+    def save(self) -> None:
+        with self.lock:
+            data = {url: asdict(entry) for url, entry in self.entries.items()}
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(data))
+        tmp_path.replace(self.path)
+
+
+@dataclass
+class CheckResult:
+    posting: Posting
+    status: int | None = None
+    location: str | None = None
+    error: str | None = None
+    retry_after: float | None = None
+    cached: bool = False
+
+    @property
+    def closed(self) -> bool:
+        return self.status is not None and 300 <= self.status <= 399
+
+    @property
+    def throttled(self) -> bool:
+        return self.status in {429, 503}
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or (
+            self.status is not None and self.status >= 400
+        )
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        if self.rate <= 0:
+            return 0.0
+        self._refill(now)
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+    def take(self, now: float) -> None:
+        if self.rate > 0:
+            self._refill(now)
+            self.tokens -= 1
+
+
+@dataclass
+class HostState:
+    policy: HostPolicy
+    bucket: TokenBucket
+    queue: deque[tuple[Posting, int]] = field(default_factory=deque)
+    in_flight: int = 0
+    backoff_until: float = 0.0
+
+
+class HostScheduler:
+    def __init__(
+        self,
+        policies: dict[str, HostPolicy] | None = None,
+        rate: float | None = None,
+    ):
+        self.policies = policies
+        self.rate = rate
+        self.hosts: dict[str, HostState] = {}
+        self.rotation: deque[str] = deque()
+
+    def __len__(self) -> int:
+        return sum(len(state.queue) for state in self.hosts.values())
+
+    def add(self, posting: Posting, attempt: int = 0) -> bool:
+        host = urlparse(posting.url).netloc.lower()
+        if (state := self.hosts.get(host)) is None:
+            policy = host_policy(host, self.policies)
+            if policy.skip:
+                return False
+            rate = policy.rate if self.rate is None else self.rate
+            state = HostState(policy, TokenBucket(rate, policy.burst))
+            self.hosts[host] = state
+            self.rotation.append(host)
+        state.queue.append((posting, attempt))
+        return True
+
+    def next(self, now: float) -> tuple[Posting, int] | None:
+        for _ in range(len(self.rotation)):
+            host = self.rotation[0]
+            self.rotation.rotate(-1)
+            state = self.hosts[host]
+            if (
+                state.queue
+                and state.in_flight < state.policy.max_in_flight
+                and state.backoff_until <= now
+                and state.bucket.delay(now) == 0
+            ):
+                state.bucket.take(now)
+                state.in_flight += 1
+                return state.queue.popleft()
+        return None
+
+    def wait_time(self, now: float) -> float:
+        delays = [
+            max(state.backoff_until - now, state.bucket.delay(now))
+            for state in self.hosts.values()
+            if state.queue and state.in_flight < state.policy.max_in_flight
+        ]
+        return max(0.0, min(delays)) if delays else 1.0
+
+    def finished(self, posting: Posting, retry_after: float | None) -> None:
+        state = self.hosts[urlparse(posting.url).netloc.lower()]
+        state.in_flight -= 1
+        if retry_after is not None:
+            state.backoff_until = time.monotonic() + retry_after
+
+
+class PostingChecker:
+    def __init__(
+        self,
+        concurrency: int = 8,
+        host_rate: float | None = None,
+        timeout: float = 3,
+        batch_size: int = 100,
+        max_retries: int = 3,
+        backoff: float = 5.0,
+        policies: dict[str, HostPolicy] | None = None,
+        cache: ResponseCache | None = None,
+        log: Callable[[str], None] = print,
+    ):
+        self.concurrency = concurrency
+        self.host_rate = host_rate
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.policies = policies
+        self.cache = cache
+        self.log = log
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=concurrency, pool_maxsize=concurrency
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(HEADERS)
+
+    def run(self, postings: Iterable[Posting]) -> None:
+        results: list[CheckResult] = []
+        for result in self.check(postings):
+            results.append(result)
+            if result.error:
+                self.log(
+                    f"Exception requesting {result.posting.url}:"
+                    f" {result.error} (skip)"
+                )
+            elif result.throttled:
+                self.log(
+                    f"Throttled requesting {result.posting.url}"
+                    f" [{result.status}] (skip)"
+                )
+            elif result.closed:
+                self.log(
+                    f"Closed {result.posting.url}"
+                    f" [redirected to {result.location}]"
+                )
+            else:
+                self.log(f"Normal response: {result.posting.url}")
+            if len(results) >= self.batch_size:
+                self.save_results(results)
+                results = []
+        self.save_results(results)
+
+    def check(self, postings: Iterable[Posting]) -> Iterator[CheckResult]:
+        scheduler = HostScheduler(self.policies, rate=self.host_rate)
+        for posting in postings:
+            if self.cache and (entry := self.cache.fresh(posting.url)):
+                yield CheckResult(
+                    posting,
+                    status=entry.status,
+                    location=entry.location,
+                    cached=True,
+                )
+            else:
+                scheduler.add(posting)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            pending: dict[Future, int] = {}
+            while len(scheduler) or pending:
+                while len(pending) < self.concurrency and (
+                    item := scheduler.next(time.monotonic())
+                ):
+                    posting, attempt = item
+                    future = executor.submit(self.check_posting, posting)
+                    pending[future] = attempt
+                # With every slot busy only a finished request frees one;
+                # otherwise wake for whichever comes first, a finished
+                # request or the next host becoming ready
+                timeout = None
+                if len(pending) < self.concurrency:
+                    timeout = scheduler.wait_time(time.monotonic())
+                if not pending:
+                    time.sleep(timeout or 0)
+                    continue
+                done, _ = wait(
+                    pending, timeout=timeout, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    attempt = pending.pop(future)
+                    result = future.result()
+                    retry_after = None
+                    if result.throttled:
+                        retry_after = result.retry_after
+                        if retry_after is None:
+                            retry_after = self.backoff * 2**attempt
+                    scheduler.finished(result.posting, retry_after)
+                    if result.throttled and attempt < self.max_retries:
+                        scheduler.add(result.posting, attempt + 1)
+                    else:
+                        yield result
+
+    def check_posting(self, posting: Posting) -> CheckResult:
+        cache = self.cache
+        entry = cache.get(posting.url) if cache else None
+        headers = {}
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        try:
+            response = self.session.head(
+                posting.url,
+                headers=headers,
+                allow_redirects=False,
+                timeout=self.timeout,
+            )
+        except requests.exceptions.RequestException as e:
+            return CheckResult(posting, error=str(e))
+        if cache and entry and response.status_code == 304:
+            cache.put(posting.url, replace(entry, checked=time.time()))
+            return CheckResult(
+                posting,
+                status=entry.status,
+                location=entry.location,
+                cached=True,
+            )
+        result = CheckResult(
+            posting,
+            status=response.status_code,
+            location=response.headers.get("Location"),
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        )
+        if cache and not result.throttled and not result.failed:
+            cache.put(
+                posting.url,
+                CacheEntry(
+                    status=response.status_code,
+                    location=result.location,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    checked=time.time(),
+                ),
+            )
+        return result
+
+    def save_results(self, results: list[CheckResult]) -> None:
+        if not results:
+            return
+        if self.cache:
+            self.cache.save()
+        now = timezone.now()
+        postings = [result.posting for result in results if result.closed]
+        for posting in postings:
+            posting.closed = now
+            posting.closed_note = CLOSED_NOTE
+            posting.modified = now
+        failures = dict(
+            PostingCheck.objects.filter(
+                posting__in=[result.posting.pk for result in results]
+            ).values_list("posting", "consecutive_failures")
+        )
+        checks = [
+            PostingCheck(
+                posting_id=result.posting.pk,
+                last_checked=now,
+                last_status=result.status,
+                last_error=result.error or "",
+                consecutive_failures=(
+                    failures.get(result.posting.pk, 0) + 1
+                    if result.failed
+                    else 0
+                ),
+            )
+            for result in results
+        ]
+        with transaction.atomic():
+            PostingCheck.objects.bulk_create(
+                checks,
+                update_conflicts=True,
+                unique_fields=["posting"],
+                update_fields=[
+                    "last_checked",
+                    "last_status",
+                    "last_error",
+                    "consecutive_failures",
+                ],
+            )
+            if postings:
+                Posting.objects.bulk_update(
+                    postings, ["closed", "closed_note", "modified"]
+                )
+                send_data_changed(
+                    Posting, companies={p.company_id for p in postings}
+                )
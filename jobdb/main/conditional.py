@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from django.db.models import Max, QuerySet
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from ..utils.cache import generations
+from .models import Tombstone
+from .pagination import cached_query
+
+# ETags hash the cache generations of the scopes a response reads with
+# the request's user, path and representation, so checking one costs a
+# cache lookup and any write the scopes cover changes it. Last-Modified
+# is the newest modified time of the rows, the rows they show and the
+# tombstones of deleted rows, only offered where that covers everything in
+# the response. Company lists show counters that recount() maintains, so
+# they rely on the ETag alone.
+
+
+@dataclass
+class Validators:
+    etag: str
+    last_modified: datetime | None = None
+
+    @property
+    def timestamp(self) -> int | None:
+        if self.last_modified is None:
+            return None
+        return int(self.last_modified.timestamp())
+
+
+def last_modified(
+    queryset: QuerySet, fields: Collection[str], scopes: Collection[str]
+) -> datetime | None:
+    times = cached_query(
+        "last-modified",
+        queryset.order_by(),
+        list(scopes),
+        lambda qs: qs.aggregate(*[Max(field) for field in fields]),
+    )
+    deleted = cached_query(
+        "last-deleted",
+        Tombstone.objects.filter(model=queryset.model._meta.model_name),
+        list(scopes),
+        lambda qs: qs.aggregate(deleted=Max("deleted"))["deleted"],
+    )
+    return max(filter(None, [*times.values(), deleted]), default=None)
+
+
+def get_validators(
+    request: HttpRequest,
+    scopes: Collection[str],
+    queryset: QuerySet | None = None,
+    last_modified_fields: Collection[str] | None = None,
+) -> Validators:
+    key = [
+        generations(scopes),
+        request.user.pk,
+        request.get_full_path(),
+        request.headers.get("Accept", ""),
+        request.headers.get("HX-Request", ""),
+    ]
+    validators = Validators(
+        quote_etag(hashlib.sha1(repr(key).encode()).hexdigest())
+    )
+    if queryset is not None and last_modified_fields:
+        validators.last_modified = last_modified(
+            queryset, last_modified_fields, scopes
+        )
+    return validators
+
+
+def not_modified(
+    request: HttpRequest, validators: Validators
+) -> HttpResponseBase | None:
+    if request.method not in ("GET", "HEAD"):
+        return None
+    response = get_conditional_response(
+        request, etag=validators.etag, last_modified=validators.timestamp
+    )
+    if response is not None:
+        set_validators(response, validators)
+    return response
+
+
+def set_validators(response: Any, validators: Validators) -> None:
+    if response.status_code not in (200, 304):
+        return
+    response.headers.setdefault("ETag", validators.etag)
+    if validators.timestamp is not None:
+        response.headers.setdefault(
+            "Last-Modified", http_date(validators.timestamp)
+        )
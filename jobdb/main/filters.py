@@ -1,15 +1,16 @@
-from decimal import Decimal
 from typing import Any
 
 from crispy_bootstrap5.bootstrap5 import FloatingField  # type: ignore
 from crispy_forms.helper import FormHelper  # type: ignore
 from crispy_forms.layout import Column, Layout, Row, Submit  # type: ignore
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 from django.forms import CharField, Form, HiddenInput
 from django_filters import BooleanFilter, CharFilter  # type: ignore
 from django_filters import FilterSet as BaseFilterSet
 
+from .fuzzy import company_name_filter
 from .models import Application, Company, Posting
+from .search import search
 
 
 class HiddenCharField(CharField):
@@ -64,12 +65,7 @@ class CompanyFilter(FilterSet):
     def universal_search(
         self, queryset: QuerySet, name: str, value: Any
     ) -> QuerySet:
-        condition = Q()
-        if value.replace(".", "", 1).isdigit():
-            condition.add(Q(**{"pk": Decimal(value)}), Q.OR)
-        for field in ["name", "url", "notes"]:
-            condition.add(Q(**{f"{field}__icontains": value}), Q.OR)
-        return queryset.filter(condition)
+        return search(queryset, value, ["name", "url", "notes"])
 
     def filter_available(
         self, queryset: QuerySet, name: str, value: bool
@@ -95,9 +91,7 @@ class CompanyFilter(FilterSet):
 
 class PostingFilter(FilterSet):
     query = CharFilter(method="universal_search", label="Search")
-    company = HiddenCharFilter(
-        field_name="company__name", lookup_expr="iexact", label=""
-    )
+    company = HiddenCharFilter(method="filter_company", label="")
     in_wa = BooleanFilter(
         field_name="in_wa", method="filter_in_wa", label="In WA"
     )
@@ -109,12 +103,14 @@ class PostingFilter(FilterSet):
     def universal_search(
         self, queryset: QuerySet, name: str, value: Any
     ) -> QuerySet:
-        condition = Q()
-        if value.replace(".", "", 1).isdigit():
-            condition.add(Q(**{"pk": Decimal(value)}), Q.OR)
-        for field in ["company__name", "url", "notes"]:
-            condition.add(Q(**{f"{field}__icontains": value}), Q.OR)
-        return queryset.filter(condition)
+        return search(
+            queryset, value, ["company__name", "title", "url", "notes"]
+        )
+
+    def filter_company(
+        self, queryset: QuerySet, name: str, value: str
+    ) -> QuerySet:
+        return queryset.filter(company_name_filter("company", value))
 
     def filter_in_wa(
         self, queryset: QuerySet, name: str, value: bool
@@ -139,9 +135,7 @@ class AllPostingFilter(PostingFilter):
 
 class ApplicationFilter(FilterSet):
     query = CharFilter(method="universal_search", label="Search")
-    company = HiddenCharFilter(
-        field_name="posting__company__name", lookup_expr="iexact", label=""
-    )
+    company = HiddenCharFilter(method="filter_company", label="")
     in_wa = BooleanFilter(
         field_name="in_wa", method="filter_in_wa", label="In WA"
     )
@@ -156,12 +150,21 @@ class ApplicationFilter(FilterSet):
     def universal_search(
         self, queryset: QuerySet, name: str, value: Any
     ) -> QuerySet:
-        condition = Q()
-        if value.replace(".", "", 1).isdigit():
-            condition.add(Q(**{"pk": Decimal(value)}), Q.OR)
-        for field in ["posting__company__name", "posting__url", "notes"]:
-            condition.add(Q(**{f"{field}__icontains": str(value)}), Q.OR)
-        return queryset.filter(condition)
+        return search(
+            queryset,
+            str(value),
+            [
+                "posting__company__name",
+                "posting__title",
+                "posting__url",
+                "notes",
+            ],
+        )
+
+    def filter_company(
+        self, queryset: QuerySet, name: str, value: str
+    ) -> QuerySet:
+        return queryset.filter(company_name_filter("posting__company", value))
 
     def filter_in_wa(
         self, queryset: QuerySet, name: str, value: bool
@@ -115,6 +115,10 @@ class AddPostingForm(ModelForm):
         super().__init__(*args, **kwargs)
         self.fields["url"].widget.attrs["readonly"] = True
 
+    # AddPostingsView checks every URL against existing postings at once
+    def validate_unique(self) -> None:
+        pass
+
     @cached_property
     def helper(self) -> FormHelper:
         _helper = FormHelper(self)
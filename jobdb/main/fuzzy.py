@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import heapq
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from django.db import connections
+from django.db.models import Case, FloatField, Model, Q, QuerySet, Value, When
+from django.utils import timezone
+
+from ..utils.cache import generations
+from .changes import CHANGES_LAG
+from .models import Company, Posting, Tombstone
+
+# Queries stop collecting candidates once the budget is spent and rank
+# what they have. Indexes load once, then apply the rows saved and deleted
+# since they last looked whenever a write bumps the cache generation of
+# their model. A full reload runs in the background every few minutes, so
+# rows from rolled back transactions do not linger, and requests keep
+# using the current index meanwhile.
+SEARCH_BUDGET = 0.05
+MATCH_THRESHOLD = 0.6
+RELOAD_INTERVAL = timedelta(minutes=5)
+
+
+def trigrams(text: str) -> set[str]:
+    grams: set[str] = set()
+    for word in re.findall(r"[^\W_]+", text.lower()):
+        padded = f"  {word} "
+        grams.update(map("".join, zip(padded, padded[1:], padded[2:])))
+    return grams
+
+
+@dataclass
+class Match:
+    key: Any
+    text: str
+    score: float
+
+
+class TrigramIndex:
+    def __init__(self, entries: Iterable[tuple[Any, str]]):
+        self.keys: list[Any] = []
+        self.texts: list[str] = []
+        self.sizes: list[int] = []
+        self.exact: dict[str, int] = {}
+        self.postings: dict[str, list[int]] = {}
+        self.slots: dict[Any, int] = {}
+        self.removed: set[int] = set()
+        for key, text in entries:
+            self.add(key, text)
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def add(self, key: Any, text: str) -> None:
+        self.remove(key)
+        i = len(self.keys)
+        grams = trigrams(text)
+        self.keys.append(key)
+        self.texts.append(text)
+        self.sizes.append(len(grams))
+        self.slots[key] = i
+        self.exact.setdefault(text.lower(), i)
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(i)
+
+    # Removed entries stay in the posting lists and are skipped by
+    # search() until the index is rebuilt
+    def remove(self, key: Any) -> None:
+        if (i := self.slots.pop(key, None)) is None:
+            return
+        self.removed.add(i)
+        if self.exact.get(text := self.texts[i].lower()) == i:
+            del self.exact[text]
+
+    def entries(self) -> Iterator[tuple[Any, str]]:
+        for key, i in self.slots.items():
+            yield key, self.texts[i]
+
+    def get(self, text: str) -> Any:
+        i = self.exact.get(text.lower())
+        return None if i is None else self.keys[i]
+
+    # Scores are the share of query trigrams found in the text, like
+    # pg_trgm's word_similarity, with whole-text similarity breaking ties.
+    # Rare trigrams are counted first. When the next posting list would
+    # overrun the budget the rest are skipped, keeping texts that could
+    # still reach the threshold.
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        threshold: float = MATCH_THRESHOLD,
+        budget: float = SEARCH_BUDGET,
+    ) -> list[Match]:
+        start = time.perf_counter()
+        grams = sorted(
+            trigrams(query), key=lambda g: len(self.postings.get(g, []))
+        )
+        shared: Counter[int] = Counter()
+        seen = entries = 0
+        for gram in grams:
+            postings = self.postings.get(gram, [])
+            if entries:
+                rate = (time.perf_counter() - start) / entries
+                # Ranking costs about three counts per candidate
+                candidates = len(shared) + len(postings)
+                if rate * (entries + 4 * candidates) > budget:
+                    break
+            shared.update(postings)
+            seen += 1
+            entries += len(postings)
+        size = len(grams)
+        skipped = size - seen
+        best = heapq.nlargest(
+            limit,
+            (
+                (n / size, n / (size + self.sizes[i] - n), i)
+                for i, n in shared.items()
+                if n + skipped >= threshold * size and i not in self.removed
+            ),
+        )
+        return [
+            Match(self.keys[i], self.texts[i], round(score, 3))
+            for score, _, i in best
+        ]
+
+
+# Rows are indexed by primary key, or by their text when several rows
+# share one entry, in which case the entry goes when its last row does.
+class IndexCache:
+    def __init__(
+        self, model: type[Model], field: str, key_by_text: bool = False
+    ):
+        self.model = model
+        self.field = field
+        self.key_by_text = key_by_text
+        self.scope = model.__name__
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.index: TrigramIndex | None = None
+        self.rows: dict[int, str] = {}
+        self.refs: Counter[Any] = Counter()
+        self.generation = ""
+        self.synced = self.loaded = timezone.now()
+        self.reloading = False
+
+    def get(self) -> TrigramIndex:
+        generation = generations([self.scope])
+        with self.lock:
+            if self.index is None:
+                self.index = TrigramIndex([])
+                self.synced = self.loaded = timezone.now()
+                self.apply(self.model.objects.order_by(), [])
+            elif generation != self.generation:
+                self.sync()
+            self.generation = generation
+            if not self.reloading and (
+                timezone.now() - self.loaded > RELOAD_INTERVAL
+            ):
+                self.reloading = True
+                threading.Thread(target=self.reload, daemon=True).start()
+            return self.index
+
+    # Rows saved shortly before the last sync may have committed after it
+    def sync(self) -> None:
+        since = self.synced - CHANGES_LAG
+        self.synced = timezone.now()
+        self.apply(
+            self.model.objects.filter(modified__gte=since).order_by(),
+            Tombstone.objects.filter(
+                model=self.model._meta.model_name, deleted__gte=since
+            ).values_list("object_pk", flat=True),
+        )
+
+    def apply(self, rows: QuerySet, deleted: Iterable[int]) -> None:
+        for pk in deleted:
+            self.discard(pk)
+        for pk, text in rows.values_list("pk", self.field).iterator():
+            self.put(pk, text)
+        assert self.index is not None
+        if len(self.index.removed) > len(self.index):
+            self.index = TrigramIndex(self.index.entries())
+
+    def key(self, pk: int, text: str) -> Any:
+        return text if self.key_by_text else pk
+
+    def put(self, pk: int, text: str) -> None:
+        if self.rows.get(pk) == text:
+            return
+        self.discard(pk)
+        self.rows[pk] = text
+        key = self.key(pk, text)
+        self.refs[key] += 1
+        if self.refs[key] == 1:
+            assert self.index is not None
+            self.index.add(key, text)
+
+    def discard(self, pk: int) -> None:
+        if (text := self.rows.pop(pk, None)) is None:
+            return
+        key = self.key(pk, text)
+        self.refs[key] -= 1
+        if not self.refs[key]:
+            del self.refs[key]
+            assert self.index is not None
+            self.index.remove(key)
+
+    def reload(self) -> None:
+        try:
+            fresh = IndexCache(self.model, self.field, self.key_by_text)
+            fresh.get()
+            with self.lock:
+                self.index = fresh.index
+                self.rows, self.refs = fresh.rows, fresh.refs
+                self.synced = self.loaded = fresh.synced
+                self.generation = ""
+        finally:
+            self.reloading = False
+            connections.close_all()
+
+
+company_names = IndexCache(Company, "name")
+posting_titles = IndexCache(Posting, "title", key_by_text=True)
+
+
+def match_companies(query: str, limit: int = 10) -> list[Match]:
+    return company_names.get().search(query, limit)
+
+
+def match_titles(query: str, limit: int = 10) -> list[Match]:
+    return posting_titles.get().search(query, limit)
+
+
+def with_scores(queryset: QuerySet, field: str, matches: list[Match]) -> Any:
+    return queryset.filter(
+        **{f"{field}__in": [m.key for m in matches]}
+    ).annotate(
+        score=Case(
+            *[When(**{field: m.key}, then=Value(m.score)) for m in matches],
+            output_field=FloatField(),
+        )
+    )
+
+
+# Exact names always match. Otherwise the closest name does, so a typo
+# in a company filter still finds the company.
+def company_name_filter(field: str, value: str) -> Q:
+    condition = Q(**{f"{field}__name__iexact": value})
+    index = company_names.get()
+    if index.get(value) is None and (matches := index.search(value, 1)):
+        condition |= Q(**{field: matches[0].key})
+    return condition
@@ -0,0 +1,108 @@
+import json
+import platform
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import (
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+from jobdb.main import benchmark
+from jobdb.main.models import User
+from jobdb.main.synthetic import Generator, Scale
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds a test database with synthetic data and records query"
+        " counts, latency and memory use for each view and API route"
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--companies", type=int, default=100)
+        parser.add_argument("--postings", type=int, default=2000)
+        parser.add_argument("--users", type=int, default=5)
+        parser.add_argument("--applications", type=int, default=500)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of timed requests per route",
+        )
+        parser.add_argument(
+            "-r",
+            "--route",
+            dest="routes",
+            metavar="route",
+            action="append",
+            help="Only benchmark these route names",
+        )
+        parser.add_argument(
+            "-o", "--output", metavar="path", help="Write results as JSON"
+        )
+        parser.add_argument(
+            "--compare",
+            metavar="path",
+            help="Compare results with a previous JSON output",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=1.5,
+            help="Ratio above the baseline reported as a regression",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        scale = Scale(
+            companies=options["companies"],
+            postings=options["postings"],
+            users=options["users"],
+            applications=options["applications"],
+        )
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        try:
+            Generator(scale, seed=options["seed"], log=self.log).run()
+            user = User.objects.get(username="synthetic0")
+            results = benchmark.run(
+                user,
+                repeat=options["repeat"],
+                routes=options["routes"],
+                log=self.log,
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+        output = {
+            "environment": {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+            },
+            "scale": vars(scale) | {"seed": options["seed"]},
+            "routes": results,
+        }
+        if path := options.get("output"):
+            Path(path).write_text(json.dumps(output, indent=2) + "\n")
+        else:
+            self.stdout.write(json.dumps(output, indent=2))
+        if path := options.get("compare"):
+            baseline = json.loads(Path(path).read_text())
+            if regressions := benchmark.compare(
+                baseline["routes"], results, threshold=options["threshold"]
+            ):
+                raise CommandError(
+                    "Regressions found:\n" + "\n".join(regressions)
+                )
+            self.log("No regressions found")
+
+    def log(self, message: str) -> None:
+        self.stderr.write(message)
@@ -1,24 +1,15 @@
-import time
 from argparse import ArgumentParser
+from datetime import timedelta
 from typing import Any
-from urllib.parse import urlparse
 
-import requests
 from django.core.management.base import BaseCommand
-from django.db.models import QuerySet
+from django.db.models import F, Q, QuerySet
 from django.db.models.functions import Lower
 from django.utils import timezone
 
+from jobdb.main.checker import PostingChecker, ResponseCache
 from jobdb.main.models import Posting
 
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
-        " AppleWebKit/537.36 (KHTML, like Gecko)"
-        " Chrome/126.0.0.0 Safari/537.36"
-    )
-}
-
 
 class Command(BaseCommand):
     help = "Checks for closed posting URLs"
@@ -31,49 +22,85 @@ class Command(BaseCommand):
             metavar="company",
             action="append",
         )
+        parser.add_argument(
+            "-j",
+            "--concurrency",
+            type=int,
+            default=8,
+            help="Maximum number of requests in flight",
+        )
+        parser.add_argument(
+            "--host-rate",
+            type=float,
+            help=(
+                "Maximum requests per second to each host,"
+                " overriding the host policy"
+            ),
+        )
+        parser.add_argument(
+            "--max-retries",
+            type=int,
+            default=3,
+            help="Number of times to retry throttled requests",
+        )
+        parser.add_argument(
+            "--stale-after",
+            type=float,
+            metavar="hours",
+            help="Only check postings not checked within this many hours",
+        )
+        parser.add_argument(
+            "--cache-file",
+            metavar="path",
+            help="Cache response validators and verdicts in this file",
+        )
+        parser.add_argument(
+            "--cache-ttl",
+            type=float,
+            default=24,
+            metavar="hours",
+            help="Reuse cached verdicts newer than this without a request",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of check results to save at once",
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
         queryset = (
             Posting.objects.filter(closed=None)
             .annotate(company_name_lower=Lower("company__name"))
-            .order_by("company_name_lower")
+            .order_by(
+                F("url_check__last_checked").asc(nulls_first=True),
+                "company_name_lower",
+            )
         )
+        if (stale_after := options.get("stale_after")) is not None:
+            queryset = queryset.filter(
+                Q(url_check=None)
+                | Q(
+                    url_check__last_checked__lt=timezone.now()
+                    - timedelta(hours=stale_after)
+                )
+            )
         if company_names := options.get("companies"):
             queryset = queryset.filter(
                 company_name_lower__in=[n.lower() for n in company_names]
             )
+        self.checker = PostingChecker(
+            concurrency=options["concurrency"],
+            host_rate=options["host_rate"],
+            max_retries=options["max_retries"],
+            batch_size=options["batch_size"],
+            cache=(
+                ResponseCache(cache_file, ttl=options["cache_ttl"] * 3600)
+                if (cache_file := options.get("cache_file"))
+                else None
+            ),
+        )
         self.run(queryset)
 
     def run(self, postings: QuerySet) -> None:
-        for posting in postings.all():
-            url_bits = urlparse(posting.url)
-            if url_bits.netloc in {"linkedin.com", "www.linkedin.com"}:
-                # Skip LinkedIn URLs, which can redirect to the login page
-                continue
-            if url_bits.netloc in {"timescale.com", "www.timescale.com"}:
-                # Redirects even if still open
-                continue
-            self.check_posting(posting)
-
-    def check_posting(self, posting: Posting) -> None:
-        try:
-            response = requests.head(
-                posting.url,
-                allow_redirects=False,
-                timeout=3,
-                headers=HEADERS.copy(),
-            )
-        except requests.exceptions.RequestException as e:
-            print(f"Exception requesting {posting.url}: {e} (skip)")
-            return
-        if 300 <= response.status_code <= 399:
-            dest = response.headers.get("Location")
-            posting.closed = timezone.now()
-            posting.closed_note = (
-                "Closed automatically by check_posting_urls command"
-            )
-            posting.save()
-            print(f"Closed {posting.url} [redirected to {dest}]")
-        else:
-            print(f"Normal response: {posting.url}")
-        time.sleep(0.5)
+        self.checker.run(postings.iterator())
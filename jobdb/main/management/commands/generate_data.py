@@ -0,0 +1,69 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from jobdb.main.synthetic import Generator, Scale
+
+
+class Command(BaseCommand):
+    help = "Generates synthetic companies, postings and applications"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        defaults = Scale()
+        parser.add_argument("--companies", type=int, default=1000)
+        parser.add_argument("--postings", type=int, default=50000)
+        parser.add_argument("--users", type=int, default=10)
+        parser.add_argument("--applications", type=int, default=10000)
+        parser.add_argument(
+            "--closed",
+            type=float,
+            default=defaults.closed,
+            help="Fraction of postings that are closed",
+        )
+        parser.add_argument(
+            "--filed",
+            type=float,
+            default=defaults.filed,
+            help="Fraction of companies that are filed",
+        )
+        parser.add_argument(
+            "--job-board-urls",
+            type=float,
+            default=defaults.job_board_urls,
+            help="Fraction of postings with a LinkedIn job board URL",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows to insert at once",
+        )
+        parser.add_argument(
+            "--no-rebuild",
+            dest="rebuild",
+            action="store_false",
+            help=(
+                "Skip rebuilding the postings queue and company counts"
+                " (run rebuild_queue and recount later)"
+            ),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        scale = Scale(
+            companies=options["companies"],
+            postings=options["postings"],
+            users=options["users"],
+            applications=options["applications"],
+            closed=options["closed"],
+            filed=options["filed"],
+            job_board_urls=options["job_board_urls"],
+        )
+        Generator(
+            scale,
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            rebuild=options["rebuild"],
+            log=print,
+        ).run()
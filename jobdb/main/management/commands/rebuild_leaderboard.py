@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobdb.main.models import LeaderboardEntry
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the stored applications leaderboard"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            count = LeaderboardEntry.objects.refresh()  # type: ignore
+        print(f"Rebuilt leaderboard for {count} users")
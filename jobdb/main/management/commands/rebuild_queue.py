@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobdb.main.models import QueueEntry
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the stored postings queue for all users"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            changed_users = QueueEntry.objects.refresh()  # type: ignore
+        print(f"Updated postings queue for {len(changed_users)} users")
@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobdb.main.models import Company
+
+
+class Command(BaseCommand):
+    help = "Rebuilds stored company posting and application counts"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            count = Company.objects.recount()  # type: ignore
+        print(f"Updated counts for {count} companies")
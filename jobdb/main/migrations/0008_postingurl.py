@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def populate_posting_urls(
+    apps: StateApps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    Posting = apps.get_model("main", "Posting")  # noqa
+    PostingURL = apps.get_model("main", "PostingURL")  # noqa
+    posting_urls = []
+    for posting in Posting.objects.only("pk", "url", "job_board_urls"):
+        urls = [posting.url] + (posting.job_board_urls or [])
+        for url in dict.fromkeys(urls):
+            posting_urls.append(PostingURL(posting_id=posting.pk, url=url))
+    PostingURL.objects.bulk_create(posting_urls, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0007_company_filed"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostingURL",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "url",
+                    models.URLField(
+                        db_index=True, max_length=2048, verbose_name="URL"
+                    ),
+                ),
+                (
+                    "posting",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="urls",
+                        to="main.posting",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Posting URL",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("posting", "url"),
+                        name="single_url_per_posting",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_posting_urls, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,146 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:32
+
+from typing import Any
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def populate_queue_entries(
+    apps: StateApps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    Application = apps.get_model("main", "Application")  # noqa
+    Posting = apps.get_model("main", "Posting")  # noqa
+    QueueEntry = apps.get_model("main", "QueueEntry")  # noqa
+    User = apps.get_model("main", "User")  # noqa
+    applied = set(Application.objects.values_list("user", "posting"))
+    postings_by_company: dict[int, list[Any]] = {}
+    for posting in (
+        Posting.objects.filter(company__filed=None)
+        .select_related("company")
+        .order_by("-in_wa", "-created", "-pk")
+    ):
+        postings_by_company.setdefault(posting.company_id, []).append(posting)
+    entries = []
+    for user_pk in User.objects.values_list("pk", flat=True):
+        for postings in postings_by_company.values():
+            candidates = [p for p in postings if (user_pk, p.pk) in applied]
+            open_postings = [
+                p
+                for p in postings
+                if p.closed is None and (user_pk, p.pk) not in applied
+            ]
+            featured = {p.pk for p in (candidates + open_postings)[:2]}
+            for posting in open_postings:
+                entries.append(
+                    QueueEntry(
+                        user_id=user_pk,
+                        posting_id=posting.pk,
+                        company_id=posting.company_id,
+                        priority=posting.company.priority,
+                        company_sort_name=posting.company.name.lower(),
+                        in_wa=posting.in_wa,
+                        featured=posting.pk in featured,
+                    )
+                )
+    QueueEntry.objects.bulk_create(entries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0008_postingurl"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueueEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "priority",
+                    models.IntegerField(
+                        choices=[(1000, "High"), (500, "Normal"), (100, "Low")]
+                    ),
+                ),
+                ("company_sort_name", models.CharField(max_length=500)),
+                ("in_wa", models.BooleanField()),
+                (
+                    "featured",
+                    models.BooleanField(
+                        help_text="Shown in the postings queue"
+                    ),
+                ),
+                (
+                    "company",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="queue_entries",
+                        to="main.company",
+                    ),
+                ),
+                (
+                    "posting",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="queue_entries",
+                        to="main.posting",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="queue_entries",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Queue entry",
+                "verbose_name_plural": "Queue entries",
+                "indexes": [
+                    models.Index(
+                        fields=[
+                            "user",
+                            "-priority",
+                            "company_sort_name",
+                            "posting",
+                        ],
+                        name="queue_entry_order",
+                    ),
+                    models.Index(
+                        fields=[
+                            "user",
+                            "featured",
+                            "-priority",
+                            "company_sort_name",
+                            "-in_wa",
+                            "posting",
+                        ],
+                        name="queue_entry_featured_order",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "posting"),
+                        name="single_queue_entry_per_user_posting",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            populate_queue_entries, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,145 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:36
+
+from collections import Counter, defaultdict
+
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def populate_company_counters(
+    apps: StateApps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    Application = apps.get_model("main", "Application")  # noqa
+    Company = apps.get_model("main", "Company")  # noqa
+    Posting = apps.get_model("main", "Posting")  # noqa
+    counts: dict[int, Counter] = defaultdict(Counter)
+    for company_pk, closed, in_wa in Posting.objects.values_list(
+        "company", "closed", "in_wa"
+    ):
+        counts[company_pk]["posting_count"] += 1
+        if closed is None:
+            counts[company_pk]["open_posting_count"] += 1
+            counts[company_pk]["wa_open_posting_count"] += int(in_wa)
+    for company_pk, reported, in_wa in Application.objects.values_list(
+        "posting__company", "reported", "posting__in_wa"
+    ):
+        counts[company_pk]["apps_count"] += 1
+        counts[company_pk]["reported_apps_count"] += int(reported is not None)
+        counts[company_pk]["wa_apps_count"] += int(in_wa)
+    companies = list(Company.objects.all())
+    fields = [
+        "posting_count",
+        "open_posting_count",
+        "apps_count",
+        "reported_apps_count",
+        "wa_open_posting_count",
+        "wa_apps_count",
+    ]
+    for company in companies:
+        for field in fields:
+            setattr(company, field, counts[company.pk][field])
+        company.available_count = (
+            company.open_posting_count + company.apps_count
+        )
+        company.wa_available_count = (
+            company.wa_open_posting_count + company.wa_apps_count
+        )
+    Company.objects.bulk_update(
+        companies,
+        fields + ["available_count", "wa_available_count"],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0009_queueentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="company",
+            name="apps_count",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="Applications"
+            ),
+        ),
+        migrations.AddField(
+            model_name="company",
+            name="available_count",
+            field=models.IntegerField(
+                default=0,
+                editable=False,
+                help_text="Open postings plus applications",
+                verbose_name="Available",
+            ),
+        ),
+        migrations.AddField(
+            model_name="company",
+            name="open_posting_count",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="Open postings"
+            ),
+        ),
+        migrations.AddField(
+            model_name="company",
+            name="posting_count",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="Postings"
+            ),
+        ),
+        migrations.AddField(
+            model_name="company",
+            name="reported_apps_count",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="Reported applications"
+            ),
+        ),
+        migrations.AddField(
+            model_name="company",
+            name="wa_apps_count",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="WA applications"
+            ),
+        ),
+        migrations.AddField(
+            model_name="company",
+            name="wa_available_count",
+            field=models.IntegerField(
+                default=0,
+                editable=False,
+                help_text="Open WA postings plus WA applications",
+                verbose_name="WA available",
+            ),
+        ),
+        migrations.AddField(
+            model_name="company",
+            name="wa_open_posting_count",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="Open WA postings"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="company",
+            index=models.Index(
+                fields=["-available_count"], name="company_available"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="company",
+            index=models.Index(
+                fields=["-wa_available_count"], name="company_wa_available"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="company",
+            index=models.Index(
+                fields=["-open_posting_count"], name="company_open_postings"
+            ),
+        ),
+        migrations.RunPython(
+            populate_company_counters, migrations.RunPython.noop
+        ),
+    ]
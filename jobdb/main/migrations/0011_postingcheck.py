@@ -0,0 +1,43 @@
+# Generated by Django 5.1.5 on 2026-10-18 01:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0010_company_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostingCheck",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("last_checked", models.DateTimeField(db_index=True)),
+                ("last_status", models.IntegerField(blank=True, null=True)),
+                ("last_error", models.TextField(blank=True)),
+                ("consecutive_failures", models.IntegerField(default=0)),
+                (
+                    "posting",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="url_check",
+                        to="main.posting",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Posting URL check",
+            },
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.1.5 on 2026-10-18 02:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def populate_leaderboard(
+    apps: StateApps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    Application = apps.get_model("main", "Application")  # noqa
+    LeaderboardEntry = apps.get_model("main", "LeaderboardEntry")  # noqa
+    LeaderboardEntry.objects.bulk_create(
+        [
+            LeaderboardEntry(user_id=user_pk, company_count=count)
+            for user_pk, count in Application.objects.order_by()
+            .values("user")
+            .annotate(count=models.Count("posting__company", distinct=True))
+            .values_list("user", "count")
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0011_postingcheck"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeaderboardEntry",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="leaderboard_entry",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "company_count",
+                    models.IntegerField(verbose_name="Companies applied"),
+                ),
+            ],
+            options={
+                "verbose_name": "Leaderboard entry",
+                "verbose_name_plural": "Leaderboard entries",
+                "indexes": [
+                    models.Index(
+                        fields=["-company_count"], name="leaderboard_order"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_leaderboard, migrations.RunPython.noop),
+    ]
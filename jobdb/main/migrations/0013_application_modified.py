@@ -0,0 +1,21 @@
+# Generated by Django 5.1.5 on 2026-10-18 02:53
+
+import django_extensions.db.fields  # type: ignore
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0012_leaderboardentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="application",
+            name="modified",
+            field=django_extensions.db.fields.ModificationDateTimeField(
+                auto_now=True, verbose_name="modified"
+            ),
+        ),
+    ]
@@ -0,0 +1,145 @@
+from typing import Any
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.operations.base import Operation
+from django.db.migrations.state import ProjectState, StateApps
+from django.db.models import Model
+from django.db.models.functions import Upper
+
+# Searched columns as of this migration. On SQLite these get FTS5 tables
+# using the trigram tokenizer, kept in sync by triggers. Django drops the
+# triggers when it rebuilds a table on SQLite, so later migrations that
+# alter these tables or columns repeat the SQLite operation. On
+# PostgreSQL they get pg_trgm GIN indexes on the expression __icontains
+# compiles to.
+SEARCH_COLUMNS = {
+    "Company": ["name", "url", "notes"],
+    "Posting": ["title", "url", "notes"],
+    "Application": ["notes"],
+}
+
+
+# Operations that only touch databases of one vendor
+class VendorOperation(Operation):
+    vendor = ""
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        if schema_editor.connection.vendor == self.vendor:
+            super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        if schema_editor.connection.vendor == self.vendor:
+            super().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+
+class PostgresTrigramExtension(VendorOperation, TrigramExtension):
+    vendor = "postgresql"
+
+
+class PostgresRunPython(VendorOperation, migrations.RunPython):
+    vendor = "postgresql"
+
+
+class SQLiteRunSQL(VendorOperation, migrations.RunSQL):
+    vendor = "sqlite"
+
+
+def sqlite_search_index(model_name: str, columns: list[str]) -> SQLiteRunSQL:
+    table = f"main_{model_name.lower()}"
+    index = f"{table}_search"
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    delete = (
+        f"INSERT INTO {index}({index}, rowid, {names})"
+        f" VALUES ('delete', old.id, {old});"
+    )
+    insert = f"INSERT INTO {index}(rowid, {names}) VALUES (new.id, {new});"
+    # Databases migrated before this migration existed may already have
+    # the index, possibly over other columns
+    drop: list[Any] = [
+        f"DROP TRIGGER IF EXISTS {index}_{action}"
+        for action in ("insert", "delete", "update")
+    ] + [f"DROP TABLE IF EXISTS {index}"]
+    return SQLiteRunSQL(
+        drop
+        + [
+            f"CREATE VIRTUAL TABLE {index} USING fts5({names},"
+            f" content='{table}', content_rowid='id', tokenize='trigram')",
+            f"CREATE TRIGGER {index}_insert AFTER INSERT ON {table}"
+            f" BEGIN {insert} END",
+            f"CREATE TRIGGER {index}_delete AFTER DELETE ON {table}"
+            f" BEGIN {delete} END",
+            f"CREATE TRIGGER {index}_update AFTER UPDATE OF {names}"
+            f" ON {table} BEGIN {delete} {insert} END",
+            f"INSERT INTO {index}({index}) VALUES ('rebuild')",
+        ],
+        drop,
+    )
+
+
+def trigram_indexes(apps: StateApps) -> list[tuple[type[Model], GinIndex]]:
+    indexes = []
+    for model_name, columns in SEARCH_COLUMNS.items():
+        model = apps.get_model("main", model_name)
+        for column in columns:
+            name = f"{model._meta.db_table}_{column}_trgm"
+            indexes.append(
+                (
+                    model,
+                    GinIndex(
+                        OpClass(Upper(column), name="gin_trgm_ops"), name=name
+                    ),
+                )
+            )
+    return indexes
+
+
+def add_trigram_indexes(
+    apps: StateApps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    for model, index in trigram_indexes(apps):
+        # Created by a post_migrate receiver before this migration existed
+        schema_editor.execute(f"DROP INDEX IF EXISTS {index.name}")
+        schema_editor.add_index(model, index)
+
+
+def remove_trigram_indexes(
+    apps: StateApps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    for model, index in trigram_indexes(apps):
+        schema_editor.remove_index(model, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0014_tombstone"),
+    ]
+
+    operations = [
+        PostgresTrigramExtension(),
+        PostgresRunPython(add_trigram_indexes, remove_trigram_indexes),
+    ] + [
+        sqlite_search_index(model_name, columns)
+        for model_name, columns in SEARCH_COLUMNS.items()
+    ]
@@ -3,33 +3,45 @@ from __future__ import annotations
 import binascii
 import os
 import re
+from collections.abc import Collection, Iterable
 from contextlib import suppress
+from functools import reduce
+from operator import or_
 from typing import Any
 from urllib.parse import urlparse
 
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
-from django.db import connection
 from django.db.models import (
     CASCADE,
     PROTECT,
     BooleanField,
     CharField,
+    Count,
     DateTimeField,
     ForeignKey,
+    Index,
     IntegerChoices,
     IntegerField,
     Model,
+    OneToOneField,
+    OuterRef,
     Q,
     QuerySet,
+    Subquery,
     TextField,
     UniqueConstraint,
     URLField,
 )
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django_extensions.db.fields import (  # type: ignore
+    ModificationDateTimeField,
+)
 from django_extensions.db.models import TimeStampedModel  # type: ignore
 
 from .fields import AppliedDateField, URLArray
-from .utils import url_to_text
+from .utils import batched, url_to_text
 
 
 class Priority(IntegerChoices):
@@ -66,7 +78,66 @@ class APIKey(TimeStampedModel):
         verbose_name = "API Key"
 
 
+def _company_count(queryset: QuerySet, company_field: str) -> Coalesce:
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{company_field: OuterRef("pk")})
+            .order_by()
+            .values(company_field)
+            .annotate(count=Count("pk"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+class CompanyQuerySet(QuerySet):
+    def recount(self) -> int:
+        postings = Posting.objects.all()
+        open_postings = postings.filter(closed=None)
+        apps = Application.objects.all()
+        counts: dict[str, Any] = {
+            "posting_count": _company_count(postings, "company"),
+            "open_posting_count": _company_count(open_postings, "company"),
+            "apps_count": _company_count(apps, "posting__company"),
+            "reported_apps_count": _company_count(
+                apps.filter(reported__isnull=False), "posting__company"
+            ),
+            "wa_open_posting_count": _company_count(
+                open_postings.filter(in_wa=True), "company"
+            ),
+            "wa_apps_count": _company_count(
+                apps.filter(posting__in_wa=True), "posting__company"
+            ),
+        }
+        counts |= {
+            "available_count": (
+                counts["open_posting_count"] + counts["apps_count"]
+            ),
+            "wa_available_count": (
+                counts["wa_open_posting_count"] + counts["wa_apps_count"]
+            ),
+        }
+        # Only rows whose counters move are written, so their modified
+        # time tells API mirrors which companies changed
+        changed = reduce(
+            or_, [~Q(**{field: count}) for field, count in counts.items()]
+        )
+        return self.filter(changed).update(**counts, modified=timezone.now())
+
+
 class Company(TimeStampedModel):
+    COUNTER_FIELDS = (
+        "posting_count",
+        "open_posting_count",
+        "apps_count",
+        "reported_apps_count",
+        "available_count",
+        "wa_open_posting_count",
+        "wa_apps_count",
+        "wa_available_count",
+    )
+
     name: CharField = CharField(
         max_length=500, unique=True, verbose_name="Company name", default=None
     )
@@ -127,6 +198,36 @@ class Company(TimeStampedModel):
         null=True, blank=True, verbose_name="Date Filed"
     )
     notes: TextField = TextField(blank=True, verbose_name="Notes")
+    posting_count: IntegerField = IntegerField(
+        default=0, editable=False, verbose_name="Postings"
+    )
+    open_posting_count: IntegerField = IntegerField(
+        default=0, editable=False, verbose_name="Open postings"
+    )
+    apps_count: IntegerField = IntegerField(
+        default=0, editable=False, verbose_name="Applications"
+    )
+    reported_apps_count: IntegerField = IntegerField(
+        default=0, editable=False, verbose_name="Reported applications"
+    )
+    available_count: IntegerField = IntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Available",
+        help_text="Open postings plus applications",
+    )
+    wa_open_posting_count: IntegerField = IntegerField(
+        default=0, editable=False, verbose_name="Open WA postings"
+    )
+    wa_apps_count: IntegerField = IntegerField(
+        default=0, editable=False, verbose_name="WA applications"
+    )
+    wa_available_count: IntegerField = IntegerField(
+        default=0,
+        editable=False,
+        verbose_name="WA available",
+        help_text="Open WA postings plus WA applications",
+    )
 
     def __str__(self) -> str:
         return f"{self.name}"
@@ -156,22 +257,44 @@ class Company(TimeStampedModel):
 
     def save(self, *args: Any, **kwargs: Any) -> None:
         self.employees_est_num = self.employees_est_as_num
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            # Counters are maintained by CompanyQuerySet.recount()
+            kwargs["update_fields"] = [
+                f.name
+                for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
         super().save(*args, **kwargs)
 
+    objects = CompanyQuerySet.as_manager()
+
     class Meta:
         verbose_name_plural = "Companies"
+        indexes = [
+            Index(fields=["-available_count"], name="company_available"),
+            Index(fields=["-wa_available_count"], name="company_wa_available"),
+            Index(
+                fields=["-open_posting_count"], name="company_open_postings"
+            ),
+            Index(fields=["modified", "id"], name="company_changes"),
+        ]
 
 
 class PostingQuerySet(QuerySet):
-    def _by_url_filter(self, url: str) -> Q:
-        if connection.vendor == "sqlite":
-            q_jb_urls = Q(job_board_urls__icontains=url)
-        else:
-            q_jb_urls = Q(job_board_urls__contains=url)
-        return Q(url=url) | q_jb_urls
-
     def by_url(self, url: str) -> QuerySet:
-        return self.filter(self._by_url_filter(url))
+        return self.filter(urls__url=url)
+
+    def by_urls(
+        self, urls: Iterable[str], batch_size: int = 500
+    ) -> dict[str, Posting]:
+        queryset = PostingURL.objects.select_related("posting__company")
+        if self.query.has_filters():
+            queryset = queryset.filter(posting__in=self.values("pk"))
+        matches = {}
+        for batch in batched(set(urls), batch_size):
+            for posting_url in queryset.filter(url__in=batch):
+                matches[posting_url.url] = posting_url.posting
+        return matches
 
 
 class Posting(TimeStampedModel):
@@ -223,13 +346,17 @@ class Posting(TimeStampedModel):
 
     def _check_duplicate_urls(self) -> None:
         manager = self.__class__.objects
-        for url in [self.url] + (self.job_board_urls or []):
-            existing = manager.by_url(url).exclude(pk=self.pk)  # type: ignore
-            if existing.count() > 0:
+        matches = manager.by_urls(self.all_urls)  # type: ignore
+        for url in self.all_urls:
+            if (posting := matches.get(url)) and posting.pk != self.pk:
                 raise ValidationError(
                     f"A posting containing URL {url} already exists"
                 )
 
+    @property
+    def all_urls(self) -> list[str]:
+        return list(dict.fromkeys([self.url] + (self.job_board_urls or [])))
+
     @property
     def url_text(self) -> str:
         return url_to_text(self.url)
@@ -242,6 +369,65 @@ class Posting(TimeStampedModel):
 
     class Meta:
         verbose_name = "Job posting"
+        indexes = [Index(fields=["modified", "id"], name="posting_changes")]
+
+
+class PostingURLQuerySet(QuerySet):
+    def sync(self, postings: Iterable[Posting]) -> None:
+        wanted = {(p.pk, url) for p in postings for url in p.all_urls}
+        posting_pks = {posting_pk for posting_pk, _ in wanted}
+        existing = {
+            (posting_pk, url): pk
+            for pk, posting_pk, url in self.filter(
+                posting__in=posting_pks
+            ).values_list("pk", "posting", "url")
+        }
+        if stale := [pk for key, pk in existing.items() if key not in wanted]:
+            self.filter(pk__in=stale).delete()
+        self.bulk_create(
+            [
+                PostingURL(posting_id=posting_pk, url=url)
+                for posting_pk, url in wanted - existing.keys()
+            ]
+        )
+
+
+class PostingURL(Model):
+    posting: ForeignKey[Any, Any] = ForeignKey(
+        Posting, on_delete=CASCADE, related_name="urls"
+    )
+    url: URLField = URLField(
+        max_length=2048, db_index=True, verbose_name="URL"
+    )
+
+    def __str__(self) -> str:
+        return f"{self.url}"
+
+    objects = PostingURLQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Posting URL"
+        constraints = [
+            UniqueConstraint(
+                fields=["posting", "url"], name="single_url_per_posting"
+            )
+        ]
+
+
+class PostingCheck(Model):
+    posting: OneToOneField[Any, Any] = OneToOneField(
+        Posting, on_delete=CASCADE, related_name="url_check"
+    )
+    last_checked: DateTimeField = DateTimeField(db_index=True)
+    last_status: IntegerField = IntegerField(null=True, blank=True)
+    last_error: TextField = TextField(blank=True)
+    consecutive_failures: IntegerField = IntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.posting} | {self.last_status or self.last_error}"
+
+    class Meta:
+        verbose_name = "Posting URL check"
 
 
 class BonaFide(IntegerChoices):
@@ -265,6 +451,7 @@ class Application(Model):
         null=True, blank=True, verbose_name="Date Reported"
     )
     notes: TextField = TextField(blank=True, verbose_name="Notes")
+    modified = ModificationDateTimeField(verbose_name="modified")
 
     def __str__(self) -> str:
         return (
@@ -281,3 +468,265 @@ class Application(Model):
                 name="single_application_per_user_posting",
             )
         ]
+        indexes = [
+            Index(
+                fields=["user", "modified", "id"], name="application_changes"
+            )
+        ]
+
+
+# Deletions for the changes feed. Deleted applications keep their user
+# so only that user sees them.
+class Tombstone(Model):
+    model: CharField = CharField(max_length=50)
+    object_pk: IntegerField = IntegerField()
+    user: ForeignKey[Any, Any] = ForeignKey(
+        User, on_delete=CASCADE, null=True, blank=True
+    )
+    deleted: DateTimeField = DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:
+        return f"{self.model} {self.object_pk} | {self.deleted}"
+
+    class Meta:
+        indexes = [Index(fields=["deleted", "id"], name="tombstone_order")]
+
+
+class QueueEntryQuerySet(QuerySet):
+    def refresh(
+        self,
+        companies: Collection[int] | None = None,
+        users: Collection[int] | None = None,
+        batch_size: int = 100,
+    ) -> set[int]:
+        company_qs = Company.objects.order_by("pk")
+        if companies is not None:
+            company_qs = company_qs.filter(pk__in=companies)
+        if users is None:
+            users = list(User.objects.values_list("pk", flat=True))
+        changed_users: set[int] = set()
+        for batch in batched(
+            company_qs.values_list("pk", "name", "priority", "filed"),
+            batch_size,
+        ):
+            changed_users |= self._refresh_companies(batch, users)
+        return changed_users
+
+    def _refresh_companies(
+        self, companies: list[tuple[Any, ...]], users: Collection[int]
+    ) -> set[int]:
+        company_pks = [pk for pk, *_ in companies]
+        postings_by_company: dict[int, list[tuple[Any, ...]]] = {}
+        posting_rows = (
+            Posting.objects.filter(company__in=company_pks)
+            .order_by("-in_wa", "-created", "-pk")
+            .values_list("pk", "company", "closed", "in_wa")
+        )
+        for row in posting_rows:
+            postings_by_company.setdefault(row[1], []).append(row)
+        applied: dict[tuple[int, int], set[int]] = {}
+        for user_pk, posting_pk, company_pk in Application.objects.filter(
+            posting__company__in=company_pks, user__in=users
+        ).values_list("user", "posting", "posting__company"):
+            applied.setdefault((user_pk, company_pk), set()).add(posting_pk)
+
+        wanted = {}
+        for company_pk, name, priority, filed in companies:
+            if filed is not None:
+                continue
+            postings = postings_by_company.get(company_pk, [])
+            for user_pk in users:
+                user_applied = applied.get((user_pk, company_pk), set())
+                # Applied postings rank first, followed by open postings in
+                # WA and then the most recent; the queue shows the open
+                # postings among the top two
+                candidates = [
+                    p[0] for p in postings if p[0] in user_applied
+                ] + [
+                    p[0]
+                    for p in postings
+                    if p[2] is None and p[0] not in user_applied
+                ]
+                featured = set(candidates[:2])
+                for posting_pk, _, closed, in_wa in postings:
+                    if closed is not None or posting_pk in user_applied:
+                        continue
+                    wanted[(user_pk, posting_pk)] = (
+                        company_pk,
+                        priority,
+                        name.lower(),
+                        in_wa,
+                        posting_pk in featured,
+                    )
+
+        existing = {
+            (user_pk, posting_pk): (pk, values)
+            for pk, user_pk, posting_pk, *values in self.filter(
+                Q(company__in=company_pks)
+                | Q(posting__company__in=company_pks),
+                user__in=users,
+            ).values_list(
+                "pk",
+                "user",
+                "posting",
+                "company",
+                "priority",
+                "company_sort_name",
+                "in_wa",
+                "featured",
+            )
+        }
+        stale = {
+            key: pk for key, (pk, _) in existing.items() if key not in wanted
+        }
+        new = [key for key in wanted if key not in existing]
+        changed = [
+            key
+            for key, (_, values) in existing.items()
+            if key in wanted and tuple(values) != wanted[key]
+        ]
+        if stale:
+            self.filter(pk__in=stale.values()).delete()
+        self.bulk_create(
+            [
+                QueueEntry(**self._entry_fields(key, wanted[key]))
+                for key in new
+            ],
+            batch_size=1000,
+        )
+        self.bulk_update(
+            [
+                QueueEntry(
+                    pk=existing[key][0], **self._entry_fields(key, wanted[key])
+                )
+                for key in changed
+            ],
+            ["company", "priority", "company_sort_name", "in_wa", "featured"],
+            batch_size=1000,
+        )
+        return {user_pk for user_pk, _ in [*stale, *new, *changed]}
+
+    @staticmethod
+    def _entry_fields(
+        key: tuple[int, int], values: tuple[Any, ...]
+    ) -> dict[str, Any]:
+        company_pk, priority, company_sort_name, in_wa, featured = values
+        return {
+            "user_id": key[0],
+            "posting_id": key[1],
+            "company_id": company_pk,
+            "priority": priority,
+            "company_sort_name": company_sort_name,
+            "in_wa": in_wa,
+            "featured": featured,
+        }
+
+
+class QueueEntry(Model):
+    user: ForeignKey[Any, Any] = ForeignKey(
+        User, on_delete=CASCADE, related_name="queue_entries"
+    )
+    posting: ForeignKey[Any, Any] = ForeignKey(
+        Posting, on_delete=CASCADE, related_name="queue_entries"
+    )
+    company: ForeignKey[Any, Any] = ForeignKey(
+        Company, on_delete=CASCADE, related_name="queue_entries"
+    )
+    priority: IntegerField = IntegerField(choices=Priority.choices)
+    company_sort_name: CharField = CharField(max_length=500)
+    in_wa: BooleanField = BooleanField()
+    featured: BooleanField = BooleanField(
+        help_text="Shown in the postings queue"
+    )
+
+    def __str__(self) -> str:
+        return f"{self.user.username} | {self.posting}"
+
+    objects = QueueEntryQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Queue entry"
+        verbose_name_plural = "Queue entries"
+        constraints = [
+            UniqueConstraint(
+                fields=["user", "posting"],
+                name="single_queue_entry_per_user_posting",
+            )
+        ]
+        indexes = [
+            Index(
+                fields=["user", "-priority", "company_sort_name", "posting"],
+                name="queue_entry_order",
+            ),
+            Index(
+                fields=[
+                    "user",
+                    "featured",
+                    "-priority",
+                    "company_sort_name",
+                    "-in_wa",
+                    "posting",
+                ],
+                name="queue_entry_featured_order",
+            ),
+        ]
+
+
+class LeaderboardEntryQuerySet(QuerySet):
+    def refresh(
+        self,
+        companies: Collection[int] | None = None,
+        users: Collection[int] | None = None,
+    ) -> int:
+        applications = Application.objects.order_by()
+        if users is None and companies is not None:
+            users = set(
+                applications.filter(
+                    posting__company__in=companies
+                ).values_list("user", flat=True)
+            )
+        entries = self.all()
+        if users is not None:
+            applications = applications.filter(user__in=users)
+            entries = entries.filter(user__in=users)
+        counts = dict(
+            applications.values("user")
+            .annotate(count=Count("posting__company", distinct=True))
+            .values_list("user", "count")
+        )
+        entries.exclude(user__in=counts).delete()
+        self.bulk_create(
+            [
+                LeaderboardEntry(user_id=user_pk, company_count=count)
+                for user_pk, count in counts.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=["company_count"],
+            batch_size=1000,
+        )
+        return len(counts)
+
+
+class LeaderboardEntry(Model):
+    user: OneToOneField[Any, Any] = OneToOneField(
+        User,
+        on_delete=CASCADE,
+        primary_key=True,
+        related_name="leaderboard_entry",
+    )
+    company_count: IntegerField = IntegerField(
+        verbose_name="Companies applied"
+    )
+
+    def __str__(self) -> str:
+        return f"{self.user.username} | {self.company_count}"
+
+    objects = LeaderboardEntryQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Leaderboard entry"
+        verbose_name_plural = "Leaderboard entries"
+        indexes = [
+            Index(fields=["-company_count"], name="leaderboard_order"),
+        ]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import AsyncIterator, Collection
+
+from django.db import transaction
+
+from ..utils.broker import get_broker
+
+QUEUE_CHANGED = "queue"
+
+# Streams end after a while and browsers reconnect with Last-Event-ID,
+# so no connection outlives a deploy for long
+STREAM_DURATION = 300
+STREAM_KEEPALIVE = 15
+STREAM_RETRY_MS = 5000
+
+
+def user_channel(pk: int) -> str:
+    return f"user:{pk}"
+
+
+def notify_queue_changed(users: Collection[int], reason: str) -> None:
+    channels = [user_channel(pk) for pk in sorted(users)]
+
+    def publish() -> None:
+        broker = get_broker()
+        for channel in channels:
+            broker.publish(channel, QUEUE_CHANGED, {"reason": reason})
+
+    transaction.on_commit(publish)
+
+
+async def event_stream(
+    channels: Collection[str], after: int | None
+) -> AsyncIterator[str]:
+    broker = get_broker()
+    deadline = time.monotonic() + STREAM_DURATION
+    yield f"retry: {STREAM_RETRY_MS}\n\n"
+    while (remaining := deadline - time.monotonic()) > 0:
+        events, after = await broker.alisten(
+            channels, after, min(STREAM_KEEPALIVE, remaining)
+        )
+        if not events:
+            yield ": keepalive\n\n"
+        for event in events:
+            yield (
+                f"id: {event.id}\nevent: {event.name}\n"
+                f"data: {json.dumps(event.data)}\n\n"
+            )
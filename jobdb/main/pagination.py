@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from contextlib import suppress
+from dataclasses import dataclass, replace
+from functools import cached_property, reduce
+from operator import or_
+from typing import Any, Literal
+
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import F, OrderBy, Q, QuerySet
+from django_tables2.rows import BoundRows  # type: ignore
+
+from ..utils.cache import DATA_SCOPES, memoize
+
+CountMode = Literal["exact", "cached", "estimated", "none"]
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def cached_query(
+    name: str, queryset: QuerySet, scopes: list[str], evaluate: Any = list
+) -> Any:
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return evaluate(queryset.none())
+    return memoize(
+        name, scopes, lambda: evaluate(queryset), queryset.db, sql, params
+    )
+
+
+def cached_count(queryset: QuerySet, scopes: list[str] = DATA_SCOPES) -> int:
+    return int(
+        cached_query(
+            "pagination-count", queryset, scopes, lambda qs: qs.count()
+        )
+    )
+
+
+def estimated_count(
+    queryset: QuerySet, scopes: list[str] = DATA_SCOPES
+) -> int:
+    if connections[queryset.db].vendor != "postgresql":
+        return cached_count(queryset, scopes)
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_rows(
+    queryset: QuerySet, mode: CountMode, scopes: list[str] = DATA_SCOPES
+) -> int | None:
+    if mode == "none":
+        return None
+    if mode == "cached":
+        return cached_count(queryset, scopes)
+    if mode == "estimated":
+        return estimated_count(queryset, scopes)
+    return queryset.count()
+
+
+@dataclass(frozen=True)
+class Key:
+    alias: str
+    expression: Any
+    descending: bool
+    nulls_first: bool
+
+    def reversed(self) -> Key:
+        return replace(
+            self,
+            descending=not self.descending,
+            nulls_first=not self.nulls_first,
+        )
+
+    def after(self, value: Any) -> Q | None:
+        if value is None:
+            return (
+                Q(**{f"{self.alias}__isnull": False})
+                if self.nulls_first
+                else None
+            )
+        lookup = "lt" if self.descending else "gt"
+        condition = Q(**{f"{self.alias}__{lookup}": value})
+        if not self.nulls_first:
+            condition |= Q(**{f"{self.alias}__isnull": True})
+        return condition
+
+    def equal(self, value: Any) -> Q:
+        if value is None:
+            return Q(**{f"{self.alias}__isnull": True})
+        return Q(**{self.alias: value})
+
+
+def queryset_ordering(queryset: QuerySet) -> list[Any]:
+    ordering = list(queryset.query.order_by)
+    if not ordering and queryset.query.default_ordering:
+        ordering = list(queryset.model._meta.ordering)
+    if not {"pk", "-pk", "id", "-id"} & {
+        o for o in ordering if isinstance(o, str)
+    }:
+        ordering.append("pk")
+    return ordering
+
+
+def ordering_keys(queryset: QuerySet, ordering: list[Any]) -> list[Key]:
+    nulls_largest = connections[queryset.db].features.nulls_order_largest
+    keys = []
+    for i, item in enumerate(ordering):
+        expression: Any = item
+        nulls_first = None
+        if isinstance(item, str):
+            descending = item.startswith("-")
+            expression = F(item.removeprefix("-"))
+        elif isinstance(item, OrderBy):
+            descending = item.descending
+            expression = item.expression
+            if item.nulls_first or item.nulls_last:
+                nulls_first = bool(item.nulls_first)
+        else:
+            descending = False
+        if nulls_first is None:
+            nulls_first = descending == nulls_largest
+        keys.append(
+            Key(
+                alias=f"_keyset_{i}",
+                expression=expression,
+                descending=descending,
+                nulls_first=nulls_first,
+            )
+        )
+    return keys
+
+
+class Keyset:
+    def __init__(self, queryset: QuerySet):
+        ordering = queryset_ordering(queryset)
+        self.keys = ordering_keys(queryset, ordering)
+        self.queryset = queryset.order_by(*ordering).annotate(
+            **{key.alias: key.expression for key in self.keys}
+        )
+        self.signature = hashlib.sha1(
+            repr(
+                [(str(k.expression), k.descending) for k in self.keys]
+            ).encode()
+        ).hexdigest()[:8]
+
+    def cursor(self, record: Any, reverse: bool = False) -> str:
+        if isinstance(record, dict):
+            values = [record[key.alias] for key in self.keys]
+        else:
+            values = [getattr(record, key.alias) for key in self.keys]
+        data = {
+            "v": values,
+            "r": reverse,
+            "s": self.signature,
+        }
+        return base64.urlsafe_b64encode(
+            json.dumps(data, default=str).encode()
+        ).decode()
+
+    def decode(self, cursor: str) -> tuple[list[Any], bool]:
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            values, reverse, signature = data["v"], data["r"], data["s"]
+        except (ValueError, TypeError, KeyError) as e:
+            raise InvalidCursor(cursor) from e
+        if signature != self.signature or len(values) != len(self.keys):
+            raise InvalidCursor(cursor)
+        return values, bool(reverse)
+
+    def filter(self, values: list[Any], reverse: bool = False) -> QuerySet:
+        keys = [k.reversed() for k in self.keys] if reverse else self.keys
+        conditions = []
+        equal = Q()
+        for key, value in zip(keys, values):
+            if (after := key.after(value)) is not None:
+                conditions.append(equal & after)
+            equal &= key.equal(value)
+        if not conditions:
+            return self.queryset.none()
+        queryset = self.queryset.filter(reduce(or_, conditions))
+        return queryset.reverse() if reverse else queryset
+
+    def page(
+        self, cursor: str, size: int, fetch: Any = list
+    ) -> tuple[list[Any], bool, bool]:
+        values, reverse = self.decode(cursor)
+        records = fetch(self.filter(values, reverse)[: size + 1])
+        has_more = len(records) > size
+        records = records[:size]
+        if reverse:
+            return records[::-1], True, has_more
+        return records, has_more, True
+
+
+class KeysetPage(Page):
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+
+class KeysetPaginator(Paginator):
+    def __init__(
+        self,
+        object_list: Any,
+        per_page: int,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
+        cache_rows: bool = False,
+        cache_scopes: list[str] = DATA_SCOPES,
+    ):
+        super().__init__(object_list, per_page)
+        self.rows = object_list
+        self.cursor = cursor
+        self.count_mode = count_mode
+        self.cache_rows = cache_rows
+        self.cache_scopes = cache_scopes
+        self.keyset = Keyset(object_list.data.data)
+
+    @cached_property
+    def count(self) -> int:
+        if self.count_mode in ("cached", "estimated"):
+            return (
+                count_rows(
+                    self.rows.data.data, self.count_mode, self.cache_scopes
+                )
+                or 0
+            )
+        return int(super().count)
+
+    def fetch(self, queryset: QuerySet) -> list[Any]:
+        if self.cache_rows:
+            return list(
+                cached_query("pagination-rows", queryset, self.cache_scopes)
+            )
+        return list(queryset)
+
+    def validate_number(self, number: Any) -> int:
+        if self.count_mode != "none":
+            return super().validate_number(number)
+        try:
+            page_number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger("That page number is not an integer")
+        if page_number < 1:
+            raise EmptyPage("That page number is less than 1")
+        return page_number
+
+    def page(self, number: Any) -> KeysetPage:
+        number = self.validate_number(number)
+        records = None
+        if self.cursor:
+            with suppress(InvalidCursor):
+                records, has_next, has_previous = self.keyset.page(
+                    self.cursor, self.per_page, self.fetch
+                )
+        # The tables only link to cursors, so this OFFSET scan serves the
+        # first page and page numbers typed into the URL
+        if records is None:
+            bottom = (number - 1) * self.per_page
+            top = bottom + self.per_page + 1
+            records = self.fetch(self.keyset.queryset[bottom:top])
+            has_next = len(records) > self.per_page
+            has_previous = number > 1
+            records = records[: self.per_page]
+        if self.count_mode == "none":
+            if not records and number > 1:
+                raise EmptyPage("That page contains no results")
+            self.count = (number - 1) * self.per_page + len(records)
+            self.count += has_next
+        rows = BoundRows(
+            data=records,
+            table=self.rows.table,
+            pinned_data=self.rows.pinned_data,
+        )
+        page = KeysetPage(rows, number, self)
+        if records and has_next:
+            page.next_cursor = self.keyset.cursor(records[-1])
+        if records and has_previous:
+            page.previous_cursor = self.keyset.cursor(records[0], reverse=True)
+        return page
@@ -2,15 +2,15 @@ from django.db.models import (
     Count,
     Exists,
     F,
+    FilteredRelation,
     OuterRef,
     Q,
     QuerySet,
     Subquery,
-    Window,
 )
-from django.db.models.functions import Coalesce, Lower, RowNumber
+from django.db.models.functions import Coalesce, Lower
 
-from .models import Application, Company, Posting, User
+from .models import Application, Company, LeaderboardEntry, Posting, User
 
 
 def posting_with_applications(
@@ -27,148 +27,39 @@ def posting_with_applications(
 
 
 def posting_queue_set(user: User, ordered: bool = True) -> QuerySet:
-    qs = posting_with_applications(
-        user=user,
-        queryset=Posting.objects.filter(closed=None, company__filed=None),
-    ).filter(has_application=False)
+    qs = Posting.objects.filter(queue_entries__user=user)
     if ordered:
-        qs = qs.order_by("-company__priority", Lower("company__name"), "pk")
+        qs = qs.order_by(
+            "-queue_entries__priority",
+            "queue_entries__company_sort_name",
+            "pk",
+        )
     return qs
 
 
 def company_posting_queue_set(user: User) -> QuerySet:
-    base_qs = posting_with_applications(
-        user, queryset=Posting.objects.filter(company__filed=None)
-    )
-    windowed_qs = (
-        base_qs.filter(
-            Q(has_application=True)
-            | (Q(has_application=False) & Q(closed=None))
-        )
-        .annotate(
-            row_number=Window(
-                expression=RowNumber(),
-                partition_by=[F("company")],
-                order_by=["-has_application", "-in_wa", "-created"],
-            )
-        )
-        .order_by("row_number")
-        .filter(row_number__lte=2)
-    )
-    qs = base_qs.filter(
-        pk__in=Subquery(windowed_qs.values("pk")), has_application=False
+    qs = Posting.objects.filter(
+        queue_entries__user=user, queue_entries__featured=True
     )
     return qs.order_by(
-        "-company__priority", Lower("company__name"), "-in_wa", "pk"
+        "-queue_entries__priority",
+        "queue_entries__company_sort_name",
+        "-queue_entries__in_wa",
+        "pk",
     )
 
 
 def posting_queue_companies_count(user: User) -> QuerySet:
-    queryset = Company.objects.all()
-    assert isinstance(queryset, QuerySet)
-    return (
-        queryset.annotate(
-            count=Coalesce(
-                Subquery(
-                    company_posting_queue_set(user)
-                    .filter(company=OuterRef("pk"))
-                    .order_by()
-                    .values("company")
-                    .annotate(count=Count("pk"))
-                    .values("count")
-                ),
-                0,
-            ),
-            count_in_wa=Coalesce(
-                Subquery(
-                    company_posting_queue_set(user)
-                    .filter(in_wa=True)
-                    .filter(company=OuterRef("pk"))
-                    .order_by()
-                    .values("company")
-                    .annotate(count=Count("pk"))
-                    .values("count")
-                ),
-                0,
-            ),
-        )
-        .filter(count__gt=0)
-        .order_by("-priority", "-count", Lower("name"))
-    )
-
-
-def companies_with_posting_counts() -> QuerySet:
-    queryset = Company.objects.all().annotate(
-        posting_count=Count("posting"),
-        open_posting_count=Coalesce(
-            Subquery(
-                Posting.objects.filter(closed=None)
-                .filter(company=OuterRef("pk"))
-                .values("company")
-                .annotate(count=Count("pk"))
-                .values("count")
-            ),
-            0,
-        ),
-    )
-    assert isinstance(queryset, QuerySet)
-    return queryset
-
-
-def companies_with_counts() -> QuerySet:
-    queryset = companies_with_posting_counts().annotate(
-        apps_count=Coalesce(
-            Subquery(
-                Application.objects.filter(posting__company=OuterRef("pk"))
-                .values("posting__company")
-                .annotate(count=Count("pk"))
-                .values("count"),
-            ),
-            0,
-        ),
-        reported_apps_count=Coalesce(
-            Subquery(
-                Application.objects.filter(reported__isnull=False)
-                .filter(posting__company=OuterRef("pk"))
-                .values("posting__company")
-                .annotate(count=Count("pk"))
-                .values("count"),
-            ),
-            0,
-        ),
-        available_count=F("open_posting_count") + F("apps_count"),
+    queryset = Company.objects.filter(
+        queue_entries__user=user, queue_entries__featured=True
     )
     assert isinstance(queryset, QuerySet)
-    return queryset
-
-
-def companies_with_wa_counts() -> QuerySet:
-    queryset = companies_with_counts().annotate(
-        wa_open_posting_count=Coalesce(
-            Subquery(
-                Posting.objects.filter(in_wa=True, closed=None)
-                .filter(company=OuterRef("pk"))
-                .values("company")
-                .annotate(count=Count("pk"))
-                .values("count")
-            ),
-            0,
-        ),
-        wa_apps_count=Coalesce(
-            Subquery(
-                Application.objects.filter(
-                    posting__in_wa=True, posting__company=OuterRef("pk")
-                )
-                .values("posting__company")
-                .annotate(count=Count("pk"))
-                .values("count"),
-            ),
-            0,
+    return queryset.annotate(
+        count=Count("queue_entries"),
+        count_in_wa=Count(
+            "queue_entries", filter=Q(queue_entries__in_wa=True)
         ),
-        wa_available_count=F("wa_open_posting_count") + F("wa_apps_count"),
-    )
-    assert isinstance(queryset, QuerySet)
-    return queryset
+    ).order_by("-priority", "-count", Lower("name"))
 
 
 def user_application_companies(user: User) -> QuerySet:
@@ -208,8 +99,35 @@ def user_application_companies(user: User) -> QuerySet:
 
 
 def user_companies_leaderboard() -> QuerySet:
-    return (
-        Application.objects.values("user__username", "user__first_name")
-        .annotate(count=Count("posting__company", distinct=True))
-        .order_by("-count", "user__username")
+    return LeaderboardEntry.objects.values(
+        "user__username", "user__first_name", count=F("company_count")
+    ).order_by("-company_count", "user__username")
+
+
+def dashboard_stats(user: User) -> dict[str, int]:
+    posting_stats = Posting.objects.annotate(
+        user_queue=FilteredRelation(
+            "queue_entries", condition=Q(queue_entries__user=user)
+        )
+    ).aggregate(
+        posting_count=Count("pk"),
+        open_posting_count=Count("pk", filter=Q(closed=None)),
+        companies_with_postings_count=Count(
+            "company", distinct=True, filter=Q(closed=None)
+        ),
+        posting_queue_count=Count("user_queue"),
+        company_posting_queue_count=Count(
+            "user_queue", filter=Q(user_queue__featured=True)
+        ),
+        posting_queue_companies_count=Count(
+            "user_queue__company",
+            distinct=True,
+            filter=Q(user_queue__featured=True),
+        ),
+    )
+    application_stats = Application.objects.filter(user=user).aggregate(
+        your_apps_count=Count("pk"),
+        unreported_apps_count=Count("pk", filter=Q(reported=None)),
+        your_apps_company_count=Count("posting__company", distinct=True),
     )
+    return posting_stats | application_stats
@@ -41,6 +41,7 @@ class CompanyResource(ModelResourceWithoutPK):
 
     class Meta:
         model = Company
+        exclude = Company.COUNTER_FIELDS
 
 
 class PostingResource(ModelResourceWithoutPK):
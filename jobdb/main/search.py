@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+from typing import Any
+
+from django.db import connections
+from django.db.models import Case, FloatField, Model, Q, QuerySet, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce, Greatest
+
+from .models import Application, Company, Posting
+
+# Text columns with a search index, created by migrations. On SQLite
+# these are FTS5 tables using the trigram tokenizer, kept in sync by
+# triggers. On PostgreSQL these are pg_trgm GIN indexes matching the SQL
+# Django generates for __icontains.
+SEARCH_INDEXES: dict[type[Model], list[str]] = {
+    Company: ["name", "url", "notes"],
+    Posting: ["title", "url", "notes"],
+    Application: ["notes"],
+}
+
+# Trigram indexes cannot match shorter values
+MIN_SEARCH_LENGTH = 3
+
+
+def resolve_field(model: type[Model], path: str) -> tuple[str, Any, str]:
+    *relations, column = path.split("__")
+    for name in relations:
+        model = model._meta.get_field(name).related_model  # type: ignore
+    return "__".join(relations), model, column
+
+
+def sqlite_search(
+    queryset: QuerySet, value: str, fields: list[str]
+) -> list[Q]:
+    groups: dict[str, tuple[type[Model], list[str]]] = {}
+    for path in fields:
+        relation, model, column = resolve_field(queryset.model, path)
+        if column not in SEARCH_INDEXES.get(model, []):
+            raise ValueError(f"{path} has no search index")
+        groups.setdefault(relation, (model, []))[1].append(column)
+    phrase = '"' + value.replace('"', '""') + '"'
+    conditions = []
+    for relation, (model, columns) in groups.items():
+        table = model._meta.db_table
+        index = f"{table}_search"
+        query = f"{{{' '.join(columns)}}} : {phrase}"
+        matches = RawSQL(
+            f"SELECT rowid FROM {index} WHERE {index} MATCH %s", [query]
+        )
+        conditions.append(
+            Q(**{f"{relation}__in" if relation else "pk__in": matches})
+        )
+    return conditions
+
+
+# Earlier fields weigh more, so name matches outrank notes matches
+def field_rank(value: str, fields: list[str]) -> Any:
+    return sum(
+        (
+            Case(
+                When(
+                    Q(**{f"{field}__icontains": value}),
+                    then=Value(float(weight)),
+                ),
+                default=Value(0.0),
+            )
+            for weight, field in enumerate(reversed(fields), 1)
+        ),
+        Value(0.0),
+    )
+
+
+def postgres_search(
+    queryset: QuerySet, value: str, fields: list[str]
+) -> tuple[list[Q], Any]:
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    similarities = [TrigramWordSimilarity(value, field) for field in fields]
+    return [Q(**{f"{field}__icontains": value}) for field in fields], (
+        Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+    )
+
+
+def search(queryset: QuerySet, value: str, fields: list[str]) -> QuerySet:
+    vendor = connections[queryset.db].vendor
+    if vendor == "postgresql":
+        conditions, rank = postgres_search(queryset, value, fields)
+    elif vendor == "sqlite" and len(value) >= MIN_SEARCH_LENGTH:
+        conditions = sqlite_search(queryset, value, fields)
+        rank = field_rank(value, fields)
+    else:
+        conditions = [Q(**{f"{field}__icontains": value}) for field in fields]
+        rank = field_rank(value, fields)
+    if value.replace(".", "", 1).isdigit():
+        conditions.append(Q(pk=Decimal(value)))
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    return (
+        queryset.filter(reduce(or_, conditions))
+        .annotate(
+            search_rank=Coalesce(rank, Value(0.0), output_field=FloatField())
+        )
+        .order_by("-search_rank", *ordering)
+    )
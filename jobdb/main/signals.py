@@ -0,0 +1,179 @@
+from collections.abc import Collection
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+
+from ..utils.cache import invalidate
+from .changes import record_deletion
+from .models import (
+    Application,
+    Company,
+    LeaderboardEntry,
+    Posting,
+    PostingURL,
+    QueueEntry,
+    User,
+)
+from .notifications import notify_queue_changed
+
+# Sent after postings, companies or applications change. Receivers are
+# passed the affected company and user primary keys, or None for all,
+# and whether any posting moved to another company.
+# Code that bypasses Model.save(), such as QuerySet.update() or
+# bulk_create(), sends this signal itself.
+data_changed = Signal()
+
+
+def send_data_changed(
+    sender: type,
+    companies: Collection[int] | None = None,
+    users: Collection[int] | None = None,
+    moved: bool = False,
+) -> None:
+    data_changed.send(
+        sender=sender,
+        companies=None if companies is None else set(companies),
+        users=None if users is None else set(users),
+        moved=moved,
+    )
+
+
+@receiver(data_changed)
+def refresh_posting_queue(
+    sender: type,
+    companies: set[int] | None,
+    users: set[int] | None,
+    **kwargs: Any,
+) -> None:
+    changed = QueueEntry.objects.refresh(  # type: ignore
+        companies=companies, users=users
+    )
+    if changed:
+        notify_queue_changed(changed, sender.__name__)
+
+
+@receiver(data_changed)
+def recount_companies(
+    sender: type, companies: set[int] | None, **kwargs: Any
+) -> None:
+    if sender not in {Posting, Application}:
+        return
+    queryset = Company.objects.all()
+    if companies is not None:
+        queryset = queryset.filter(pk__in=companies)
+    with transaction.atomic():
+        queryset.recount()  # type: ignore
+
+
+@receiver(data_changed)
+def invalidate_caches(
+    sender: type, users: set[int] | None, **kwargs: Any
+) -> None:
+    scopes = [sender.__name__]
+    if users is None:
+        scopes.append("users")
+    else:
+        scopes.extend(f"user:{pk}" for pk in users)
+    invalidate(scopes)
+
+
+@receiver(data_changed)
+def refresh_leaderboard(
+    sender: type,
+    companies: set[int] | None,
+    users: set[int] | None,
+    moved: bool,
+    **kwargs: Any,
+) -> None:
+    # Posting writes only change which companies users applied to when
+    # the posting moves to another company
+    if sender is Application or (sender is Posting and moved):
+        LeaderboardEntry.objects.refresh(  # type: ignore
+            companies=companies, users=users
+        )
+
+
+@receiver(post_save, sender=Posting)
+def sync_posting_urls(
+    sender: type[Posting], instance: Posting, **kwargs: Any
+) -> None:
+    PostingURL.objects.sync([instance])  # type: ignore
+
+
+@receiver(pre_save, sender=Posting)
+def posting_saving(
+    sender: type[Posting], instance: Posting, **kwargs: Any
+) -> None:
+    instance._previous_company = (
+        Posting.objects.filter(pk=instance.pk)
+        .values_list("company", flat=True)
+        .first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=Posting)
+def posting_saved(
+    sender: type[Posting], instance: Posting, **kwargs: Any
+) -> None:
+    companies = {instance.company_id}
+    if (previous := getattr(instance, "_previous_company", None)) is not None:
+        companies.add(previous)
+    send_data_changed(sender, companies=companies, moved=len(companies) > 1)
+
+
+@receiver(post_delete, sender=Posting)
+def posting_deleted(
+    sender: type[Posting], instance: Posting, **kwargs: Any
+) -> None:
+    send_data_changed(sender, companies=[instance.company_id])
+
+
+@receiver([post_save, post_delete], sender=Company)
+def company_changed(
+    sender: type[Company], instance: Company, **kwargs: Any
+) -> None:
+    send_data_changed(sender, companies=[instance.pk])
+
+
+@receiver(pre_save, sender=Application)
+def application_saving(
+    sender: type[Application], instance: Application, **kwargs: Any
+) -> None:
+    instance._previous = (  # type: ignore
+        Application.objects.filter(pk=instance.pk)
+        .values_list("user", "posting__company")
+        .first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver([post_save, post_delete], sender=Application)
+def application_changed(
+    sender: type[Application], instance: Application, **kwargs: Any
+) -> None:
+    users = {instance.user_id}  # type: ignore
+    companies = {instance.posting.company_id}
+    if previous := getattr(instance, "_previous", None):
+        users.add(previous[0])
+        companies.add(previous[1])
+    send_data_changed(sender, companies=companies, users=users)
+
+
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Posting)
+@receiver(post_delete, sender=Application)
+def record_tombstone(sender: type, instance: Any, **kwargs: Any) -> None:
+    record_deletion(instance)
+
+
+@receiver(post_save, sender=User)
+def user_saved(
+    sender: type[User], instance: User, created: bool, **kwargs: Any
+) -> None:
+    if created:
+        send_data_changed(sender, users=[instance.pk])
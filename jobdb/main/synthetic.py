@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import accumulate
+from typing import Any
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Max, Model
+from django.utils import timezone
+
+from ..utils.cache import DATA_SCOPES, invalidate
+from .models import (
+    Application,
+    Company,
+    LeaderboardEntry,
+    Posting,
+    PostingURL,
+    Priority,
+    QueueEntry,
+    User,
+)
+from .utils import batched
+
+TITLE_LEVELS = ["", "Senior ", "Staff ", "Principal ", "Lead "]
+TITLE_ROLES = [
+    "Software Engineer",
+    "Site Reliability Engineer",
+    "Data Engineer",
+    "Product Manager",
+    "Engineering Manager",
+    "Security Engineer",
+    "Solutions Architect",
+]
+LOCATIONS = [
+    ("Seattle, WA", True, ""),
+    ("Bellevue, WA", True, ""),
+    ("Remote", True, "Remote in Washington"),
+    ("Remote", False, ""),
+    ("San Francisco, CA", False, ""),
+    ("New York, NY", False, ""),
+]
+EMPLOYEES = ["15", "11-50", "75", "51-200", "250", "1000", "5k", "10000"]
+PRIORITIES = [(Priority.HIGH, 10), (Priority.NORMAL, 75), (Priority.LOW, 15)]
+LINKEDIN_URL = "https://www.linkedin.com/jobs/view/"
+POSTING_HOSTS = [
+    ("careers", 25),
+    ("greenhouse", 20),
+    ("lever", 20),
+    ("ashby", 20),
+    ("workday", 10),
+    ("linkedin", 5),
+]
+
+
+@dataclass
+class Scale:
+    companies: int = 100
+    postings: int = 2000
+    users: int = 5
+    applications: int = 500
+    closed: float = 0.3
+    filed: float = 0.05
+    job_board_urls: float = 0.5
+
+
+class Generator:
+    def __init__(
+        self,
+        scale: Scale,
+        seed: int = 0,
+        batch_size: int = 1000,
+        rebuild: bool = True,
+        log: Callable[[str], None] | None = None,
+    ):
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.rebuild = rebuild
+        self.log = log or (lambda message: None)
+        self.now = timezone.now()
+
+    @staticmethod
+    def next_pk(model: type[Model]) -> int:
+        return (model.objects.aggregate(max_pk=Max("pk"))["max_pk"] or 0) + 1
+
+    def run(self) -> None:
+        with transaction.atomic():
+            company_pks = self.create_companies()
+            posting_pks = self.create_postings(company_pks)
+            user_pks = self.create_users()
+            self.create_applications(user_pks, posting_pks)
+            invalidate(DATA_SCOPES)
+            if not self.rebuild:
+                return
+            self.log("Rebuilding postings queue")
+            QueueEntry.objects.refresh()  # type: ignore
+            self.log("Recounting companies")
+            Company.objects.recount()  # type: ignore
+            self.log("Rebuilding leaderboard")
+            LeaderboardEntry.objects.refresh()  # type: ignore
+
+    def choice(self, weighted: list[tuple[Any, int]]) -> Any:
+        values, weights = zip(*weighted)
+        return self.rng.choices(values, weights=weights)[0]
+
+    def uuid(self) -> str:
+        return str(UUID(int=self.rng.getrandbits(128), version=4))
+
+    def create_companies(self) -> list[int]:
+        start = self.next_pk(Company)
+        for batch in batched(
+            range(start, start + self.scale.companies), self.batch_size
+        ):
+            Company.objects.bulk_create(
+                [self.make_company(number) for number in batch]
+            )
+        self.log(f"Created {self.scale.companies} companies")
+        return list(
+            Company.objects.filter(name__startswith="Synthetic ")
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+
+    def make_company(self, number: int) -> Company:
+        company = Company(
+            name=f"Synthetic {number:07d}",
+            hq=self.rng.choice(LOCATIONS)[0],
+            url=f"https://company{number}.example.com",
+            careers_url=f"https://company{number}.example.com/careers",
+            careers_urls=(
+                [f"https://jobs.lever.co/company{number}"]
+                if self.rng.random() < 0.2
+                else None
+            ),
+            employees_est=self.rng.choice(EMPLOYEES),
+            employees_est_source="Synthetic",
+            how_found="Synthetic",
+            priority=self.choice(PRIORITIES),
+            filed=(
+                self.now - timedelta(days=self.rng.randrange(1, 365))
+                if self.rng.random() < self.scale.filed
+                else None
+            ),
+        )
+        company.employees_est_num = company.employees_est_as_num
+        return company
+
+    def create_postings(self, company_pks: list[int]) -> list[int]:
+        if not company_pks:
+            return []
+        # A few companies have most of the postings
+        weights = list(
+            accumulate(
+                1 / (rank + 1) ** 0.8
+                for rank in self.rng.sample(
+                    range(len(company_pks)), len(company_pks)
+                )
+            )
+        )
+        start = self.next_pk(Posting)
+        created = 0
+        for batch in batched(
+            range(start, start + self.scale.postings), self.batch_size
+        ):
+            companies = self.rng.choices(
+                company_pks, cum_weights=weights, k=len(batch)
+            )
+            postings = Posting.objects.bulk_create(
+                [
+                    self.make_posting(number, company_pk)
+                    for number, company_pk in zip(batch, companies)
+                ]
+            )
+            PostingURL.objects.bulk_create(
+                [
+                    PostingURL(posting_id=posting.pk, url=url)
+                    for posting in postings
+                    for url in posting.all_urls
+                ]
+            )
+            created += len(postings)
+        self.log(f"Created {created} postings")
+        return list(
+            Posting.objects.filter(company__in=company_pks)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+
+    def make_posting(self, number: int, company_pk: int) -> Posting:
+        title = self.rng.choice(TITLE_LEVELS) + self.rng.choice(TITLE_ROLES)
+        location, in_wa, wa_jurisdiction = self.rng.choice(LOCATIONS)
+        url = self.posting_url(number, company_pk, title)
+        job_board_urls = []
+        if not url.startswith(LINKEDIN_URL):
+            if self.rng.random() < self.scale.job_board_urls:
+                job_board_urls.append(f"{LINKEDIN_URL}{number + 10**9}/")
+            if self.rng.random() < self.scale.job_board_urls / 5:
+                job_board_urls.append(
+                    f"https://www.indeed.com/viewjob?jk={number:016x}"
+                )
+        return Posting(
+            company_id=company_pk,
+            url=url,
+            job_board_urls=job_board_urls or None,
+            title=title,
+            closed=(
+                self.now - timedelta(days=self.rng.randrange(1, 365))
+                if self.rng.random() < self.scale.closed
+                else None
+            ),
+            in_wa=in_wa,
+            location=location,
+            wa_jurisdiction=wa_jurisdiction,
+        )
+
+    def posting_url(self, number: int, company_pk: int, title: str) -> str:
+        slug = f"company{company_pk}"
+        host = self.choice(POSTING_HOSTS)
+        if host == "greenhouse":
+            return f"https://boards.greenhouse.io/{slug}/jobs/{number}"
+        if host == "lever":
+            return f"https://jobs.lever.co/{slug}/{self.uuid()}"
+        if host == "ashby":
+            return f"https://jobs.ashbyhq.com/{slug}/{self.uuid()}"
+        if host == "workday":
+            title_slug = title.replace(" ", "-")
+            return (
+                f"https://{slug}.wd5.myworkdayjobs.com/en-US/External/job"
+                f"/Seattle-WA/{title_slug}_R{number}"
+            )
+        if host == "linkedin":
+            return f"{LINKEDIN_URL}{number + 10**9}/"
+        return f"https://{slug}.example.com/careers/jobs/{number}"
+
+    def create_users(self) -> list[int]:
+        User.objects.bulk_create(
+            [
+                User(username=f"synthetic{number}")
+                for number in range(self.scale.users)
+            ],
+            ignore_conflicts=True,
+        )
+        self.log(f"Created {self.scale.users} users")
+        return list(
+            User.objects.filter(username__startswith="synthetic")
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+
+    def create_applications(
+        self, user_pks: list[int], posting_pks: list[int]
+    ) -> None:
+        if not user_pks or not posting_pks:
+            return
+        per_user = min(
+            len(posting_pks), self.scale.applications // len(user_pks)
+        )
+        for user_pk in user_pks:
+            for batch in batched(
+                self.rng.sample(posting_pks, per_user), self.batch_size
+            ):
+                Application.objects.bulk_create(
+                    [
+                        self.make_application(user_pk, posting_pk)
+                        for posting_pk in batch
+                    ],
+                    ignore_conflicts=True,
+                )
+        self.log(f"Created {per_user * len(user_pks)} applications")
+
+    def make_application(self, user_pk: int, posting_pk: int) -> Application:
+        applied = self.now - timedelta(days=self.rng.randrange(1, 365))
+        return Application(
+            user_id=user_pk,
+            posting_id=posting_pk,
+            applied=applied,
+            reported=(
+                applied + timedelta(days=7)
+                if self.rng.random() < 0.6
+                else None
+            ),
+        )
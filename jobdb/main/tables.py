@@ -132,6 +132,8 @@ class CompanyHTMxTable(Table):
     priority = Column(attrs={"th": {"style": "width: 200px;"}})
     filed = Column(visible=False)
 
+    export_values = {"careers_urls": ["careers_url", "careers_urls"]}
+
     class Meta:
         model = Company
         template_name = "main/bootstrap_htmx.html"
@@ -242,6 +244,19 @@ class QueueHTMxTable(Table):
         verbose_name="Added", attrs={"th": {"style": "width: 200px;"}}
     )
 
+    select_related = ["company"]
+    only = [
+        "company__name",
+        "company__priority",
+        "job_board_urls",
+        "url",
+        "title",
+        "closed",
+        "in_wa",
+        "created",
+        "notes",
+    ]
+
     class Meta:
         model = Posting
         template_name = "main/bootstrap_htmx.html"
@@ -318,6 +333,8 @@ class PostingHTMxTable(QueueHTMxTable):
     wa_jurisdiction = Column(visible=False)
     notes = Column(visible=False)
 
+    only = QueueHTMxTable.only + ["location", "wa_jurisdiction"]
+
     class Meta:
         model = Posting
         template_name = "main/bootstrap_htmx.html"
@@ -363,6 +380,18 @@ class ApplicationHTMxTable(Table):
     )
     reported = DateTimeColumn(attrs={"th": {"style": "width: 150px;"}})
 
+    select_related = ["posting__company"]
+    only = [
+        "posting__company__name",
+        "posting__url",
+        "posting__title",
+        "posting__in_wa",
+        "applied",
+        "reported",
+        "bona_fide",
+        "notes",
+    ]
+
     class Meta:
         model = Application
         template_name = "main/bootstrap_htmx.html"
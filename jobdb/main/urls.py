@@ -41,4 +41,9 @@ urlpatterns = [
         views.AddPostingsView.as_view(),
         name="add_postings",
     ),
+    path(
+        "notifications",
+        views.NotificationStreamView.as_view(),
+        name="notifications",
+    ),
 ]
@@ -1,20 +1,31 @@
 from typing import Any
 from collections.abc import Sequence
 
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
 from django.db.models import Case, F, Max, Model, QuerySet, When
 from django.db.models.functions import Lower
 from django.forms import ModelForm, inlineformset_factory
-from django.http import HttpRequest, HttpResponse
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBase,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render
 from django.urls import reverse, reverse_lazy
 from django.views import View
 from django.views.generic import TemplateView
 from django.views.generic.edit import FormView
 from django_filters.views import FilterView  # type: ignore
-from django_tables2 import SingleTableMixin  # type: ignore
+from django_tables2 import RequestConfig, SingleTableMixin  # type: ignore
 from django_tables2.export import views as export_views  # type: ignore
 
+from ..utils.cache import DATA_SCOPES, memoize, user_scopes
+from .bulk import BATCH_SIZE
+from .conditional import get_validators, not_modified, set_validators
+from .export import StreamingTableExport
 from .filters import (
     AllPostingFilter,
     ApplicationFilter,
@@ -28,16 +39,18 @@ from .forms import (
     URLTextareaForm,
     UserProfileForm,
 )
-from .models import Application, Company, Posting, User
+from .models import Application, Company, Posting, PostingURL, User
+from .notifications import event_stream, user_channel
+from .pagination import CountMode, KeysetPaginator
 from .query import (
-    companies_with_posting_counts,
-    companies_with_wa_counts,
     company_posting_queue_set,
+    dashboard_stats,
     posting_queue_companies_count,
     posting_queue_set,
     user_application_companies,
     user_companies_leaderboard,
 )
+from .signals import send_data_changed
 from .tables import (
     ApplicationCompanyCountHTMxTable,
     ApplicationHTMxTable,
@@ -50,6 +63,9 @@ from .utils import normalize_posting_url
 
 
 class ExportMixin(export_views.ExportMixin):
+    streaming_export_class = StreamingTableExport
+    export_chunk_size = 2000
+
     def get_export_filename(self, export_format: str) -> str:
         if hasattr(self, "get_export_name"):
             export_name = self.get_export_name()
@@ -57,6 +73,25 @@ class ExportMixin(export_views.ExportMixin):
             export_name = self.export_name
         return f"{export_name}.{export_format}"
 
+    def render_to_response(self, context: Any, **kwargs: Any) -> Any:
+        export_format = self.request.GET.get(self.export_trigger_param)
+        if self.streaming_export_class.is_valid_format(export_format):
+            return self.create_streaming_export(export_format)
+        return super().render_to_response(context, **kwargs)
+
+    def create_streaming_export(self, export_format: str) -> Any:
+        table = self.get_table_class()(
+            data=self.get_table_data(), **self.get_table_kwargs()
+        )
+        RequestConfig(self.request, paginate=False).configure(table)
+        exporter = self.streaming_export_class(
+            export_format,
+            table,
+            exclude_columns=self.exclude_columns,
+            chunk_size=self.export_chunk_size,
+        )
+        return exporter.response(self.get_export_filename(export_format))
+
 
 class BaseView(LoginRequiredMixin):
     pass
@@ -68,36 +103,15 @@ class IndexView(BaseView, TemplateView):
     def get_context_data(self, **kwargs: Any) -> Any:
         context = super().get_context_data(**kwargs)
         assert isinstance(self.request.user, User)
-        companies = Company.objects.all()
-        companies_with_postings = (
-            companies_with_posting_counts()
-            .filter(open_posting_count__gt=0)
-            .order_by("-open_posting_count", Lower("name"))
-        )
-        your_apps = Application.objects.filter(user=self.request.user)
-        your_apps_company_count = user_application_companies(self.request.user)
-        posting_queue = posting_queue_set(self.request.user, ordered=False)
-        company_posting_queue = company_posting_queue_set(self.request.user)
-        posting_queue_companies = posting_queue_companies_count(
-            self.request.user
-        )
-        unreported_apps_count = (
-            your_apps.count()
-            - your_apps.filter(reported__isnull=False).count()
-        )
+        user = self.request.user
         return context | {
-            "company": companies,
-            "companies_with_postings": companies_with_postings,
-            "posting": Posting.objects.all(),
-            "posting_open": Posting.objects.filter(closed=None),
-            "application": Application.objects.all(),
-            "your_apps": your_apps,
-            "your_apps_company_count": your_apps_company_count,
-            "unreported_apps_count": unreported_apps_count,
-            "posting_queue": posting_queue,
-            "company_posting_queue": company_posting_queue,
-            "posting_queue_companies": posting_queue_companies,
-            "leaderboard": user_companies_leaderboard(),
+            "stats": memoize(
+                "dashboard-stats",
+                user_scopes(user.pk),
+                lambda: dashboard_stats(user),
+                user.pk,
+            ),
+            "leaderboard": list(user_companies_leaderboard()[:10]),
         }
 
 
@@ -169,21 +183,31 @@ class AddPostingsView(View):
                     form=company_form, add_form=add_form, formset=formset
                 ),
             )
-        new_saved_postings = []
-        posting_matches = []
-        if not company:
-            company = add_form.save()
-        for form in formset:
-            if form.cleaned_data["include"] is False:
-                continue
-            if posting := Posting.objects.by_url(  # type: ignore
-                form.cleaned_data["url"]
-            ).first():
-                posting_matches.append(posting)
+        forms = [f for f in formset if f.cleaned_data["include"] is not False]
+        posting_matches = Posting.objects.by_urls(  # type: ignore
+            f.cleaned_data["url"] for f in forms
+        )
+        new_saved_postings: list[Posting] = []
+        saved_urls: set[str] = set()
+        for form in forms:
+            url = form.cleaned_data["url"]
+            if url in posting_matches or url in saved_urls:
                 continue
-            form.instance.company = company
-            obj = form.save()
-            new_saved_postings.append(obj)
+            posting = form.save(commit=False)
+            new_saved_postings.append(posting)
+            saved_urls.update(posting.all_urls)
+        # Saved together so signal receivers run once for the batch
+        with transaction.atomic():
+            if not company:
+                company = add_form.save()
+            for posting in new_saved_postings:
+                posting.company = company
+            Posting.objects.bulk_create(
+                new_saved_postings, batch_size=BATCH_SIZE
+            )
+            PostingURL.objects.sync(new_saved_postings)  # type: ignore
+            if new_saved_postings:
+                send_data_changed(Posting, companies=[company.pk])
         return render(
             request,
             self.template_name,
@@ -238,14 +262,8 @@ class AddPostingsView(View):
     def check_duplicate_urls(
         self, urls: Sequence[str]
     ) -> tuple[set[str], dict[str, Posting]]:
-        new_urls = set()
-        posting_matches = {}
-        for url in urls:
-            if postings := Posting.objects.by_url(url):  # type: ignore
-                posting_matches[url] = postings.first()
-            else:
-                new_urls.add(url)
-        return new_urls, posting_matches
+        posting_matches = Posting.objects.by_urls(urls)  # type: ignore
+        return set(urls) - posting_matches.keys(), posting_matches
 
 
 class UserProfileFormView(BaseModelFormView):
@@ -261,28 +279,99 @@ class UserProfileFormView(BaseModelFormView):
 class BaseHTMxTableView(BaseView, ExportMixin, SingleTableMixin, FilterView):
     template_table_title = "Untitled table"
     template_table_htmx_route = ""
-    paginate_by = 15
+    table_pagination = {"paginator_class": KeysetPaginator, "per_page": 15}
+    count_mode: CountMode = "exact"
+    cache_rows = False
+    user_cache = False
+    last_modified_fields: list[str] | None = None
     action_links: Sequence[tuple[str, str]] | None = None
+    live_updates = False
+
+    # Filters are part of the ETag, so Last-Modified can come from the
+    # unfiltered rows without building the filter set twice
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        if not request.htmx:  # type: ignore
+            return super().get(request, *args, **kwargs)
+        validators = get_validators(
+            request,
+            self.get_cache_scopes(),
+            self.get_queryset(),
+            self.last_modified_fields,
+        )
+        if response := not_modified(request, validators):
+            return response
+        response = super().get(request, *args, **kwargs)
+        set_validators(response, validators)
+        return response
 
     def get_context_data(self, **kwargs: Any) -> Any:
         return super().get_context_data(**kwargs) | {
             "action_links": self.action_links or [],
             "table_title": self.template_table_title,
             "table_htmx_route": reverse(self.template_table_htmx_route),
+            "notifications_url": (
+                reverse("notifications")
+                if self.live_updates and settings.LIVE_UPDATES
+                else None
+            ),
+        }
+
+    def get_table_pagination(self, table: Any) -> Any:
+        paginate = super().get_table_pagination(table)
+        return paginate | {
+            "cursor": self.request.GET.get("cursor"),
+            "count_mode": self.count_mode,
+            "cache_rows": self.cache_rows,
+            "cache_scopes": self.get_cache_scopes(),
         }
 
+    def get_cache_scopes(self) -> list[str]:
+        if self.user_cache:
+            return user_scopes(self.request.user.pk)
+        return DATA_SCOPES
+
+    def get_table_data(self) -> Any:
+        queryset = super().get_table_data()
+        table_class = self.get_table_class()
+        if select_related := getattr(table_class, "select_related", None):
+            queryset = queryset.select_related(*select_related)
+        if only := getattr(table_class, "only", None):
+            queryset = queryset.only(*only)
+        return queryset
+
     def get_template_names(self) -> str:
         if self.request.htmx:
             return "main/table_partial.html"
         return "main/table_htmx.html"
 
 
+# Server-sent events for the user's queue. Async so waiting clients hold
+# no worker thread under ASGI. Off unless settings.LIVE_UPDATES, since a
+# WSGI worker would buffer the whole stream.
+class NotificationStreamView(View):
+    async def get(self, request: HttpRequest) -> HttpResponseBase:
+        if not settings.LIVE_UPDATES:
+            return HttpResponse(status=404)
+        user = await request.auser()
+        if not user.is_authenticated:
+            return HttpResponse(status=401)
+        try:
+            after = int(request.headers.get("Last-Event-ID", ""))
+        except ValueError:
+            after = None
+        return StreamingHttpResponse(
+            event_stream([user_channel(user.pk)], after),
+            content_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+
 class CompanyHTMxTableView(BaseHTMxTableView):
     template_table_title = "All companies"
     template_table_htmx_route = "company_htmx"
     table_class = CompanyHTMxTable
     filterset_class = CompanyFilter
-    queryset = companies_with_wa_counts().order_by(Lower("name"))
+    queryset = Company.objects.order_by(Lower("name"))
     export_name = "companies"
     action_links = [("Add company", reverse_lazy("personal:main_company_add"))]
 
@@ -293,6 +382,9 @@ class QueueCompanyCountHTMxTableView(BaseHTMxTableView):
     table_class = QueueCompanyCountHTMxTable
     filterset_class = CompanyFilter
     export_name = "postings_queue_by_company_count"
+    count_mode: CountMode = "cached"
+    cache_rows = True
+    user_cache = True
 
     def get_queryset(self) -> QuerySet:
         return posting_queue_companies_count(self.request.user)
@@ -304,6 +396,9 @@ class ApplicationCompanyCountHTMxTableView(BaseHTMxTableView):
     table_class = ApplicationCompanyCountHTMxTable
     filterset_class = CompanyFilter
     export_name = "applications_queue_by_company_count"
+    count_mode: CountMode = "cached"
+    cache_rows = True
+    user_cache = True
 
     def get_queryset(self) -> QuerySet:
         return user_application_companies(self.request.user)
@@ -315,6 +410,9 @@ class FullQueueHTMxTableView(BaseHTMxTableView):
     table_class = QueueHTMxTable
     filterset_class = PostingFilter
     export_name = "full_postings_queue"
+    count_mode: CountMode = "cached"
+    user_cache = True
+    live_updates = True
     action_links = [("Add postings", reverse_lazy("add_postings"))]
 
     def get_queryset(self) -> QuerySet:
@@ -336,6 +434,8 @@ class PostingHTMxTableView(QueueHTMxTableView):
     table_class = PostingHTMxTable
     filterset_class = AllPostingFilter
     export_name = "postings"
+    count_mode: CountMode = "estimated"
+    live_updates = False
 
     def get_queryset(self) -> QuerySet:
         return Posting.objects.annotate(
@@ -363,6 +463,12 @@ class ApplicationHTMxTableView(BaseHTMxTableView):
     template_table_htmx_route = "application_htmx"
     table_class = ApplicationHTMxTable
     filterset_class = ApplicationFilter
+    user_cache = True
+    last_modified_fields = [
+        "modified",
+        "posting__modified",
+        "posting__company__modified",
+    ]
 
     def get_export_name(self) -> str:
         base_name = "applications"
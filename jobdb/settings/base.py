@@ -21,6 +21,7 @@ from .email import (  # noqa
     EMAIL_PORT,
     EMAIL_USE_TLS,
 )
+from .env import EnvValue
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -59,6 +60,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "jobdb.utils.instrumentation.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -103,6 +105,41 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Local memory is per process. Deployments running several workers set
+# DJANGO_CACHE_BACKEND and DJANGO_CACHE_LOCATION to a shared backend such
+# as django.core.cache.backends.redis.RedisCache so invalidation reaches
+# every worker.
+
+CACHES = {
+    "default": {
+        "BACKEND": EnvValue().string("DJANGO_CACHE_BACKEND")
+        or "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": EnvValue().string("DJANGO_CACHE_LOCATION") or "jobdb",
+        "TIMEOUT": 300,
+    }
+}
+
+
+# Notifications
+# The default broker only reaches listeners in the same process.
+# Deployments running several workers set DJANGO_NOTIFICATION_BROKER to
+# a broker class backed by a shared service.
+
+NOTIFICATION_BROKER = (
+    EnvValue().string("DJANGO_NOTIFICATION_BROKER")
+    or "jobdb.utils.broker.LocalBroker"
+)
+
+# Live queue updates hold an event stream open for minutes. WSGI servers
+# buffer the stream and tie up a worker for its whole length, so set
+# DJANGO_LIVE_UPDATES only when serving jobdb.asgi:application with an
+# ASGI server such as uvicorn.
+
+LIVE_UPDATES = EnvValue().bool("DJANGO_LIVE_UPDATES")
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -187,3 +224,25 @@ CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 CRISPY_TEMPLATE_PACK = "bootstrap5"
 
 SHELL_PLUS_IMPORTS = ["from jobdb.main.query import *"]
+
+# Fraction of requests to record SQL and view timings for (0 disables).
+# Sampled requests get a Server-Timing header and a log line, and are
+# summarized per route at /admin/instrumentation/.
+INSTRUMENTATION_SAMPLE_RATE = EnvValue().float(
+    "DJANGO_INSTRUMENTATION_SAMPLE_RATE"
+)
+# Number of recent requests per route kept for the admin summary
+INSTRUMENTATION_WINDOW = 1000
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "jobdb.utils.instrumentation": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        }
+    },
+}
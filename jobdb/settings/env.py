@@ -16,5 +16,9 @@ class EnvValue:
         value = self._raw(var)
         return default if value is None else int(value)
 
+    def float(self, var: str, default: float = 0.0) -> float:
+        value = self._raw(var)
+        return default if value is None else float(value)
+
     def string(self, var: str, default: str = "") -> str:
         return self._raw(var) or ""
@@ -0,0 +1 @@
+(()=>{let e;function t(t,n,o){(async()=>{let r=+n.headers.get("Content-Length")||null;e.triggerHtmxEvent(t,"htmx:download:start",{total:r});let a=n.body.getReader(),l=[],s=0;for(;;){let{done:n,value:o}=await a.read();if(n)break;l.push(o),s+=o.length,e.triggerHtmxEvent(t,"htmx:download:progress",{loaded:s,total:r,percent:r?Math.round(s/r*100):null})}let i=new Blob(l,{type:n.headers.get("Content-Type")||"application/octet-stream"}),d=function(e,t){let n=e.get("Content-Disposition");if(n){let e=n.match(/filename\*?=['"]?(?:UTF-8'')?([^'";]+)/i);if(e)return decodeURIComponent(e[1])}return t.split("/").pop().split("?")[0]||"download"}(n.headers,o),c=URL.createObjectURL(i);Object.assign(document.createElement("a"),{href:c,download:d}).click(),URL.revokeObjectURL(c),e.triggerHtmxEvent(t,"htmx:download:complete",{filename:d,size:i.size})})()}htmx.registerExtension("download",{init:t=>{e=t},htmx_before_response:(e,{ctx:n})=>{let o=n.response.headers.get("HX-Download");if(o)return void(async()=>{t(n.sourceElement,await fetch(o),o)})();let r=n.response.headers.get("Content-Disposition");return"download"===n.swap||r?.includes("attachment")?(t(n.sourceElement,n.response.raw,n.request.action),!1):void 0}})})();
\ No newline at end of file
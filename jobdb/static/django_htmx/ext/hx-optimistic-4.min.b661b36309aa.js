@@ -0,0 +1 @@
+(()=>{let e;function t(e){if(e.optimisticDiv){e.optimisticDiv.remove();for(let t of e.optHidden)t.style.display=""}}htmx.registerExtension("hx-optimistic",{init:t=>{e=t},htmx_config_request:(e,t)=>{let i=t.ctx.request.body;i?.entries&&(t.ctx.optimisticBody=i)},htmx_before_request:(t,i)=>{!function(t){if(t.optimistic=e.attributeValue(t.sourceElement,"hx-optimistic"),!t.optimistic)return;let i=document.querySelector(t.optimistic);if(!i)return;let o=t.target;if("string"==typeof o&&(o=document.querySelector(o)),!o)return;let n=document.createElement("div");n.style.cssText="all: initial",n.classList.add("hx-optimistic");let r=i instanceof HTMLTemplateElement?i.content.childNodes:i.childNodes;for(let e of r)n.appendChild(e.cloneNode(!0));if(t.optimisticBody){let e=new Set(t.optimisticBody.keys());for(let i of e){let e=t.optimisticBody.getAll(i).filter(e=>"string"==typeof e);if(!e.length)continue;let o=1===e.length?e[0]:JSON.stringify(e);try{n.dataset[i]=o}catch(e){try{n.setAttribute("data-"+i,o)}catch(e){}}}}let s="before"===(l=t.swap)?"beforebegin":"after"===l?"afterend":"prepend"===l?"afterbegin":"append"===l?"beforeend":l;var l;if(t.optHidden=[],"innerHTML"===s){for(let e of o.children)e.style.display="none",t.optHidden.push(e);o.appendChild(n)}else["beforebegin","afterbegin","beforeend","afterend"].includes(s)?o.insertAdjacentElement(s,n):(o.style.display="none",t.optHidden.push(o),o.after(n));t.optimisticDiv=n,htmx.process(n)}(i.ctx)},htmx_error:(e,i)=>{t(i.ctx)},htmx_before_swap:(e,i)=>{t(i.ctx)}})})();
\ No newline at end of file
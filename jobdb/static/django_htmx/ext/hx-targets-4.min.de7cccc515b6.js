@@ -0,0 +1 @@
+(()=>{let e;htmx.registerExtension("hx-targets",{init:t=>{e=t},htmx_before_swap:(t,r)=>{let{ctx:n,tasks:a}=r,l=e.attributeValue(n.sourceElement,"hx-targets");if(!l)return;let i=htmx.findAll(n.sourceElement,l);if(!i.length)return void console.warn(`htmx: '${l}' on hx-targets did not match any elements`,{selector:l});let s=a.findIndex(e=>"main"===e.type);if(-1===s)return;let m=a[s],o=Array.from(i).map(e=>({...m,fragment:m.fragment.cloneNode(!0),target:e}));a.splice(s,1,...o)}})})();
\ No newline at end of file
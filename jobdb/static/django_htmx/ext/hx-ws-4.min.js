@@ -0,0 +1 @@
+(()=>{let e;function t(e){let t=htmx.config.metaCharacter||":",n=`[${CSS.escape("hx-ws"+t+e)}]`;return htmx.config.prefix&&(n+=`,[${CSS.escape(htmx.config.prefix+"ws"+t+e)}]`),n}function n(t){const n={reconnect:!0,reconnectDelay:500,reconnectMaxDelay:6e4,reconnectMaxAttempts:1/0,reconnectJitter:.3,pauseOnBackground:!0,pendingRequestTTL:3e4};let r=htmx.config.ws||{},o={};if(t){o=e.createRequestContext(t,new CustomEvent("_")).request.ws||{}}let s={...n,...r,...o};return"boolean"==typeof s.reconnectJitter&&(s.reconnectJitter=s.reconnectJitter?.3:0),s}function r(e){if(e.startsWith("ws://")||e.startsWith("wss://"))return e;if(e.startsWith("http://"))return"ws://"+e.slice(7);if(e.startsWith("https://"))return"wss://"+e.slice(8);let t="https:"===window.location.protocol?"wss:":"ws:",n=window.location.host;return e.startsWith("//")?t+e:e.startsWith("/")?t+"//"+n+e:t+"//"+n+window.location.pathname.substring(0,window.location.pathname.lastIndexOf("/")+1)+e}const o=new Map;function s(t,s){let i=r(t);if(o.has(i))return o.get(i);let c={url:i,config:n(s),socket:null,attempt:0,timer:null,pendingRequests:new Map,abortController:null,visibilityHandler:null,cancelled:!1};return!e.triggerHtmxEvent(s,"htmx:before:ws:connection",{connection:c})||c.cancelled?(e.triggerHtmxEvent(s,"htmx:ws:close",{connection:c,reason:"cancelled",code:null}),null):(o.set(i,c),a(i,c),c.config.pauseOnBackground&&(c.visibilityHandler=()=>{document.hidden?c.socket&&c.socket.readyState===WebSocket.OPEN&&c.socket.close():c.socket&&c.socket.readyState!==WebSocket.CLOSED||(c.attempt=0,a(i,c))},document.addEventListener("visibilitychange",c.visibilityHandler)),c)}function i(e){let n=t("connect")+","+t("send");for(let t of document.querySelectorAll(n))if(t._htmx?.ws?.url===e)return t;return null}function c(e,t){if(t.timer&&clearTimeout(t.timer),t.visibilityHandler&&document.removeEventListener("visibilitychange",t.visibilityHandler),t.abortController&&t.abortController.abort(),t.pendingRequests.clear(),t.socket)try{t.socket.readyState!==WebSocket.OPEN&&t.socket.readyState!==WebSocket.CONNECTING||t.socket.close()}catch(e){}o.delete(e)}function a(t,n){if(n.abortController&&n.abortController.abort(),n.socket){let e=n.socket;n.socket=null;try{e.readyState!==WebSocket.OPEN&&e.readyState!==WebSocket.CONNECTING||e.close()}catch(e){}}try{n.socket=new WebSocket(t,n.config?.protocols);let r=new AbortController;n.abortController=r;let s={signal:r.signal};n.socket.addEventListener("open",()=>{let r=i(t);r?(e.triggerHtmxEvent(r,"htmx:after:ws:connection",{connection:n}),n.attempt=0):c(t,n)},s),n.socket.addEventListener("message",t=>{!function(t,n){let r=null;try{r=JSON.parse(n.data)}catch(e){}l(t);let o=null,s=r?.["HX-Request-ID"]||r?.request_id;s&&t.pendingRequests.has(s)?(o=t.pendingRequests.get(s).element,t.pendingRequests.delete(s),o.isConnected||(o=i(t.url))):o=i(t.url);if(!o)return void c(t.url,t);let a,u={message:{text:n.data,json:r,cancelled:!1}};if(!e.triggerHtmxEvent(o,"htmx:before:ws:message",u)||u.message.cancelled)return;u.message.json?void 0!==u.message.json.content?a=u.message.json.content:void 0!==u.message.json.payload&&(a=u.message.json.payload,t._payloadWarnFired||(console.warn("htmx: [hx-ws] json.payload is deprecated; use json.content instead"),t._payloadWarnFired=!0)):a=u.message.text;if(null!=a){let t=u.message.json?.target||e.attributeValue(o,"hx-target"),n=u.message.json?.swap||e.attributeValue(o,"hx-swap");htmx.swap({sourceElement:o,target:t||o,swap:n||(t?htmx.config.defaultSwap:"none"),text:a,transition:!1})}delete u.message.cancelled,e.triggerHtmxEvent(o,"htmx:after:ws:message",u)}(n,t)},s),n.socket.addEventListener("close",r=>{if(r.target!==n.socket)return;let s=i(t);if(s&&e.triggerHtmxEvent(s,"htmx:ws:close",{connection:n,reason:"closed",code:r.code}),!o.has(t))return;let l=n.config;l.pauseOnBackground&&document.hidden||(l.reconnect&&i(t)?function(t,n){let r=n.config;n.attempt++;let o=n.attempt;if(!r.reconnect||o>r.reconnectMaxAttempts)return void c(t,n);let s=htmx.parseInterval(r.reconnectDelay)??r.reconnectDelay,l=htmx.parseInterval(r.reconnectMaxDelay)??r.reconnectMaxDelay,u=Math.min(s*Math.pow(2,o-1),l);if(r.reconnectJitter>0){let e=u*r.reconnectJitter;u=Math.max(0,u+(2*Math.random()-1)*e)}let d=i(t);if(!d)return void c(t,n);if(n.cancelled=!1,!e.triggerHtmxEvent(d,"htmx:before:ws:connection",{connection:n})||n.cancelled)return e.triggerHtmxEvent(d,"htmx:ws:close",{connection:n,reason:"cancelled",code:null}),void c(t,n);n.timer=setTimeout(()=>{i(t)?a(t,n):c(t,n)},u)}(t,n):c(t,n))},s),n.socket.addEventListener("error",n=>{let r=i(t);r&&e.triggerHtmxEvent(r,"htmx:ws:error",{url:t,error:n})},s)}catch(n){let r=i(t);r&&e.triggerHtmxEvent(r,"htmx:ws:error",{url:t,error:n})}}function l(e){let t=e.config,n=Date.now(),r=t.pendingRequestTTL||3e4;for(let[t,o]of e.pendingRequests)n-o.timestamp>r&&e.pendingRequests.delete(t)}function u(n){if(e.htmxProp(n).ws??={},n._htmx.ws.sendInitialized)return;let i=e.attributeValue(n,"hx-ws:send"),c=i&&"true"!==i?i:null,a=e.attributeValue(n,"hx-trigger");a||(a=n.matches("form")?"submit":n.matches("input:not([type=button]):not([type=submit]),select,textarea")?"change":"click"),e.onTrigger(n,a,async i=>{if(n.matches("form")&&"submit"===i.type&&i.preventDefault(),c&&!n._htmx?.ws?.url){let e=s(c,n);e&&(n._htmx.ws.url=e.url)}await async function(n,s){let i=e.attributeValue(n,"hx-ws:send"),c=i&&"true"!==i?i:null;if(!c){let r=n.closest(t("connect"));r&&(c=e.attributeValue(r,"hx-ws:connect"))}if(!c)return void e.triggerHtmxEvent(n,"htmx:ws:error",{url:null,error:"No WebSocket connection found for element"});let a=r(c),u=o.get(a);if(u&&u.socket&&u.socket.readyState===WebSocket.CONNECTING&&await new Promise(e=>{u.socket.addEventListener("open",e,{once:!0}),u.socket.addEventListener("close",e,{once:!0}),u.socket.addEventListener("error",e,{once:!0})}),!u||!u.socket||u.socket.readyState!==WebSocket.OPEN)return void e.triggerHtmxEvent(n,"htmx:ws:error",{url:a,error:"Connection not open"});l(u);let d={...e.createRequestContext(n,s).request.headers};delete d.Accept;let m=crypto.randomUUID();d["HX-Request-ID"]=m;let h=n.form||n.closest("form"),g=e.collectFormData(n,h,s.submitter),x={};for(let[e,t]of g)x[e]=e in x?[].concat(x[e],t):t;let w=e.getAttributeObject(n,"hx-vals",e=>Object.assign(x,e));w&&await w;let f={headers:d,body:x};if(e.triggerHtmxEvent(n,"htmx:before:ws:request",f))try{u.socket.send(JSON.stringify(f)),u.pendingRequests.set(m,{element:n,timestamp:Date.now()}),e.triggerHtmxEvent(n,"htmx:after:ws:request",f)}catch(t){e.triggerHtmxEvent(n,"htmx:ws:error",{url:a,error:t})}}(n,i)}),n._htmx.ws.sendInitialized=!0}function d(t){let n=t._htmx?.ws?.url;n&&o.has(n)&&(t._htmx.ws.url=null,i(n)||function(t,n){let r=o.get(t);r&&(r.timer&&clearTimeout(r.timer),r.visibilityHandler&&document.removeEventListener("visibilitychange",r.visibilityHandler),r.abortController&&r.abortController.abort(),r.pendingRequests.clear(),e.triggerHtmxEvent(n,"htmx:ws:close",{connection:r,reason:"removed",code:null}),r.socket&&r.socket.readyState===WebSocket.OPEN&&r.socket.close(),o.delete(t))}(n,t))}htmx.registerExtension("ws",{init:t=>{e=t,htmx.config.ws||(htmx.config.ws={})},htmx_after_process:n=>{const r=t=>{!function(e){if(e.hasAttribute("ws-connect")||e.hasAttribute("ws-send")){if(console.warn("htmx: [hx-ws] legacy attributes ws-connect and ws-send are deprecated; use hx-ws:connect and hx-ws:send instead"),e.hasAttribute("ws-connect")){let t=e.getAttribute("ws-connect"),n=htmx.config.metaCharacter||":",r=(htmx.config.prefix||"hx-")+"ws"+n+"connect";e.hasAttribute(r)||e.setAttribute(r,t)}if(e.hasAttribute("ws-send")){let t=htmx.config.metaCharacter||":",n=(htmx.config.prefix||"hx-")+"ws"+t+"send";e.hasAttribute(n)||e.setAttribute(n,"")}}}(t),null!=e.attributeValue(t,"hx-ws:connect")&&function(t){if(e.htmxProp(t).ws??={},t._htmx.ws.initialized)return;let n=e.attributeValue(t,"hx-ws:connect");if(!n)return;let r=e.attributeValue(t,"hx-trigger")||"load";e.onTrigger(t,r,()=>{if(t._htmx?.ws?.url)return;let e=s(n,t);e&&(t._htmx.ws.url=e.url)}),t._htmx.ws.initialized=!0}(t),null!=e.attributeValue(t,"hx-ws:send")&&u(t)};r(n);let o=t("connect")+","+t("send")+",[ws-connect],[ws-send]";n.querySelectorAll(o).forEach(r)},htmx_before_cleanup:e=>{d(e)}}),"undefined"!=typeof window&&window.htmx&&(window.addEventListener("pagehide",()=>{o.forEach(e=>{e.socket&&e.socket.close(1e3,"page navigating away")})}),window.htmx.ext=window.htmx.ext||{},window.htmx.ext.ws={getRegistry:()=>({clear:()=>{let e=Array.from(o.values());o.clear(),e.forEach(e=>{e.timer&&clearTimeout(e.timer),e.visibilityHandler&&document.removeEventListener("visibilitychange",e.visibilityHandler),e.abortController&&e.abortController.abort(),e.socket&&e.socket.close(),e.pendingRequests.clear()})},get:e=>o.get(r(e)),has:e=>o.has(r(e)),get size(){return o.size}})})})();
\ No newline at end of file
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+from collections import deque
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+HISTORY_SIZE = 1000
+
+
+@dataclass
+class Event:
+    id: int
+    channel: str
+    name: str
+    data: dict[str, Any]
+
+
+# Keeps recent events in memory and wakes waiting threads and event loops
+# on publish. Only listeners in the publishing process hear events, so
+# deployments with several workers point NOTIFICATION_BROKER at a class
+# with the same methods backed by a shared service.
+class LocalBroker:
+    def __init__(self, history_size: int = HISTORY_SIZE):
+        self.condition = threading.Condition()
+        self.events: deque[Event] = deque(maxlen=history_size)
+        self.last_id = 0
+        self.waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = (
+            set()
+        )
+
+    def publish(self, channel: str, name: str, data: dict[str, Any]) -> None:
+        with self.condition:
+            self.last_id += 1
+            self.events.append(Event(self.last_id, channel, name, data))
+            self.condition.notify_all()
+            for loop, waiter in self.waiters:
+                loop.call_soon_threadsafe(waiter.set)
+
+    # Events after the given id, and the id to read from next. Listeners
+    # without an id, or with one from before a restart, start from now.
+    def _read(
+        self, channels: Collection[str], after: int | None
+    ) -> tuple[list[Event], int]:
+        if after is None or after > self.last_id:
+            return [], self.last_id
+        return [
+            event
+            for event in self.events
+            if event.id > after and event.channel in channels
+        ], self.last_id
+
+    def read(
+        self, channels: Collection[str], after: int | None
+    ) -> tuple[list[Event], int]:
+        with self.condition:
+            return self._read(channels, after)
+
+    def listen(
+        self, channels: Collection[str], after: int | None, timeout: float
+    ) -> tuple[list[Event], int]:
+        deadline = time.monotonic() + timeout
+        with self.condition:
+            while True:
+                events, after = self._read(channels, after)
+                remaining = deadline - time.monotonic()
+                if events or remaining <= 0:
+                    return events, after
+                self.condition.wait(remaining)
+
+    async def alisten(
+        self, channels: Collection[str], after: int | None, timeout: float
+    ) -> tuple[list[Event], int]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            waiter = (loop, asyncio.Event())
+            with self.condition:
+                events, after = self._read(channels, after)
+                remaining = deadline - loop.time()
+                if events or remaining <= 0:
+                    return events, after
+                self.waiters.add(waiter)
+            try:
+                await asyncio.wait_for(waiter[1].wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self.condition:
+                    self.waiters.discard(waiter)
+
+
+@functools.cache
+def get_broker() -> Any:
+    return import_string(settings.NOTIFICATION_BROKER)()
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Collection
+from typing import Any, TypeVar
+
+from django.core.cache import cache
+from django.db import transaction
+
+T = TypeVar("T")
+
+CACHE_TIMEOUT = 300
+
+# Entries are keyed by the generations of the scopes they read, so bumping
+# a scope orphans its entries in every process sharing the cache. The
+# data_changed receiver bumps one scope per changed model, "user:<pk>"
+# for each affected user and "users" when every user is affected.
+DATA_SCOPES = ["Company", "Posting", "Application", "users"]
+
+_missing = object()
+
+
+def user_scopes(pk: int) -> list[str]:
+    return ["users", f"user:{pk}"]
+
+
+def generation_key(scope: str) -> str:
+    return f"generation:{scope}"
+
+
+def generations(scopes: Collection[str]) -> str:
+    keys = [generation_key(scope) for scope in scopes]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            # Start missing counters somewhere new so evicted ones
+            # cannot come back to a generation already used
+            value = time.time_ns()
+            found[key] = (
+                value if cache.add(key, value, None) else cache.get(key)
+            )
+    return ".".join(str(found[key]) for key in keys)
+
+
+def bump(scopes: Collection[str]) -> None:
+    for key in map(generation_key, scopes):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), None)
+
+
+# Bumping again on commit drops entries computed from data read between
+# the write and the commit
+def invalidate(scopes: Collection[str]) -> None:
+    bump(scopes)
+    transaction.on_commit(lambda: bump(scopes))
+
+
+class CacheStats:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    def record(self, name: str, hit: bool) -> None:
+        with self.lock:
+            (self.hits if hit else self.misses)[name] += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.hits.clear()
+            self.misses.clear()
+
+    def summary(self) -> list[dict[str, Any]]:
+        with self.lock:
+            names = sorted(self.hits.keys() | self.misses.keys())
+            return [
+                {
+                    "name": name,
+                    "hits": self.hits[name],
+                    "misses": self.misses[name],
+                    "hit_rate": round(
+                        self.hits[name]
+                        / (self.hits[name] + self.misses[name]),
+                        3,
+                    ),
+                }
+                for name in names
+            ]
+
+
+cache_stats = CacheStats()
+
+
+def memoize(
+    name: str,
+    scopes: Collection[str],
+    compute: Callable[[], T],
+    *key: Any,
+    timeout: int = CACHE_TIMEOUT,
+) -> T:
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    cache_key = f"{name}:{digest}:{generations(scopes)}"
+    value = cache.get(cache_key, _missing)
+    cache_stats.record(name, value is not _missing)
+    if value is _missing:
+        value = compute()
+        cache.set(cache_key, value, timeout)
+    return value  # type: ignore
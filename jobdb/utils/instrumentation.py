@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+HISTOGRAM_BOUNDS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500]
+
+
+def fingerprint(sql: str) -> str:
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    sql = re.sub(r"\b\d+\b", "?", sql)
+    sql = re.sub(r"\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)", "(...)", sql)
+    return sql.replace("%s", "?")
+
+
+class QueryRecorder:
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration_ms = 0.0
+        self.fingerprints: Counter[str] = Counter()
+
+    def __call__(
+        self,
+        execute: Callable,
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration_ms += (time.perf_counter() - start) * 1000
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    @property
+    def duplicates(self) -> dict[str, int]:
+        return {sql: n for sql, n in self.fingerprints.items() if n > 1}
+
+
+@dataclass
+class Sample:
+    duration_ms: float
+    db_ms: float
+    queries: int
+    duplicate_queries: int
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class RouteStats:
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self.lock = threading.Lock()
+        self.samples: dict[str, deque[Sample]] = {}
+
+    def record(self, route: str, sample: Sample) -> None:
+        with self.lock:
+            if route not in self.samples:
+                self.samples[route] = deque(maxlen=self.window)
+            self.samples[route].append(sample)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.samples.clear()
+
+    def summary(self) -> list[dict[str, Any]]:
+        with self.lock:
+            samples = {route: list(s) for route, s in self.samples.items()}
+        rows = []
+        for route, route_samples in sorted(samples.items()):
+            durations = [s.duration_ms for s in route_samples]
+            histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+            for duration in durations:
+                bucket = sum(duration > b for b in HISTOGRAM_BOUNDS_MS)
+                histogram[bucket] += 1
+            rows.append(
+                {
+                    "route": route,
+                    "count": len(route_samples),
+                    "p50_ms": round(percentile(durations, 0.5), 1),
+                    "p95_ms": round(percentile(durations, 0.95), 1),
+                    "max_ms": round(max(durations), 1),
+                    "mean_db_ms": round(
+                        sum(s.db_ms for s in route_samples)
+                        / len(route_samples),
+                        1,
+                    ),
+                    "mean_queries": round(
+                        sum(s.queries for s in route_samples)
+                        / len(route_samples),
+                        1,
+                    ),
+                    "max_queries": max(s.queries for s in route_samples),
+                    "max_duplicate_queries": max(
+                        s.duplicate_queries for s in route_samples
+                    ),
+                    "histogram": histogram,
+                }
+            )
+        return rows
+
+
+route_stats = RouteStats(
+    window=getattr(settings, "INSTRUMENTATION_WINDOW", 1000)
+)
+
+
+class InstrumentationMiddleware:
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        sample_rate = getattr(settings, "INSTRUMENTATION_SAMPLE_RATE", 0)
+        if not sample_rate or random.random() >= sample_rate:
+            return self.get_response(request)
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        duration_ms = (time.perf_counter() - start) * 1000
+        route = (
+            request.resolver_match.view_name
+            if request.resolver_match
+            else "<unresolved>"
+        )
+        duplicates = recorder.duplicates
+        sample = Sample(
+            duration_ms=duration_ms,
+            db_ms=recorder.duration_ms,
+            queries=recorder.count,
+            duplicate_queries=sum(duplicates.values()) - len(duplicates),
+        )
+        route_stats.record(route, sample)
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={sample.db_ms:.1f};desc="{sample.queries} queries"',
+                f"view;dur={duration_ms - sample.db_ms:.1f}",
+                f"total;dur={duration_ms:.1f}",
+            ]
+        )
+        logger.info(
+            json.dumps(
+                {
+                    "route": route,
+                    "method": request.method,
+                    "status": response.status_code,
+                    "duration_ms": round(duration_ms, 1),
+                    "db_ms": round(sample.db_ms, 1),
+                    "queries": sample.queries,
+                    "duplicate_queries": sample.duplicate_queries,
+                    "top_duplicate": (
+                        max(duplicates, key=duplicates.__getitem__)
+                        if duplicates
+                        else None
+                    ),
+                }
+            )
+        )
+        return response
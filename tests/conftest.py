@@ -1,10 +1,12 @@
 from collections.abc import Iterator
 
 import pytest
+from django.core.cache import cache
 from django.core.management import call_command
 from pytest_django import DjangoDbBlocker
 from rest_framework.test import APIClient
 
+from jobdb.main import fuzzy
 from jobdb.main.models import APIKey, User
 
 
@@ -21,6 +23,15 @@ def enable_db_access(db: None) -> None:
     pass
 
 
+@pytest.fixture(autouse=True)
+def clear_cache() -> Iterator[None]:
+    yield
+    cache.clear()
+    # Indexes outlive the rolled back test transaction
+    fuzzy.company_names.reset()
+    fuzzy.posting_titles.reset()
+
+
 @pytest.fixture
 def api_client() -> Iterator[APIClient]:
     user = User.objects.get(username="luke")
@@ -1,6 +1,15 @@
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APIClient
 
+from jobdb.api.views import PostingViewSet
+from jobdb.main.models import Application, Company, Posting, User
+
 
 def test_api_unauthorized() -> None:
     api_client = APIClient()
@@ -29,3 +38,271 @@ def test_api_me(api_client: APIClient) -> None:
         "linkedin": "https://linkedin.com/in/luke.skywalker",
         "phone": "",
     }
+
+
+def test_api_posting_by_url(api_client: APIClient) -> None:
+    url = "https://linkedin.example.com/jobs/2"
+    response = api_client.get(
+        reverse("posting-by-url-detail", kwargs={"url": url})
+    )
+    assert response.status_code == 200
+    assert response.json()["pk"] == 11
+    response = api_client.get(
+        reverse(
+            "posting-by-url-detail",
+            kwargs={"url": "https://linkedin.example.com/jobs/"},
+        )
+    )
+    assert response.status_code == 404
+
+
+def test_api_companies(api_client: APIClient) -> None:
+    response = api_client.get(reverse("company-list"), {"o": "-num_postings"})
+    assert response.status_code == 200
+    assert [(c["name"], c["num_postings"]) for c in response.json()] == [
+        ("Initech", 4),
+        ("Initrode", 1),
+    ]
+
+
+def parse_links(header: str) -> dict[str, str]:
+    return {
+        rel: url for url, rel in re.findall(r'<([^>]*)>; rel="(\w+)"', header)
+    }
+
+
+@pytest.mark.parametrize(
+    ["route", "params"],
+    [
+        ("company-list", {"o": "-num_postings"}),
+        ("posting-list", {}),
+        ("application-list", {}),
+    ],
+)
+def test_api_cursor_pagination(
+    api_client: APIClient, route: str, params: dict[str, str]
+) -> None:
+    response = api_client.get(reverse(route), params | {"limit": 100})
+    expected = [item["pk"] for item in response.json()]
+    pages = []
+    response = api_client.get(reverse(route), params | {"limit": 2})
+    while True:
+        assert response.status_code == 200
+        pages.append([item["pk"] for item in response.json()])
+        links = parse_links(response.get("Link", ""))
+        if "next" not in links:
+            break
+        assert "offset" not in links["next"]
+        response = api_client.get(links["next"])
+    assert sum(pages, []) == expected
+    assert "last" not in links
+    while "prev" in links:
+        response = api_client.get(links["prev"])
+        pages.pop()
+        assert [item["pk"] for item in response.json()] == pages[-1]
+        links = parse_links(response.get("Link", ""))
+    assert len(pages) == 1
+
+
+@pytest.mark.parametrize(
+    "route",
+    [
+        "company-list",
+        "posting-list",
+        "posting-queue-list",
+        "full-posting-queue-list",
+        "application-list",
+    ],
+)
+def test_api_list_matches_detail(api_client: APIClient, route: str) -> None:
+    Posting.objects.filter(pk=11).update(
+        closed=timezone.now(), job_board_urls=None
+    )
+    api_client.force_authenticate(User.objects.get(username="vader"))
+    # The first request also memoizes Last-Modified
+    api_client.get(reverse(route))
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(reverse(route))
+    assert response.status_code == 200
+    assert len(queries) == 1
+    items = response.json()
+    assert items
+    for item in items:
+        assert api_client.get(item["link"]).json() == item
+
+
+def test_api_sparse_fields(api_client: APIClient) -> None:
+    response = api_client.get(
+        reverse("application-list"), {"fields": "pk,company_name,link"}
+    )
+    items = response.json()
+    assert {tuple(item) for item in items} == {("pk", "company_name", "link")}
+    assert {item["company_name"] for item in items} == {"Initech", "Initrode"}
+    response = api_client.get(
+        reverse("posting-list"), {"fields": "pk,salary,bonus"}
+    )
+    assert response.status_code == 400
+    assert response.json()["fields"] == [
+        "Unknown field: salary",
+        "Unknown field: bonus",
+    ]
+
+
+def test_api_invalid_cursor(api_client: APIClient) -> None:
+    response = api_client.get(reverse("posting-list"), {"cursor": "invalid"})
+    assert response.status_code == 404
+
+
+def test_api_count_header(api_client: APIClient) -> None:
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(reverse("posting-list"), {"limit": 2})
+    assert "X-Total-Count" not in response
+    assert not any("COUNT(" in q["sql"] for q in queries)
+    assert 'rel="last"' not in response["Link"]
+    response = api_client.get(
+        reverse("posting-list"), {"limit": "2", "count": "true"}
+    )
+    assert response["X-Total-Count"] == "5"
+    assert 'rel="last"' in response["Link"]
+
+
+def test_api_search(api_client: APIClient) -> None:
+    response = api_client.get(reverse("api-search"), {"q": "initeck"})
+    assert response.status_code == 200
+    assert [c["name"] for c in response.json()["companies"]] == ["Initech"]
+    response = api_client.get(
+        reverse("api-search"), {"q": "digtal sensei", "limit": "1"}
+    )
+    assert [p["title"] for p in response.json()["postings"]] == [
+        "Señor Digital Sensei"
+    ]
+    assert response.json()["postings"][0]["score"] > 0.5
+    response = api_client.get(reverse("api-search"), {"limit": 0})
+    assert response.status_code == 400
+
+
+def test_api_company_filter_exact(api_client: APIClient) -> None:
+    response = api_client.get(reverse("posting-list"), {"company": "initrode"})
+    assert {p["company_name"] for p in response.json()} == {"Initrode"}
+    response = api_client.get(reverse("posting-list"), {"company": "Initrod"})
+    assert response.json() == []
+
+
+def test_api_bulk_postings(api_client: APIClient) -> None:
+    new = {
+        "company": "initrode",
+        "title": "Tech Support",
+        "in_wa": False,
+        "location": "Remote",
+    }
+    items = [
+        new
+        | {
+            "url": "https://careers.initrode.example.com/jobs/2",
+            "job_board_urls": ["https://linkedin.example.com/jobs/4"],
+        },
+        {"url": "https://linkedin.example.com/jobs/2", "title": "Code Monkey"},
+        {"url": "https://careers.example.com/jobs/3"},
+        {"url": "https://careers.example.com/jobs/5", "title": "Untitled"},
+        new | {"url": "https://vandelay.example.com/1", "company": "Vandelay"},
+        new | {"url": "not a url"},
+        new | {"url": "https://linkedin.example.com/jobs/4"},
+    ]
+    response = api_client.post(reverse("posting-bulk"), items, format="json")
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [
+        "created",
+        "updated",
+        "unchanged",
+        "error",
+        "error",
+        "error",
+        "error",
+    ]
+    assert [r["pk"] for r in results[1:3]] == [11, 12]
+    assert set(results[3]["errors"]) == {"company", "in_wa", "location"}
+    assert results[4]["errors"] == {"company": ["Unknown company"]}
+    assert "url" in results[5]["errors"]
+    assert results[6]["errors"] == {"url": ["Duplicates item 0"]}
+    posting = Posting.objects.by_url(  # type: ignore
+        "https://linkedin.example.com/jobs/4"
+    ).get()
+    assert posting.pk == results[0]["pk"]
+    assert posting.company.name == "Initrode"
+    assert Company.objects.get(name="Initrode").posting_count == 2
+    posting = Posting.objects.get(pk=11)
+    assert posting.title == "Code Monkey"
+    assert posting.url == "https://careers.example.com/jobs/2"
+
+
+def test_api_bulk_postings_query_count(api_client: APIClient) -> None:
+    query_counts = []
+    for size in (5, 10):
+        items = [
+            {
+                "company": "Initech",
+                "url": f"https://careers.example.com/bulk/{size}/{i}",
+                "title": "Tech Support",
+                "in_wa": False,
+                "location": "Remote",
+            }
+            for i in range(size)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(
+                reverse("posting-bulk"), items, format="json"
+            )
+        assert {r["status"] for r in response.json()["results"]} == {"created"}
+        query_counts.append(len(queries))
+    assert query_counts[0] == query_counts[1]
+
+
+def test_api_bulk_applications(api_client: APIClient) -> None:
+    posting = Posting.objects.create(
+        company=Company.objects.get(name="Initrode"),
+        url="https://careers.initrode.example.com/jobs/2",
+        title="Tech Support",
+        in_wa=False,
+        location="Remote",
+    )
+    items = [
+        {"posting_url": posting.url, "notes": "Applied online"},
+        {"posting": 10, "notes": "Followed up"},
+        {"posting_url": "https://linkedin.example.com/jobs/2"},
+        {"posting": 10},
+        {"posting": 999},
+        {"posting": 12, "posting_url": "https://careers.example.com/jobs/3"},
+    ]
+    response = api_client.post(
+        reverse("application-bulk"), items, format="json"
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [
+        "created",
+        "updated",
+        "unchanged",
+        "error",
+        "error",
+        "error",
+    ]
+    application = Application.objects.get(pk=results[0]["pk"])
+    assert application.user.username == "luke"
+    assert application.applied is not None
+    assert Application.objects.get(pk=results[1]["pk"]).notes == "Followed up"
+    assert Company.objects.get(name="Initrode").apps_count == 2
+
+
+def test_api_bulk_limits(
+    api_client: APIClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    response = api_client.post(
+        reverse("posting-bulk"), {"url": "x"}, format="json"
+    )
+    assert response.status_code == 400
+    monkeypatch.setattr(PostingViewSet, "bulk_max_items", 1)
+    response = api_client.post(
+        reverse("posting-bulk"), [{}, {}], format="json"
+    )
+    assert response.status_code == 400
@@ -0,0 +1,40 @@
+from jobdb.main import benchmark
+from jobdb.main.models import User
+
+
+def test_benchmark_run() -> None:
+    results = benchmark.run(User.objects.get(username="luke"), repeat=2)
+    assert {"index", "company_htmx", "posting-detail", "api-me"} <= set(
+        results
+    )
+    assert {result["status"] for result in results.values()} == {200}
+    assert results["index"]["queries"] > 0
+    assert results["index"]["p95_ms"] >= results["index"]["p50_ms"]
+    assert results["index"]["warm_queries"] < results["index"]["queries"]
+
+
+def test_benchmark_compare() -> None:
+    baseline = {
+        "index": {"queries": 5, "p50_ms": 10, "p95_ms": 20, "peak_kib": 50}
+    }
+    warm = {"warm_queries": 2, "warm_p50_ms": 2, "warm_p95_ms": 4}
+    current = {
+        "index": {"queries": 6, "p50_ms": 12, "p95_ms": 40, "peak_kib": 50}
+        | warm,
+        "new": {"queries": 1, "p50_ms": 1, "p95_ms": 1, "peak_kib": 1} | warm,
+    }
+    assert benchmark.compare(baseline, current) == [
+        "index: queries 5 -> 6",
+        "index: p95_ms 20 -> 40 (2.0x)",
+    ]
+    baseline["index"] |= {
+        "warm_queries": 1,
+        "warm_p50_ms": 2,
+        "warm_p95_ms": 2,
+    }
+    assert benchmark.compare(baseline, current) == [
+        "index: queries 5 -> 6",
+        "index: warm_queries 1 -> 2",
+        "index: p95_ms 20 -> 40 (2.0x)",
+        "index: warm_p95_ms 2 -> 4 (2.0x)",
+    ]
@@ -0,0 +1,113 @@
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from jobdb.main.models import Application, Company, Posting, User
+from jobdb.utils.cache import (
+    cache_stats,
+    generation_key,
+    generations,
+    memoize,
+    user_scopes,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache_stats() -> Iterator[None]:
+    cache_stats.clear()
+    yield
+    cache_stats.clear()
+
+
+def counting(result: Any = None) -> Any:
+    calls: list[None] = []
+
+    def compute() -> Any:
+        calls.append(None)
+        return result
+
+    compute.calls = calls  # type: ignore
+    return compute
+
+
+def test_memoize() -> None:
+    compute = counting("value")
+    for _ in range(3):
+        assert memoize("test", ["Posting"], compute, 1) == "value"
+    memoize("test", ["Posting"], compute, 2)
+    assert len(compute.calls) == 2
+    assert cache_stats.summary() == [
+        {"name": "test", "hits": 2, "misses": 2, "hit_rate": 0.5}
+    ]
+
+
+def test_memoize_invalidated_by_data_changed() -> None:
+    luke = User.objects.get(username="luke")
+    vader = User.objects.get(username="vader")
+    entries = {user: counting() for user in (luke, vader)}
+
+    def lookup() -> None:
+        for user, compute in entries.items():
+            memoize("test", user_scopes(user.pk), compute, user.pk)
+
+    lookup()
+    Application.objects.create(user=vader, posting=Posting.objects.get(pk=13))
+    lookup()
+    assert [len(c.calls) for c in entries.values()] == [1, 2]
+    company = Company.objects.get(name="Initech")
+    company.notes = "Changed"
+    company.save()
+    lookup()
+    assert [len(c.calls) for c in entries.values()] == [2, 3]
+
+
+def test_generation_not_reused() -> None:
+    before = generations(["Posting"])
+    cache.delete(generation_key("Posting"))
+    assert generations(["Posting"]) != before
+
+
+@pytest.mark.parametrize(
+    ["route", "username"],
+    [
+        ("index", "vader"),
+        ("queue_by_company_htmx", "vader"),
+        ("application_by_company_htmx", "luke"),
+    ],
+)
+def test_view_cached(client: Client, route: str, username: str) -> None:
+    client.force_login(User.objects.get(username=username))
+    query_counts = []
+    for _ in range(2):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse(route))
+        assert response.status_code == 200
+        query_counts.append(len(queries))
+    assert query_counts[1] < query_counts[0]
+    assert all(row["hits"] for row in cache_stats.summary())
+
+
+def test_index_view_invalidated(client: Client) -> None:
+    user = User.objects.get(username="vader")
+    client.force_login(user)
+    response = client.get(reverse("index"))
+    count = response.context["stats"]["your_apps_count"]
+    Application.objects.create(user=user, posting=Posting.objects.get(pk=13))
+    response = client.get(reverse("index"))
+    assert response.context["stats"]["your_apps_count"] == count + 1
+    assert user.username in [
+        row["user__username"] for row in response.context["leaderboard"]
+    ]
+
+
+def test_admin_cache_stats(client: Client, admin_client: Client) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    client.get(reverse("index"))
+    response = admin_client.get(reverse("admin:instrumentation"))
+    assert b"dashboard-stats" in response.content
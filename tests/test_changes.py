@@ -0,0 +1,118 @@
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from django.test.client import Client
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from jobdb.main import changes
+from jobdb.main.models import Application, Company, Posting, User
+
+
+@pytest.fixture
+def no_lag(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(changes, "CHANGES_LAG", timedelta(0))
+
+
+def read_changes(
+    api_client: APIClient, params: dict[str, Any]
+) -> tuple[list[dict[str, Any]], str]:
+    records = []
+    while True:
+        response = api_client.get(reverse("api-changes"), params)
+        assert response.status_code == 200
+        body = response.json()
+        records += body["changes"]
+        params = params | {"since": body["cursor"]}
+        if not body["more"]:
+            return records, body["cursor"]
+
+
+def test_changes_feed(api_client: APIClient, no_lag: None) -> None:
+    records, _ = read_changes(api_client, {"limit": 3})
+    expected = (
+        [("company", pk) for pk in Company.objects.values_list("pk")]
+        + [("posting", pk) for pk in Posting.objects.values_list("pk")]
+        + [
+            ("application", pk)
+            for pk in Application.objects.filter(
+                user__username="luke"
+            ).values_list("pk")
+        ]
+    )
+    assert sorted((r["model"], r["pk"]) for r in records) == sorted(
+        (model, pk) for model, (pk,) in expected
+    )
+    times = [r["modified"] for r in records]
+    assert times == sorted(times)
+    posting = next(r for r in records if r["model"] == "posting")
+    assert posting["data"] == api_client.get(posting["data"]["link"]).json()
+
+
+def test_changes_resume(api_client: APIClient, no_lag: None) -> None:
+    _, cursor = read_changes(api_client, {})
+    posting = Posting.objects.get(pk=12)
+    posting.notes = "Changed"
+    posting.save()
+    Application.objects.get(user__username="luke", posting=13).delete()
+    Application.objects.get(user__username="solo", posting=11).delete()
+    records, cursor = read_changes(api_client, {"since": cursor})
+    # Deleting the applications recounts their company
+    assert [(r["model"], r["pk"], r["deleted"]) for r in records] == [
+        ("posting", 12, False),
+        ("application", 7, True),
+        ("company", 1, False),
+    ]
+    assert records[0]["data"]["notes"] == "Changed"
+    assert records[1]["data"] is None
+    assert read_changes(api_client, {"since": cursor})[0] == []
+
+
+def test_changes_admin_action(
+    api_client: APIClient, admin_client: Client, no_lag: None
+) -> None:
+    _, cursor = read_changes(api_client, {})
+    response = admin_client.post(
+        reverse("admin:main_posting_changelist"),
+        {
+            "action": "mark_closed",
+            "_selected_action": [12],
+            "confirmation": "1",
+        },
+    )
+    assert response.status_code == 302
+    records, _ = read_changes(api_client, {"since": cursor})
+    changed = {(r["model"], r["pk"]) for r in records}
+    # The posting, and its company through recount()
+    assert changed == {("posting", 12), ("company", 1)}
+    posting = next(r for r in records if r["model"] == "posting")
+    assert posting["data"]["closed"] is not None
+
+
+def test_changes_since_timestamp(api_client: APIClient) -> None:
+    records, _ = read_changes(api_client, {"since": "2024-01-03T00:00:00Z"})
+    assert records
+    assert all(r["modified"] >= "2024-01-03T00:00:00Z" for r in records)
+    assert ("posting", 10) not in [(r["model"], r["pk"]) for r in records]
+
+
+def test_changes_lag(api_client: APIClient) -> None:
+    _, cursor = read_changes(api_client, {})
+    Posting.objects.get(pk=12).save()
+    assert read_changes(api_client, {"since": cursor})[0] == []
+
+
+@pytest.mark.parametrize("since", ["nope", "2024-13-01", "W10="])
+def test_changes_invalid_since(api_client: APIClient, since: str) -> None:
+    response = api_client.get(reverse("api-changes"), {"since": since})
+    assert response.status_code == 400
+
+
+def test_changes_not_shared(no_lag: None) -> None:
+    api_client = APIClient()
+    api_client.force_authenticate(User.objects.get(username="vader"))
+    _, cursor = read_changes(api_client, {})
+    Application.objects.get(user__username="luke", posting=13).delete()
+    records, _ = read_changes(api_client, {"since": cursor})
+    assert not [r for r in records if r["model"] == "application"]
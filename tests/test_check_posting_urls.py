@@ -0,0 +1,257 @@
+import time
+from collections.abc import Iterator
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from jobdb.main.checker import (
+    CheckResult,
+    HostPolicy,
+    HostScheduler,
+    PostingChecker,
+    ResponseCache,
+    host_policy,
+)
+from jobdb.main.models import Company, Posting, PostingCheck
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    throttled: set[str] = set()
+    requested: list[str] = []
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self.requested.append(self.path)
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+        elif (
+            self.path.startswith("/throttled")
+            and self.path not in self.throttled
+        ):
+            self.throttled.add(self.path)
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+        elif self.path.endswith("/closed") or "/closed/" in self.path:
+            self.send_response(302)
+            self.send_header("Location", "/jobs")
+        else:
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server() -> Iterator[str]:
+    StubHandler.requested.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    thread.join()
+
+
+@pytest.fixture
+def stub_postings(stub_server: str) -> list[Posting]:
+    Posting.objects.update(closed="2024-01-01T00:00:00Z")
+    company = Company.objects.get(name="Initech")
+    return [
+        Posting.objects.create(
+            company=company,
+            url=f"{stub_server}/{state}/{i}",
+            title=f"Role {i}",
+            in_wa=True,
+            location="Seattle, WA",
+        )
+        for i, state in enumerate(["open", "closed"] * 5)
+    ]
+
+
+def test_check_posting_urls(stub_postings: list[Posting]) -> None:
+    call_command("check_posting_urls", "--host-rate", "0", "--batch-size", "2")
+    closed = Posting.objects.filter(pk__in=[p.pk for p in stub_postings])
+    assert sorted(
+        closed.exclude(closed=None).values_list("title", flat=True)
+    ) == ["Role 1", "Role 3", "Role 5", "Role 7", "Role 9"]
+    assert Company.objects.get(name="Initech").open_posting_count == 5
+    checks = PostingCheck.objects.filter(posting__in=stub_postings)
+    assert sorted(checks.values_list("last_status", flat=True)) == (
+        [200] * 5 + [302] * 5
+    )
+
+
+def test_check_posting_urls_stale_after(
+    stub_postings: list[Posting],
+) -> None:
+    open_postings = stub_postings[::2]
+    PostingCheck.objects.bulk_create(
+        [
+            PostingCheck(
+                posting=posting,
+                last_checked=timezone.now() - timedelta(hours=hours),
+                last_status=200,
+                consecutive_failures=1,
+            )
+            for posting, hours in zip(open_postings, [1, 1, 1, 48, 48])
+        ]
+    )
+    call_command(
+        "check_posting_urls", "--host-rate", "0", "--stale-after", "24"
+    )
+    assert sorted(StubHandler.requested) == sorted(
+        f"/{p.url.split('/', 3)[3]}"
+        for p in stub_postings[1::2] + open_postings[3:]
+    )
+    checks = PostingCheck.objects.filter(posting__in=open_postings)
+    assert list(
+        checks.order_by("posting").values_list(
+            "consecutive_failures", flat=True
+        )
+    ) == [1, 1, 1, 0, 0]
+
+
+def test_check_posting_urls_retries_throttled(
+    stub_server: str, stub_postings: list[Posting]
+) -> None:
+    posting = Posting.objects.create(
+        company=stub_postings[0].company,
+        url=f"{stub_server}/throttled/closed",
+        title="Throttled",
+        in_wa=False,
+        location="Remote",
+    )
+    call_command("check_posting_urls", "--host-rate", "0")
+    posting.refresh_from_db()
+    assert posting.closed is not None
+    assert "/throttled/closed" in StubHandler.throttled
+
+
+def test_host_policy() -> None:
+    assert host_policy("www.linkedin.com").skip
+    assert host_policy("linkedin.com").skip
+    assert not host_policy("notlinkedin.com").skip
+    assert host_policy("boards.greenhouse.io").max_in_flight == 1
+    policies = {"": HostPolicy(rate=5.0)}
+    assert host_policy("example.com", policies).rate == 5.0
+
+
+def test_host_scheduler_interleaves_hosts() -> None:
+    postings = [
+        Posting(url=url)
+        for url in [
+            "https://a.example/1",
+            "https://a.example/2",
+            "https://a.example/3",
+            "https://b.example/1",
+            "https://b.example/2",
+            "https://www.linkedin.com/jobs/1",
+        ]
+    ]
+    scheduler = HostScheduler({"": HostPolicy(rate=0, max_in_flight=10)})
+    assert [scheduler.add(p) for p in postings] == [True] * 6
+    scheduler = HostScheduler(rate=0)
+    assert [scheduler.add(p) for p in postings] == [True] * 5 + [False]
+    order = []
+    while item := scheduler.next(0):
+        order.append(item[0].url)
+        scheduler.finished(item[0], None)
+    assert order == [
+        "https://a.example/1",
+        "https://b.example/1",
+        "https://a.example/2",
+        "https://b.example/2",
+        "https://a.example/3",
+    ]
+
+
+def test_host_scheduler_backoff() -> None:
+    scheduler = HostScheduler(rate=0)
+    first, second = (
+        Posting(url="https://a.example/1"),
+        Posting(url="https://a.example/2"),
+    )
+    scheduler.add(first)
+    scheduler.add(second)
+    item = scheduler.next(0)
+    assert item is not None
+    scheduler.finished(item[0], 60)
+    assert scheduler.next(time.monotonic()) is None
+    assert scheduler.wait_time(time.monotonic()) > 50
+
+
+def test_check_posting_urls_cache(
+    tmp_path: Path, stub_postings: list[Posting]
+) -> None:
+    cache_file = tmp_path / "cache.json"
+    args = ["--host-rate", "0", "--cache-file", str(cache_file)]
+    call_command("check_posting_urls", *args)
+    assert len(StubHandler.requested) == 10
+    cache = ResponseCache(cache_file)
+    assert {
+        url: (entry.status, entry.etag) for url, entry in cache.entries.items()
+    } == {
+        p.url: (302, None) if "closed" in p.url else (200, '"v1"')
+        for p in stub_postings
+    }
+
+    Posting.objects.filter(pk__in=[p.pk for p in stub_postings]).update(
+        closed=None
+    )
+    StubHandler.requested.clear()
+    call_command("check_posting_urls", *args)
+    assert StubHandler.requested == []
+    assert (
+        Posting.objects.filter(pk__in=[p.pk for p in stub_postings])
+        .exclude(closed=None)
+        .count()
+        == 5
+    )
+
+    Posting.objects.filter(pk__in=[p.pk for p in stub_postings]).update(
+        closed=None
+    )
+    call_command("check_posting_urls", *args, "--cache-ttl", "0")
+    assert len(StubHandler.requested) == 10
+    revalidated = ResponseCache(cache_file).entries
+    assert all(
+        revalidated[p.url].checked > cache.entries[p.url].checked
+        for p in stub_postings
+    )
+    assert (
+        Posting.objects.filter(pk__in=[p.pk for p in stub_postings])
+        .exclude(closed=None)
+        .count()
+        == 5
+    )
+
+
+def test_checker_waits_for_busy_slots(
+    stub_server: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+    wait_time = HostScheduler.wait_time
+
+    def counting_wait_time(self: HostScheduler, now: float) -> float:
+        calls.append(now)
+        return wait_time(self, now)
+
+    monkeypatch.setattr(HostScheduler, "wait_time", counting_wait_time)
+    checker = PostingChecker(
+        concurrency=1, host_rate=0, policies={"": HostPolicy(rate=0)}
+    )
+
+    def slow_check(posting: Posting) -> CheckResult:
+        time.sleep(0.05)
+        return CheckResult(posting)
+
+    monkeypatch.setattr(checker, "check_posting", slow_check)
+    postings = [Posting(url=f"{stub_server}/open/{i}") for i in range(20)]
+    assert len(list(checker.check(postings))) == 20
+    assert len(calls) <= 20
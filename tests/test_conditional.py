@@ -0,0 +1,119 @@
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from jobdb.main.models import Application, Company, Posting, User
+
+
+def test_api_not_modified(api_client: APIClient) -> None:
+    response = api_client.get(reverse("posting-list"))
+    etag, last_modified = response["ETag"], response["Last-Modified"]
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(
+            reverse("posting-list"), HTTP_IF_NONE_MATCH=etag
+        )
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    # Only the API key lookup
+    assert len(queries) == 1
+    response = api_client.get(
+        reverse("posting-list"),
+        HTTP_IF_MODIFIED_SINCE=last_modified,
+    )
+    assert response.status_code == 304
+    response = api_client.get(
+        reverse("posting-list"), {"limit": 2}, HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+def test_api_modified_by_write(api_client: APIClient) -> None:
+    response = api_client.get(reverse("posting-list"))
+    etag, last_modified = response["ETag"], response["Last-Modified"]
+    company = Company.objects.get(name="Initrode")
+    company.notes = "Changed"
+    company.save()
+    response = api_client.get(
+        reverse("posting-list"),
+        HTTP_IF_NONE_MATCH=etag,
+        HTTP_IF_MODIFIED_SINCE=last_modified,
+    )
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert response["Last-Modified"] != last_modified
+
+
+def test_api_queue_per_user() -> None:
+    user = User.objects.get(username="vader")
+    api_client = APIClient()
+    api_client.force_authenticate(user)
+    response = api_client.get(reverse("posting-queue-list"))
+    etag = response["ETag"]
+    assert "Last-Modified" not in response
+    Application.objects.create(user=user, posting=Posting.objects.get(pk=13))
+    response = api_client.get(
+        reverse("posting-queue-list"), HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == 200
+    api_client.force_authenticate(User.objects.get(username="solo"))
+    response = api_client.get(
+        reverse("posting-queue-list"), HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == 200
+
+
+def test_application_modified() -> None:
+    application = Application.objects.get(pk=1)
+    before = application.modified
+    application.notes = "Changed"
+    application.save()
+    assert application.modified > before
+
+
+def test_htmx_table_not_modified(client: Client) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    response = client.get(reverse("application_htmx"), HTTP_HX_REQUEST="true")
+    etag = response["ETag"]
+    assert "Last-Modified" in response
+    response = client.get(
+        reverse("application_htmx"),
+        HTTP_HX_REQUEST="true",
+        HTTP_IF_NONE_MATCH=etag,
+    )
+    assert response.status_code == 304
+    response = client.get(reverse("application_htmx"), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert "ETag" not in response
+
+
+def test_api_modified_by_delete(api_client: APIClient) -> None:
+    response = api_client.get(reverse("application-list"))
+    last_modified = response["Last-Modified"]
+    Application.objects.get(user__username="luke", posting=13).delete()
+    response = api_client.get(
+        reverse("application-list"), HTTP_IF_MODIFIED_SINCE=last_modified
+    )
+    assert response.status_code == 200
+    assert response["Last-Modified"] != last_modified
+
+
+def test_api_companies_etag_only(api_client: APIClient) -> None:
+    response = api_client.get(reverse("company-list"))
+    etag = response["ETag"]
+    assert "Last-Modified" not in response
+    Posting.objects.create(
+        company=Company.objects.get(name="Initech"),
+        url="https://initech.example.com/jobs/99",
+        title="Tester",
+        in_wa=False,
+        location="Remote",
+    )
+    response = api_client.get(
+        reverse("company-list"),
+        HTTP_IF_NONE_MATCH=etag,
+        HTTP_IF_MODIFIED_SINCE="Thu, 01 Jan 2099 00:00:00 GMT",
+    )
+    assert response.status_code == 200
@@ -0,0 +1,52 @@
+from django.core.management import call_command
+
+from jobdb.main.models import (
+    Company,
+    Posting,
+    PostingURL,
+    QueueEntry,
+    User,
+)
+from jobdb.main.synthetic import Generator, Scale
+from jobdb.main.utils import normalize_posting_url
+
+
+def test_generate_data() -> None:
+    call_command(
+        "generate_data",
+        "--companies",
+        "20",
+        "--postings",
+        "300",
+        "--users",
+        "3",
+        "--applications",
+        "60",
+        "--batch-size",
+        "50",
+    )
+    companies = Company.objects.filter(name__startswith="Synthetic ")
+    assert companies.count() == 20
+    assert sum(c.posting_count for c in companies) == 300
+    postings = Posting.objects.filter(company__in=companies)
+    assert postings.count() == 300
+    assert all(normalize_posting_url(p.url) == p.url for p in postings)
+    assert PostingURL.objects.filter(posting__in=postings).count() == sum(
+        len(p.all_urls) for p in postings
+    )
+    assert postings.exclude(job_board_urls=None).exists()
+    users = User.objects.filter(username__startswith="synthetic")
+    assert users.count() == 3
+    assert QueueEntry.objects.filter(user__in=users).exists()
+
+
+def test_generator_deterministic() -> None:
+    def _postings(seed: int) -> list[tuple[str, str, bool]]:
+        generator = Generator(Scale(), seed=seed)
+        return [
+            (p.url, p.title, p.in_wa)
+            for p in (generator.make_posting(n, 1) for n in range(50))
+        ]
+
+    assert _postings(1) == _postings(1)
+    assert _postings(1) != _postings(2)
@@ -0,0 +1,56 @@
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from django.test.client import Client
+from django.urls import reverse
+
+from jobdb.main.models import User
+from jobdb.utils.instrumentation import fingerprint, route_stats
+
+
+@pytest.fixture(autouse=True)
+def clear_route_stats() -> Iterator[None]:
+    route_stats.clear()
+    yield
+    route_stats.clear()
+
+
+def test_fingerprint() -> None:
+    assert fingerprint(
+        'SELECT * FROM "t" WHERE "id" IN (%s, %s, %s) AND "name" = %s'
+    ) == fingerprint(
+        'SELECT * FROM "t" WHERE "id" IN (%s, %s) AND "name" = %s'
+    )
+    assert fingerprint("SELECT 'a', 12 FROM t1") == "SELECT ?, ? FROM t1"
+
+
+def test_instrumentation_disabled(client: Client, settings: Any) -> None:
+    settings.INSTRUMENTATION_SAMPLE_RATE = 0
+    client.force_login(User.objects.get(username="luke"))
+    response = client.get(reverse("index"))
+    assert "Server-Timing" not in response
+    assert route_stats.summary() == []
+
+
+def test_instrumentation(
+    client: Client, admin_client: Client, settings: Any
+) -> None:
+    settings.INSTRUMENTATION_SAMPLE_RATE = 1
+    client.force_login(User.objects.get(username="luke"))
+    for _ in range(3):
+        response = client.get(reverse("posting_htmx"))
+    assert response["Server-Timing"].startswith("db;dur=")
+    assert "queries" in response["Server-Timing"]
+    summary = {row["route"]: row for row in route_stats.summary()}
+    assert summary["posting_htmx"]["count"] == 3
+    assert summary["posting_htmx"]["max_queries"] > 0
+    assert sum(summary["posting_htmx"]["histogram"]) == 3
+
+    response = admin_client.get(reverse("admin:instrumentation"))
+    assert response.status_code == 200
+    assert b"posting_htmx" in response.content
+    admin_client.post(reverse("admin:instrumentation"))
+    assert "posting_htmx" not in {
+        row["route"] for row in route_stats.summary()
+    }
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+from django.test.client import Client
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from jobdb.main import notifications
+from jobdb.main.models import Application, Company, Posting, User
+from jobdb.utils.broker import LocalBroker, get_broker
+
+
+def channel(username: str) -> str:
+    return notifications.user_channel(User.objects.get(username=username).pk)
+
+
+def test_broker_listen() -> None:
+    broker = LocalBroker()
+    broker.publish("a", "queue", {"n": 1})
+    assert broker.listen(["a"], None, 0) == ([], 1)
+    broker.publish("b", "queue", {"n": 2})
+    broker.publish("a", "queue", {"n": 3})
+    events, last_id = broker.listen(["a"], 1, 0)
+    assert [e.data for e in events] == [{"n": 3}]
+    assert last_id == 3
+    # Ids from before a restart start from now
+    assert broker.listen(["a"], 10, 0) == ([], 3)
+
+
+def test_broker_wakes_listeners() -> None:
+    broker = LocalBroker()
+    timer = threading.Timer(0.05, broker.publish, ["a", "queue", {}])
+    timer.start()
+    events, _ = broker.listen(["a"], 0, 5)
+    assert len(events) == 1
+    timer = threading.Timer(0.05, broker.publish, ["a", "queue", {}])
+    timer.start()
+    events, _ = asyncio.run(broker.alisten(["a"], 1, 5))
+    assert len(events) == 1
+    assert not broker.waiters
+
+
+def received(username: str, after: int) -> list[Any]:
+    events, _ = get_broker().read([channel(username)], after)
+    return [(e.name, e.data["reason"]) for e in events]
+
+
+def test_queue_change_notifies(
+    django_capture_on_commit_callbacks: Any,
+) -> None:
+    after = get_broker().read([], 0)[1]
+    with django_capture_on_commit_callbacks(execute=True):
+        Application.objects.create(
+            user=User.objects.get(username="vader"),
+            posting=Posting.objects.get(pk=13),
+        )
+    assert received("vader", after) == [("queue", "Application")]
+    assert received("luke", after) == []
+    after = get_broker().read([], 0)[1]
+    with django_capture_on_commit_callbacks(execute=True):
+        company = Company.objects.get(name="Initech")
+        company.filed = timezone.now()
+        company.save()
+    assert received("vader", after) == [("queue", "Company")]
+    assert received("solo", after) == [("queue", "Company")]
+
+
+def test_api_long_poll(api_client: APIClient) -> None:
+    after = get_broker().read([], 0)[1]
+    get_broker().publish(channel("luke"), "queue", {"reason": "Posting"})
+    get_broker().publish(channel("solo"), "queue", {"reason": "Posting"})
+    response = api_client.get(
+        reverse("api-notifications"), {"after": after, "timeout": 0}
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "events": [
+            {"id": after + 1, "name": "queue", "data": {"reason": "Posting"}}
+        ],
+        "last_id": after + 2,
+    }
+
+
+async def read_stream(response: Any) -> str:
+    return b"".join(
+        [chunk async for chunk in response.streaming_content]
+    ).decode()
+
+
+@pytest.fixture
+def live_updates(settings: Any) -> None:
+    settings.LIVE_UPDATES = True
+
+
+def test_event_stream(
+    client: Client, monkeypatch: pytest.MonkeyPatch, live_updates: None
+) -> None:
+    monkeypatch.setattr(notifications, "STREAM_DURATION", 0.1)
+    monkeypatch.setattr(notifications, "STREAM_KEEPALIVE", 0.05)
+    assert client.get(reverse("notifications")).status_code == 401
+    client.force_login(User.objects.get(username="luke"))
+    after = get_broker().read([], 0)[1]
+    get_broker().publish(channel("luke"), "queue", {"reason": "Posting"})
+    response = client.get(
+        reverse("notifications"), HTTP_LAST_EVENT_ID=str(after)
+    )
+    assert response["Content-Type"] == "text/event-stream"
+    content = asyncio.run(read_stream(response))
+    assert (
+        f'id: {after + 1}\nevent: queue\ndata: {{"reason": "Posting"}}\n\n'
+        in content
+    )
+    assert ": keepalive" in content
+
+
+def test_queue_page_listens(client: Client, live_updates: None) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    response = client.get(reverse("queue_htmx"))
+    assert reverse("notifications").encode() in response.content
+    response = client.get(reverse("posting_htmx"))
+    assert reverse("notifications").encode() not in response.content
+
+
+def test_live_updates_off(client: Client) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    assert client.get(reverse("notifications")).status_code == 404
+    response = client.get(reverse("queue_htmx"))
+    assert reverse("notifications").encode() not in response.content
@@ -1,8 +1,26 @@
+from typing import Any
+
 import pytest
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test.client import Client
+from django.urls import reverse
+from django.utils import timezone
 
-from jobdb.main.models import User
+from jobdb.main.bulk import upsert_postings
+from jobdb.main.models import (
+    Application,
+    Company,
+    LeaderboardEntry,
+    LeaderboardEntryQuerySet,
+    Posting,
+    Priority,
+    QueueEntry,
+    User,
+)
 from jobdb.main.query import (
     company_posting_queue_set,
+    dashboard_stats,
     posting_queue_companies_count,
     posting_queue_set,
     user_companies_leaderboard,
@@ -86,3 +104,297 @@ def test_user_companies_leaderboard() -> None:
         {"user__first_name": "Han", "user__username": "solo", "count": 1},
         {"user__first_name": "Darth", "user__username": "vader", "count": 1},
     ]
+
+
+def leaderboard_counts() -> dict[str, int]:
+    return {
+        row["user__username"]: row["count"]
+        for row in user_companies_leaderboard()
+    }
+
+
+def test_leaderboard_application_changes() -> None:
+    user = User.objects.get(username="solo")
+    application = Application.objects.create(
+        user=user, posting=Posting.objects.get(pk=20)
+    )
+    assert leaderboard_counts() == {"luke": 2, "solo": 2, "vader": 1}
+    application.delete()
+    Application.objects.filter(user__username="vader").delete()
+    assert leaderboard_counts() == {"luke": 2, "solo": 1}
+
+
+def test_leaderboard_posting_changes() -> None:
+    posting = Posting.objects.get(pk=20)
+    posting.company = Company.objects.get(name="Initech")
+    posting.save()
+    assert leaderboard_counts() == {"luke": 1, "solo": 1, "vader": 1}
+
+
+def test_leaderboard_skips_posting_edits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+    monkeypatch.setattr(
+        LeaderboardEntryQuerySet,
+        "refresh",
+        lambda self, **kwargs: calls.append(kwargs),
+    )
+    posting = Posting.objects.get(pk=20)
+    posting.title = "Changed"
+    posting.save()
+    assert calls == []
+    posting.company = Company.objects.get(name="Initech")
+    posting.save()
+    assert calls == [{"companies": {1, 2}, "users": None}]
+    calls.clear()
+    upsert_postings([{"url": posting.url, "company": "Initrode"}])
+    assert calls == [{"companies": {1, 2}, "users": None}]
+
+
+def test_leaderboard_rebuild() -> None:
+    LeaderboardEntry.objects.all().delete()
+    call_command("rebuild_leaderboard")
+    assert leaderboard_counts() == {"luke": 2, "solo": 1, "vader": 1}
+
+
+@pytest.mark.parametrize(
+    ["url", "expected_pk"],
+    [
+        ("https://careers.example.com/jobs/1", 10),
+        ("https://linkedin.example.com/jobs/2", 11),
+        ("https://linkedin.example.com/jobs/3", 20),
+        ("https://linkedin.example.com/jobs/", None),
+        ("https://careers.example.com/jobs/5", None),
+    ],
+)
+def test_posting_by_url(url: str, expected_pk: int | None) -> None:
+    posting = Posting.objects.by_url(url).first()  # type: ignore
+    assert (posting.pk if posting else None) == expected_pk
+
+
+def test_posting_urls_sync() -> None:
+    posting = Posting.objects.get(pk=12)
+    posting.job_board_urls = ["https://jobs.example.com/3"]
+    posting.save()
+    by_url = Posting.objects.by_url  # type: ignore
+    assert by_url("https://jobs.example.com/3").get() == posting
+    posting.job_board_urls = None
+    posting.save()
+    assert not by_url("https://jobs.example.com/3").exists()
+    assert list(posting.urls.values_list("url", flat=True)) == [posting.url]
+
+
+def test_posting_duplicate_url() -> None:
+    posting = Posting.objects.get(pk=12)
+    posting.job_board_urls = ["https://linkedin.example.com/jobs/1"]
+    with pytest.raises(ValidationError):
+        posting.save()
+
+
+def test_posting_by_urls(django_assert_num_queries: Any) -> None:
+    urls = [
+        "https://careers.example.com/jobs/1",
+        "https://linkedin.example.com/jobs/1",
+        "https://linkedin.example.com/jobs/3",
+        "https://careers.example.com/jobs/5",
+    ]
+    with django_assert_num_queries(1):
+        matches = Posting.objects.by_urls(urls)  # type: ignore
+    assert {url: posting.pk for url, posting in matches.items()} == {
+        "https://careers.example.com/jobs/1": 10,
+        "https://linkedin.example.com/jobs/1": 10,
+        "https://linkedin.example.com/jobs/3": 20,
+    }
+
+
+def queue_titles(user: User) -> list[str]:
+    return list(
+        company_posting_queue_set(user).values_list("title", flat=True)
+    )
+
+
+def test_posting_queue_application_changes() -> None:
+    user = User.objects.get(username="vader")
+    application = Application.objects.create(
+        user=user, posting=Posting.objects.get(pk=13)
+    )
+    assert queue_titles(user) == ["Executive Michael Bolton"]
+    assert posting_queue_set(user).count() == 3
+    application.delete()
+    assert queue_titles(user) == [
+        "General Major Webelos",
+        "Executive Michael Bolton",
+    ]
+
+
+def test_posting_queue_posting_changes() -> None:
+    user = User.objects.get(username="vader")
+    posting = Posting.objects.get(pk=20)
+    posting.closed = timezone.now()
+    posting.save()
+    assert queue_titles(user) == ["General Major Webelos"]
+    Posting.objects.create(
+        company=posting.company,
+        url="https://careers.initrode.example.com/jobs/2",
+        title="Tech Support",
+        in_wa=False,
+        location="Remote",
+    )
+    assert queue_titles(user) == ["General Major Webelos", "Tech Support"]
+
+
+def test_posting_queue_company_changes() -> None:
+    user = User.objects.get(username="vader")
+    company = Company.objects.get(name="Initrode")
+    company.priority = Priority.HIGH
+    company.save()
+    assert queue_titles(user) == [
+        "Executive Michael Bolton",
+        "General Major Webelos",
+    ]
+    company.filed = timezone.now()
+    company.save()
+    assert queue_titles(user) == ["General Major Webelos"]
+
+
+def test_posting_queue_new_user() -> None:
+    user = User.objects.create(username="leia")
+    assert queue_titles(user) == [
+        "Señor Digital Sensei",
+        "General Major Webelos",
+        "Executive Michael Bolton",
+    ]
+    assert posting_queue_set(user).count() == 5
+
+
+def test_posting_queue_rebuild() -> None:
+    user = User.objects.get(username="vader")
+    QueueEntry.objects.all().delete()
+    call_command("rebuild_queue")
+    assert queue_titles(user) == [
+        "General Major Webelos",
+        "Executive Michael Bolton",
+    ]
+
+
+@pytest.mark.parametrize(
+    ["username", "expected_stats"],
+    [
+        (
+            "luke",
+            {
+                "company_posting_queue_count": 0,
+                "posting_queue_companies_count": 0,
+                "posting_queue_count": 0,
+                "your_apps_count": 5,
+                "unreported_apps_count": 1,
+                "your_apps_company_count": 2,
+            },
+        ),
+        (
+            "vader",
+            {
+                "company_posting_queue_count": 2,
+                "posting_queue_companies_count": 2,
+                "posting_queue_count": 4,
+                "your_apps_count": 1,
+                "unreported_apps_count": 1,
+                "your_apps_company_count": 1,
+            },
+        ),
+    ],
+)
+def test_dashboard_stats(
+    username: str,
+    expected_stats: dict[str, int],
+    django_assert_num_queries: Any,
+) -> None:
+    user = User.objects.get(username=username)
+    with django_assert_num_queries(2):
+        stats = dashboard_stats(user)
+    assert stats == expected_stats | {
+        "posting_count": 5,
+        "open_posting_count": 5,
+        "companies_with_postings_count": 2,
+    }
+
+
+def company_counts(name: str) -> dict[str, int]:
+    return Company.objects.values(*Company.COUNTER_FIELDS).get(name=name)
+
+
+def test_company_counters() -> None:
+    assert company_counts("Initech") == {
+        "posting_count": 4,
+        "open_posting_count": 4,
+        "apps_count": 7,
+        "reported_apps_count": 4,
+        "available_count": 11,
+        "wa_open_posting_count": 3,
+        "wa_apps_count": 5,
+        "wa_available_count": 8,
+    }
+    posting = Posting.objects.get(pk=13)
+    posting.closed = timezone.now()
+    posting.save()
+    Application.objects.filter(pk=7).delete()
+    assert company_counts("Initech") == {
+        "posting_count": 4,
+        "open_posting_count": 3,
+        "apps_count": 6,
+        "reported_apps_count": 3,
+        "available_count": 9,
+        "wa_open_posting_count": 2,
+        "wa_apps_count": 4,
+        "wa_available_count": 6,
+    }
+
+
+def test_closed_posting_moved_recounts_old_company() -> None:
+    posting = Posting.objects.get(pk=13)
+    posting.closed = timezone.now()
+    posting.save()
+    posting.company = Company.objects.get(name="Initrode")
+    posting.save()
+    assert company_counts("Initech")["posting_count"] == 3
+    assert company_counts("Initrode")["posting_count"] == 2
+
+
+def test_admin_mark_reported_recounts(admin_client: Client) -> None:
+    assert company_counts("Initech")["reported_apps_count"] == 4
+    response = admin_client.post(
+        reverse("admin:main_application_changelist"),
+        {
+            "action": "mark_reported",
+            "_selected_action": list(
+                Application.objects.filter(
+                    posting__company__name="Initech"
+                ).values_list("pk", flat=True)
+            ),
+            "confirmation": "1",
+        },
+    )
+    assert response.status_code == 302
+    assert company_counts("Initech")["reported_apps_count"] == 7
+
+
+def test_company_save_keeps_counters() -> None:
+    company = Company.objects.get(name="Initrode")
+    Posting.objects.create(
+        company=company,
+        url="https://careers.initrode.example.com/jobs/2",
+        title="Tech Support",
+        in_wa=False,
+        location="Remote",
+    )
+    company.notes = "Updated"
+    company.save()
+    assert company_counts("Initrode")["posting_count"] == 2
+
+
+def test_recount() -> None:
+    Company.objects.update(posting_count=0, available_count=0)
+    call_command("recount")
+    assert company_counts("Initrode")["posting_count"] == 1
+    assert company_counts("Initrode")["available_count"] == 2
@@ -0,0 +1,179 @@
+from importlib import import_module
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.db.models import Q
+from django.test.client import Client
+from django.urls import reverse
+
+from jobdb.main.fuzzy import (
+    TrigramIndex,
+    company_names,
+    match_companies,
+    match_titles,
+)
+from jobdb.main.models import Application, Company, Posting, User
+from jobdb.main.search import search
+
+SEARCH_FIELDS: dict[Any, list[str]] = {
+    Company: ["name", "url", "notes"],
+    Posting: ["company__name", "title", "url", "notes"],
+    Application: [
+        "posting__company__name",
+        "posting__title",
+        "posting__url",
+        "notes",
+    ],
+}
+
+
+def create_company(name: str) -> Company:
+    company: Company = Company.objects.create(
+        name=name,
+        hq="Remote",
+        url=f"https://{name.lower()}.example.com",
+        careers_url=f"https://{name.lower()}.example.com/careers",
+        employees_est="50",
+        employees_est_source="Test",
+        how_found="Test",
+    )
+    return company
+
+
+@pytest.mark.parametrize("model", [Company, Posting, Application])
+@pytest.mark.parametrize(
+    "value",
+    [
+        "init",
+        "INITRODE",
+        "example.com",
+        "jobs/2",
+        "te",
+        "11",
+        "monkey",
+        "nope",
+    ],
+)
+def test_search_matches_icontains(model: Any, value: str) -> None:
+    fields = SEARCH_FIELDS[model]
+    expected = model.objects.filter(
+        Q(*[Q(**{f"{f}__icontains": value}) for f in fields], _connector="OR")
+        | (Q(pk=int(value)) if value.isdigit() else Q(pk__in=[]))
+    )
+    results = search(model.objects.all(), value, fields)
+    assert sorted(results.values_list("pk", flat=True)) == sorted(
+        expected.values_list("pk", flat=True)
+    )
+
+
+def test_search_index_synced_on_write() -> None:
+    company = create_company("Penetrode")
+    assert list(search(Company.objects.all(), "netrode", ["name"])) == [
+        company
+    ]
+    company.name = "Vandelay Industries"
+    company.save()
+    assert not search(Company.objects.all(), "netrode", ["name"]).exists()
+    Company.objects.filter(pk=company.pk).update(notes="importer exporter")
+    assert search(Company.objects.all(), "exporter", ["notes"]).exists()
+    company.delete()
+    assert not search(Company.objects.all(), "exporter", ["notes"]).exists()
+
+
+def test_search_ranked() -> None:
+    Company.objects.filter(name="Initech").update(notes="Initrode partner")
+    results = search(
+        Company.objects.order_by("pk"), "initrode", ["name", "notes"]
+    )
+    assert [c.name for c in results] == ["Initrode", "Initech"]
+    assert results[0].search_rank > results[1].search_rank
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite only")
+def test_search_index_migration() -> None:
+    migration = import_module("jobdb.main.migrations.0015_search_indexes")
+    operation = migration.sqlite_search_index(
+        "Company", migration.SEARCH_COLUMNS["Company"]
+    )
+    with connection.cursor() as cursor:
+        for statement in operation.reverse_sql:
+            cursor.execute(statement)
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name LIKE %s",
+            ["main_company_search%"],
+        )
+        assert cursor.fetchall() == []
+        create_company("Penetrode")
+        for statement in operation.sql:
+            cursor.execute(statement)
+    assert search(Company.objects.all(), "netrode", ["name"]).exists()
+    create_company("Netrodyne")
+    assert search(Company.objects.all(), "netrod", ["name"]).count() == 2
+
+
+def test_table_view_search(client: Client) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    response = client.get(reverse("posting_htmx"), {"query": "initrode"})
+    assert response.status_code == 200
+    assert [
+        row.record.company.name for row in response.context["table"].rows
+    ] == ["Initrode"]
+
+
+def test_table_view_company_typo(client: Client) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    for value in ["Initech", "initech", "Initeck"]:
+        response = client.get(reverse("posting_htmx"), {"company": value})
+        assert {
+            row.record.company.name for row in response.context["table"].rows
+        } == {"Initech"}
+
+
+def test_trigram_index_search() -> None:
+    index = TrigramIndex(
+        [(1, "Initech"), (2, "Initrode"), (3, "Initech Consulting")]
+    )
+    assert [m.key for m in index.search("initeck")] == [1, 3]
+    assert index.search("initrod")[0].key == 2
+    assert index.search("initech")[0].score == 1.0
+    assert index.search("vandelay") == []
+    assert len(index.search("init", limit=1)) == 1
+    assert index.get("INITECH") == 1
+
+
+def test_trigram_index_budget() -> None:
+    index = TrigramIndex((i, f"Software Engineer {i}") for i in range(1000))
+    partial = index.search("software engineer", budget=0)
+    complete = index.search("software engineer", budget=1)
+    assert len(partial) == len(complete) == 10
+    assert partial[0].score < complete[0].score == 1.0
+
+
+def test_fuzzy_index_invalidated() -> None:
+    assert match_companies("penetrod") == []
+    company = create_company("Penetrode")
+    index = company_names.get()
+    assert [m.key for m in match_companies("penetrod")] == [company.pk]
+    company.name = "Initrode Penetrode"
+    company.save()
+    assert match_companies("initrode penetrode")[0].key == company.pk
+    company.delete()
+    assert match_companies("penetrod") == []
+    # Changes are applied to the index in place
+    assert company_names.get() is index
+
+
+def test_fuzzy_titles_shared() -> None:
+    first, second = Posting.objects.filter(pk__in=[10, 11]).order_by("pk")
+    title = first.title
+    second.title = title
+    second.save()
+    assert [m.key for m in match_titles(title)] == [title]
+    # The title stays while another posting has it
+    first.title = "Chief Penetrode Officer"
+    first.save()
+    assert [m.key for m in match_titles(title)] == [title]
+    second.title = "Chief Penetrode Officer"
+    second.save()
+    assert match_titles(title) == []
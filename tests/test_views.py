@@ -1,7 +1,16 @@
+import csv
+import io
+import json
+import re
+
+import pytest
+from django.db import connection
 from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from jobdb.main.models import User
+from jobdb.main.models import Company, Posting, PostingURL, User
+from jobdb.main.views import PostingHTMxTableView
 
 
 def test_index_view_unauthorized(client: Client) -> None:
@@ -16,3 +25,237 @@ def test_index_view(client: Client) -> None:
     client.force_login(User.objects.get(username="luke"))
     response = client.get(reverse("index"))
     assert response.status_code == 200
+    assert response.context["stats"]["your_apps_count"] == 5
+    assert b"Your applications: <b>5</b>" in response.content
+
+
+def test_add_postings_check_urls(client: Client) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    response = client.post(
+        reverse("add_postings"),
+        {
+            "tool": "urls_submitted",
+            "text": "\n".join(
+                [
+                    "https://linkedin.example.com/jobs/2",
+                    "careers.example.com/jobs/5",
+                    "https://careers.example.com/jobs/6",
+                ]
+            ),
+        },
+    )
+    assert response.status_code == 200
+    assert response.context["new_urls"] == {
+        "https://careers.example.com/jobs/5",
+        "https://careers.example.com/jobs/6",
+    }
+    assert {
+        url: posting.pk
+        for url, posting in response.context["posting_matches"].items()
+    } == {"https://linkedin.example.com/jobs/2": 11}
+
+
+def add_postings_data(urls: list[str]) -> dict[str, str]:
+    data = {
+        "company-company": str(Company.objects.get(name="Initrode").pk),
+        "posting_set-TOTAL_FORMS": str(len(urls)),
+        "posting_set-INITIAL_FORMS": "0",
+        "posting_set-MIN_NUM_FORMS": "1",
+        "posting_set-MAX_NUM_FORMS": "1000",
+    }
+    for i, url in enumerate(urls):
+        data |= {
+            f"posting_set-{i}-include": "on",
+            f"posting_set-{i}-url": url,
+            f"posting_set-{i}-title": f"Tech Support {i}",
+            f"posting_set-{i}-location": "Remote",
+        }
+    return data
+
+
+def test_add_postings_query_count(client: Client) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    query_counts = []
+    for batch, count in (("a", 1), ("b", 2), ("c", 8)):
+        urls = [
+            f"https://initrode.example.com/{batch}/{i}" for i in range(count)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(
+                reverse("add_postings"), add_postings_data(urls)
+            )
+        assert response.status_code == 200
+        assert len(response.context["new_saved_postings"]) == count
+        assert set(
+            PostingURL.objects.filter(url__in=urls).values_list(
+                "posting__title", flat=True
+            )
+        ) == {f"Tech Support {i}" for i in range(count)}
+        query_counts.append(len(queries))
+    # The first batch creates the queue entries the others update
+    assert query_counts[1] == query_counts[2]
+    assert Posting.objects.get(url=urls[0]).company.posting_count == 12
+
+
+@pytest.mark.parametrize(
+    ["route", "params", "expected_rows"],
+    [
+        ("company_htmx", {}, 2),
+        ("company_htmx", {"available": "true"}, 2),
+        ("posting_htmx", {}, 5),
+        ("application_htmx", {}, 5),
+        ("application_by_company_htmx", {}, 2),
+        ("queue_htmx", {}, 0),
+        ("full_queue_htmx", {}, 0),
+        ("queue_by_company_htmx", {}, 0),
+    ],
+)
+def test_table_views(
+    client: Client, route: str, params: dict[str, str], expected_rows: int
+) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    response = client.get(reverse(route), params)
+    assert response.status_code == 200
+    assert len(response.context["table"].rows) == expected_rows
+
+
+@pytest.mark.parametrize(
+    ["route", "username"],
+    [
+        ("company_htmx", "luke"),
+        ("posting_htmx", "luke"),
+        ("application_htmx", "luke"),
+        ("full_queue_htmx", "vader"),
+    ],
+)
+def test_table_view_query_count(
+    client: Client, route: str, username: str
+) -> None:
+    client.force_login(User.objects.get(username=username))
+    client.get(reverse(route))
+    query_counts = []
+    for per_page in (1, 5):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse(route), {"per_page": per_page})
+        assert response.status_code == 200
+        query_counts.append(len(queries))
+    assert query_counts[0] == query_counts[1]
+
+
+@pytest.mark.parametrize(
+    ["route", "username", "params"],
+    [
+        ("company_htmx", "luke", {"sort": "priority"}),
+        ("posting_htmx", "luke", {}),
+        ("posting_htmx", "luke", {"sort": "-reported"}),
+        ("application_htmx", "luke", {}),
+        ("full_queue_htmx", "vader", {}),
+    ],
+)
+def test_table_view_cursor_pagination(
+    client: Client, route: str, username: str, params: dict[str, str]
+) -> None:
+    client.force_login(User.objects.get(username=username))
+    response = client.get(reverse(route), params | {"per_page": 100})
+    expected = [row.record.pk for row in response.context["table"].rows]
+    pages = []
+    cursor = ""
+    page_number = 1
+    while True:
+        response = client.get(
+            reverse(route),
+            params | {"per_page": 2, "page": page_number, "cursor": cursor},
+        )
+        page = response.context["table"].page
+        pages.append([row.record.pk for row in page.object_list])
+        if not page.next_cursor:
+            break
+        cursor, page_number = page.next_cursor, page.next_page_number()
+    assert sum(pages, []) == expected
+    while page.previous_cursor:
+        response = client.get(
+            reverse(route),
+            params
+            | {
+                "per_page": 2,
+                "page": page.previous_page_number(),
+                "cursor": page.previous_cursor,
+            },
+        )
+        page = response.context["table"].page
+        pages.pop()
+        assert [row.record.pk for row in page.object_list] == pages[-1]
+    assert len(pages) == 1
+
+
+def test_table_view_links_only_cursors(client: Client) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    response = client.get(reverse("posting_htmx"), {"per_page": 2})
+    page = response.context["table"].page
+    response = client.get(
+        reverse("posting_htmx"),
+        {"per_page": 2, "page": 2, "cursor": page.next_cursor},
+    )
+    links = re.findall(
+        r'hx-get="([^"]*[?;]page=[^"]*)"', response.content.decode()
+    )
+    assert len(links) == 2
+    assert all("cursor=" in link for link in links)
+
+
+@pytest.mark.parametrize("count_mode", ["exact", "cached", "none"])
+def test_table_view_count_modes(
+    client: Client, monkeypatch: pytest.MonkeyPatch, count_mode: str
+) -> None:
+    monkeypatch.setattr(PostingHTMxTableView, "count_mode", count_mode)
+    client.force_login(User.objects.get(username="luke"))
+    pks = []
+    for page_number in (1, 2, 3):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(
+                reverse("posting_htmx"), {"per_page": 2, "page": page_number}
+            )
+        page = response.context["table"].page
+        pks += [row.record.pk for row in page.object_list]
+        counted = any("COUNT(" in q["sql"] for q in queries)
+        assert counted == (
+            count_mode == "exact"
+            or (count_mode == "cached" and page_number == 1)
+        )
+    assert page.has_previous() and not page.has_next()
+    assert len(set(pks)) == 5
+
+
+def test_table_view_csv_export(client: Client) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    response = client.get(reverse("company_htmx"), {"_export": "csv"})
+    assert response.status_code == 200
+    assert response["Content-Disposition"] == (
+        'attachment; filename="companies.csv"'
+    )
+    content = b"".join(response.streaming_content)  # type: ignore
+    rows = list(csv.reader(io.StringIO(content.decode())))
+    assert rows[0][:5] == [
+        "Company name",
+        "URL",
+        "Careers URLs",
+        "Headquarters",
+        "Postings",
+    ]
+    assert [row[0] for row in rows[1:]] == ["Initech", "Initrode"]
+    assert rows[1][13] == "Normal"
+
+
+def test_table_view_json_export(client: Client) -> None:
+    client.force_login(User.objects.get(username="luke"))
+    response = client.get(
+        reverse("posting_htmx"), {"_export": "json", "sort": "-title"}
+    )
+    assert response.status_code == 200
+    data = json.loads(b"".join(response.streaming_content))  # type: ignore
+    assert [row["title"] for row in data] == sorted(
+        (row["title"] for row in data), reverse=True
+    )
+    assert len(data) == 5
+    assert data[1]["job_board_urls"] == "https://linkedin.example.com/jobs/2"
+    assert data[1]["company__priority"] == "Normal"